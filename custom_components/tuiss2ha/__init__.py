@@ -7,7 +7,7 @@ import asyncio
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse, callback
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import (
@@ -16,9 +16,11 @@ from homeassistant.components.bluetooth import (
     async_register_callback,
 )
 from homeassistant.const import CONF_ADDRESS, Platform
-from homeassistant.helpers import config_validation as cv, device_registry as dr, entity_registry as er
+from homeassistant.helpers import config_validation as cv, device_registry as dr
 
 from .hub import Hub
+from .index import async_get_index, async_unload_index
+from .lib.tuiss.metrics import METRICS
 from .const import (
     DOMAIN,
     CONF_BLIND_HOST,
@@ -31,6 +33,10 @@ from .const import (
     DEFAULT_BLIND_SPEED,
     OPT_BATTERY_CHECK_DAYS,
     DEFAULT_BATTERY_CHECK_DAYS,
+    OPT_MOVE_TOLERANCE,
+    DEFAULT_MOVE_TOLERANCE,
+    OPT_CAPTURE_TRAFFIC,
+    DEFAULT_CAPTURE_TRAFFIC,
     DeviceNotFound,
     ConnectionTimeout,
     SPEED_CONTROL_SUPPORTED_MODELS,
@@ -45,6 +51,10 @@ SERVICE_SAVE_PRESET = "save_preset"
 SERVICE_SAVE_CURRENT_AS_PRESET = "save_current_position_as_preset"
 SERVICE_DELETE_PRESET = "delete_preset"
 SERVICE_APPLY_PRESET = "apply_preset"
+SERVICE_SET_PRESETS = "set_presets"
+SERVICE_COPY_PRESETS = "copy_presets"
+SERVICE_GET_PRESETS = "get_presets"
+PRESET_MODES = ["merge", "replace"]
 
 def _normalize_preset_name(value) -> str:
     """Strip and reject empty/blank preset names."""
@@ -70,6 +80,16 @@ def _normalize_preset_position(value) -> float:
 _PRESET_NAME_SCHEMA = vol.All(_normalize_preset_name, vol.Length(min=1, max=64))
 _PRESET_POSITION_SCHEMA = _normalize_preset_position
 
+
+def _normalize_preset_map(value) -> dict[str, float]:
+    """Validate a name -> position mapping with the single-preset rules."""
+    if not isinstance(value, dict):
+        raise vol.Invalid("presets must be a mapping of preset name to position")
+    return {
+        _PRESET_NAME_SCHEMA(name): _PRESET_POSITION_SCHEMA(position)
+        for name, position in value.items()
+    }
+
 SAVE_PRESET_SCHEMA = vol.Schema(
     {
         vol.Required("entity_id"): cv.entity_id,
@@ -95,54 +115,35 @@ APPLY_PRESET_SCHEMA = vol.Schema(
         vol.Required("name"): _PRESET_NAME_SCHEMA,
     }
 )
+SET_PRESETS_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Required("presets"): _normalize_preset_map,
+        vol.Optional("mode", default="merge"): vol.In(PRESET_MODES),
+    }
+)
+COPY_PRESETS_SCHEMA = vol.Schema(
+    {
+        vol.Required("source"): cv.entity_id,
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Optional("mode", default="merge"): vol.In(PRESET_MODES),
+    }
+)
+GET_PRESETS_SCHEMA = vol.Schema({vol.Required("entity_id"): cv.entity_ids})
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Tuiss2HA from a config entry."""
     hub = Hub(hass, entry.data[CONF_BLIND_HOST], entry.data[CONF_BLIND_NAME])
 
+    _async_migrate_entry(hass, entry)
+
     for blind in hub.blinds:
 
-        # Load timers
-        await blind.async_load_timers()
-
-        # Load position presets (HA-side named positions)
-        await blind.async_load_presets()
-        
-        # Clean up old duplicate network MAC connections from the device registry DEPRICATE IN FUTURE RELEASE
-        device_registry = dr.async_get(hass)
-        device = device_registry.async_get_device(identifiers={(DOMAIN, blind.blind_id)})
-        if device:
-            # Create a new set of connections, keeping only bluetooth and ensuring it's lowercase
-            clean_connections = set()
-            for conn_type, conn_val in device.connections:
-                if conn_type == dr.CONNECTION_BLUETOOTH:
-                    # Add the formatted (lowercase) bluetooth connection.
-                    # The set will handle deduplication if there are already upper/lower case versions.
-                    clean_connections.add((dr.CONNECTION_BLUETOOTH, dr.format_mac(conn_val)))
-
-            if clean_connections != device.connections:
-                _LOGGER.debug("Cleaning up device connections for %s", blind.name)
-                device_registry.async_update_device(
-                    device.id, new_connections=clean_connections
-                )
-        
-        #add missing unique_ids TO DEPRICATE IN FUTURE RELEASE
-        if entry.unique_id is None:
-            _LOGGER.debug("Attempting to set UID for %s to %s", entry.data["name"],entry.data["host"])
-            hass.config_entries.async_update_entry(entry, unique_id = entry.data["host"])
-        else:
-            _LOGGER.debug("Skipping, UID already set for %s.", entry.data["name"])
-        
-        if not entry.options:
-            hass.config_entries.async_update_entry(
-            entry,
-            options={
-                OPT_RESTART_POSITION: DEFAULT_RESTART_POSITION,
-                OPT_RESTART_ATTEMPTS: DEFAULT_RESTART_ATTEMPTS,
-                OPT_BLIND_SPEED: DEFAULT_BLIND_SPEED,
-                OPT_BATTERY_CHECK_DAYS: DEFAULT_BATTERY_CHECK_DAYS,
-            },
-        )
+        # Load timers and position presets (HA-side named positions); the
+        # two stores are independent files, so read them concurrently
+        await asyncio.gather(blind.async_load_timers(), blind.async_load_presets())
+
+        _async_clean_device_connections(hass, blind)
 
         #only attempt to get the current position of the blind on boot if required. Required when using tuiss app or bluetooth remotes
         blind._position_on_restart = entry.options.get("blind_restart_position", False)
@@ -159,6 +160,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         blind._restart_attempts = entry.options.get(
             OPT_RESTART_ATTEMPTS, DEFAULT_RESTART_ATTEMPTS
         )
+        blind._move_tolerance = entry.options.get(
+            OPT_MOVE_TOLERANCE, DEFAULT_MOVE_TOLERANCE
+        )
+        await blind.async_set_capture(
+            entry.options.get(OPT_CAPTURE_TRAFFIC, DEFAULT_CAPTURE_TRAFFIC)
+        )
 
         if blind._position_on_restart:
             try:
@@ -174,6 +181,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 raise ConfigEntryNotReady(f"Error getting blind position: {e}") from e
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = hub
+    async_get_index(hass).async_add_hub(entry.entry_id, hub)
     entry.async_on_unload(entry.add_update_listener(update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -200,6 +208,50 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@callback
+def _async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Fill in the unique_id and default options older entries were created without."""
+    #add missing unique_ids TO DEPRICATE IN FUTURE RELEASE
+    if entry.unique_id is None:
+        _LOGGER.debug("Attempting to set UID for %s to %s", entry.data["name"],entry.data["host"])
+        hass.config_entries.async_update_entry(entry, unique_id = entry.data["host"])
+    else:
+        _LOGGER.debug("Skipping, UID already set for %s.", entry.data["name"])
+
+    if not entry.options:
+        hass.config_entries.async_update_entry(
+            entry,
+            options={
+                OPT_RESTART_POSITION: DEFAULT_RESTART_POSITION,
+                OPT_RESTART_ATTEMPTS: DEFAULT_RESTART_ATTEMPTS,
+                OPT_BLIND_SPEED: DEFAULT_BLIND_SPEED,
+                OPT_BATTERY_CHECK_DAYS: DEFAULT_BATTERY_CHECK_DAYS,
+            },
+        )
+
+
+@callback
+def _async_clean_device_connections(hass: HomeAssistant, blind) -> None:
+    """Clean up old duplicate network MAC connections from the device registry DEPRICATE IN FUTURE RELEASE"""
+    device_registry = dr.async_get(hass)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, blind.blind_id)})
+    if not device:
+        return
+    # Create a new set of connections, keeping only bluetooth and ensuring it's lowercase
+    clean_connections = set()
+    for conn_type, conn_val in device.connections:
+        if conn_type == dr.CONNECTION_BLUETOOTH:
+            # Add the formatted (lowercase) bluetooth connection.
+            # The set will handle deduplication if there are already upper/lower case versions.
+            clean_connections.add((dr.CONNECTION_BLUETOOTH, dr.format_mac(conn_val)))
+
+    if clean_connections != device.connections:
+        _LOGGER.debug("Cleaning up device connections for %s", blind.name)
+        device_registry.async_update_device(
+            device.id, new_connections=clean_connections
+        )
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     hub: Hub | None = hass.data[DOMAIN].get(entry.entry_id)
@@ -218,6 +270,14 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
         except (AttributeError, TypeError) as e:
             _LOGGER.debug("Failed to apply battery_check_days to blind %s: %s", getattr(b, "name", "unknown"), e)
 
+    move_tolerance = entry.options.get(OPT_MOVE_TOLERANCE, DEFAULT_MOVE_TOLERANCE)
+    for b in hub.blinds:
+        b._move_tolerance = move_tolerance
+
+    capture = entry.options.get(OPT_CAPTURE_TRAFFIC, DEFAULT_CAPTURE_TRAFFIC)
+    for b in hub.blinds:
+        await b.async_set_capture(capture)
+
     # Retrieve the updated option value for speed
     new_blind_speed = entry.options.get(OPT_BLIND_SPEED, DEFAULT_BLIND_SPEED)
     current_blind_speed = blind_device._blind_speed
@@ -267,33 +327,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hub = hass.data[DOMAIN].pop(entry.entry_id)
+        async_get_index(hass).async_remove_hub(hub)
+        async_unload_index(hass)
+        for blind in hub.blinds:
+            blind.untrack_timer_positions()
+            await blind.async_set_capture(False)
+            METRICS.remove(blind.blind_id)
 
     return unload_ok
 
 
 def _resolve_blind_from_entity_id(hass: HomeAssistant, entity_id: str):
     """Resolve a TuissBlind from a cover or preset-select entity_id, or None."""
-    ent_reg = er.async_get(hass)
-    entry = ent_reg.async_get(entity_id)
-    if not entry or entry.platform != DOMAIN:
-        return None
-    unique_id = entry.unique_id or ""
     # Only cover/preset-select are valid preset-service targets.
-    blind_id: str | None = None
-    for suffix in ("_preset_select", "_cover"):
-        if unique_id.endswith(suffix):
-            blind_id = unique_id[: -len(suffix)]
-            break
-    if not blind_id:
-        return None
-    for hub in hass.data.get(DOMAIN, {}).values():
-        if not isinstance(hub, Hub):
-            continue
-        for blind in hub.blinds:
-            if blind.blind_id == blind_id:
-                return blind
-    return None
+    return async_get_index(hass).blind(entity_id, ("_preset_select", "_cover"))
+
+
+def _resolve_blinds(hass: HomeAssistant, entity_ids: list[str], service: str) -> dict:
+    """Resolve cover or preset-select entity_ids to their blinds, once per blind."""
+    blinds = {}
+    for entity_id in entity_ids:
+        blind = _resolve_blind_from_entity_id(hass, entity_id)
+        if not blind:
+            raise HomeAssistantError(
+                f"{service}: cannot resolve a Tuiss blind for {entity_id}"
+            )
+        blinds.setdefault(blind.blind_id, blind)
+    return blinds
 
 
 @callback
@@ -365,6 +426,48 @@ def _async_register_preset_services(hass: HomeAssistant) -> None:
         # Helper raises HomeAssistantError on unknown preset.
         await blind.async_apply_preset(name)
 
+    async def _handle_set_presets(call: ServiceCall) -> None:
+        presets = call.data["presets"]
+        replace = call.data["mode"] == "replace"
+        blinds = _resolve_blinds(hass, call.data["entity_id"], SERVICE_SET_PRESETS)
+        # One write and one publish per blind, all blinds at once
+        await asyncio.gather(
+            *(blind.async_set_presets(presets, replace=replace) for blind in blinds.values())
+        )
+        _LOGGER.info(
+            "Set %s presets on %s blinds (%s)", len(presets), len(blinds), call.data["mode"]
+        )
+
+    async def _handle_copy_presets(call: ServiceCall) -> None:
+        source_id = call.data["source"]
+        source = _resolve_blind_from_entity_id(hass, source_id)
+        if not source:
+            raise HomeAssistantError(
+                f"copy_presets: cannot resolve a Tuiss blind for {source_id}"
+            )
+        presets = dict(source.presets)
+        replace = call.data["mode"] == "replace"
+        blinds = _resolve_blinds(hass, call.data["entity_id"], SERVICE_COPY_PRESETS)
+        blinds.pop(source.blind_id, None)
+        await asyncio.gather(
+            *(blind.async_set_presets(presets, replace=replace) for blind in blinds.values())
+        )
+        _LOGGER.info(
+            "%s: Copied %s presets to %s blinds (%s)",
+            source.name, len(presets), len(blinds), call.data["mode"],
+        )
+
+    async def _handle_get_presets(call: ServiceCall) -> dict:
+        presets = {}
+        for entity_id in call.data["entity_id"]:
+            blind = _resolve_blind_from_entity_id(hass, entity_id)
+            if not blind:
+                raise HomeAssistantError(
+                    f"get_presets: cannot resolve a Tuiss blind for {entity_id}"
+                )
+            presets[entity_id] = dict(blind.presets)
+        return presets
+
     hass.services.async_register(
         DOMAIN, SERVICE_SAVE_PRESET, _handle_save_preset, schema=SAVE_PRESET_SCHEMA
     )
@@ -380,3 +483,16 @@ def _async_register_preset_services(hass: HomeAssistant) -> None:
     hass.services.async_register(
         DOMAIN, SERVICE_APPLY_PRESET, _handle_apply_preset, schema=APPLY_PRESET_SCHEMA
     )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_PRESETS, _handle_set_presets, schema=SET_PRESETS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_COPY_PRESETS, _handle_copy_presets, schema=COPY_PRESETS_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PRESETS,
+        _handle_get_presets,
+        schema=GET_PRESETS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
@@ -10,7 +10,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant, SupportsResponse, callback
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.restore_state import RestoreEntity
 
@@ -34,15 +34,24 @@ async def async_setup_entry(
     platform = entity_platform.async_get_current_platform()
 
     platform.async_register_entity_service(
-        "get_battery_status", {}, async_get_battery_status
+        "get_battery_status",
+        {},
+        async_get_battery_status,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
 
-async def async_get_battery_status(entity, service_call):
+async def async_get_battery_status(entity, service_call) -> dict:
     """Get the battery status when called by service."""
     await entity._blind.get_battery_status()
     entity._attr_is_on = entity._blind._battery_status
     entity.schedule_update_ha_state()
+    last_check = entity._blind._last_battery_check
+    return {
+        "battery_low": entity._blind._battery_status,
+        "last_check": last_check.isoformat() if last_check else None,
+        **entity._blind.op_stats,
+    }
 
 
 class BatterySensor(BinarySensorEntity, RestoreEntity):
@@ -35,6 +35,14 @@ from .const import (
     NoConnectableBluetoothAdapter,
     OPT_FAVORITE_POSITION,
     DEFAULT_FAVORITE_POSITION,
+    OPT_MOVE_DEBOUNCE,
+    DEFAULT_MOVE_DEBOUNCE,
+    OPT_MOVE_TOLERANCE,
+    DEFAULT_MOVE_TOLERANCE,
+    OPT_WAIT_FOR_MOVE,
+    DEFAULT_WAIT_FOR_MOVE,
+    OPT_CAPTURE_TRAFFIC,
+    DEFAULT_CAPTURE_TRAFFIC,
     OPT_BATTERY_CHECK_DAYS,
     DEFAULT_BATTERY_CHECK_DAYS,
 )
@@ -278,6 +286,34 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             ): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=0, max=100, step=1, mode="slider")
             ),
+            vol.Optional(
+                OPT_MOVE_DEBOUNCE,
+                default=self.config_entry.options.get(
+                    OPT_MOVE_DEBOUNCE, DEFAULT_MOVE_DEBOUNCE
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=5, step=0.1, mode="box")
+            ),
+            vol.Optional(
+                OPT_WAIT_FOR_MOVE,
+                default=self.config_entry.options.get(
+                    OPT_WAIT_FOR_MOVE, DEFAULT_WAIT_FOR_MOVE
+                ),
+            ): bool,
+            vol.Optional(
+                OPT_MOVE_TOLERANCE,
+                default=self.config_entry.options.get(
+                    OPT_MOVE_TOLERANCE, DEFAULT_MOVE_TOLERANCE
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=5, step=0.1, mode="box")
+            ),
+            vol.Optional(
+                OPT_CAPTURE_TRAFFIC,
+                default=self.config_entry.options.get(
+                    OPT_CAPTURE_TRAFFIC, DEFAULT_CAPTURE_TRAFFIC
+                ),
+            ): bool,
             # Limit configuration button
             vol.Optional("configure_limits", default=False): bool,
             # Delete all timers button
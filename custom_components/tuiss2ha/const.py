@@ -1,5 +1,49 @@
 """Constants for the ha2tuiss integration."""
 
+# Protocol, movement and error definitions live in the headless core; they
+# are re-exported here so the platforms keep a single place to import from.
+from .lib.tuiss.const import (  # noqa: F401
+    TIMEOUT_SECONDS,
+    TRAVERSAL_UPDATE_THRESHOLD,
+    DEFAULT_TRAVERSAL_SPEED,
+    MOVE_CONNECTION_OVERHEAD,
+    METRIC_BUCKETS,
+    LOG_THROTTLE_SECONDS,
+    FRAME_LOG_SIZE,
+    BLIND_NOTIFY_CHARACTERISTIC,
+    CONNECTION_MESSAGE,
+    INITIALIZATION_MESSAGE,
+    UUID,
+    CMD_HEARTBEAT,
+    CMD_STOP,
+    CMD_BATTERY_STATUS,
+    CMD_SPEED_STANDARD,
+    CMD_SPEED_COMFORT,
+    CMD_SPEED_SLOW,
+    CMD_LIMITS_INIT_2,
+    CMD_LIMITS_STEP_UP,
+    CMD_LIMITS_STEP_DOWN,
+    CMD_LIMITS_MOVE_UP,
+    CMD_LIMITS_MOVE_DOWN,
+    CMD_LIMITS_SET,
+    CMD_TIMER_REQUEST,
+    CMD_TIMESTAMP_BASE,
+    CMD_TIMER_DELETE_BASE,
+    CMD_TIMER_RESET,
+    CMD_BLIND_REACTIVATE,
+    MAX_TIMERS,
+    DEFAULT_RESTART_ATTEMPTS,
+    DEFAULT_MOVE_TOLERANCE,
+    POSITION_SOURCE_CONFIDENCE,
+    POSITION_CONFIDENCE_HALF_LIFE,
+    MIN_SKIP_CONFIDENCE,
+    SKIP_TRUSTED_SOURCES,
+    BlindError,
+    DeviceNotFound,
+    ConnectionTimeout,
+    NoConnectableBluetoothAdapter,
+)
+
 # name for the integration.
 DOMAIN = "tuiss2ha"
 
@@ -8,37 +52,10 @@ CONF_BLIND_NAME = "name"
 
 SPEED_CONTROL_SUPPORTED_MODELS = ["TS5200","TS5101","TS5001","TS2600"]
 
-TIMEOUT_SECONDS = 120
-TRAVERSAL_UPDATE_THRESHOLD = 5
-BLIND_NOTIFY_CHARACTERISTIC = "00010304-0405-0607-0809-0a0b0c0d1910"
-CONNECTION_MESSAGE = "ff03030303787878787878"
-INITIALIZATION_MESSAGE = "ff78ea41d10301"
-UUID = "00010405-0405-0607-0809-0a0b0c0d1910"
-
-# BLE Protocol Commands
-CMD_HEARTBEAT = "ff010101010101"
-CMD_STOP = "ff78ea415f0301"
-CMD_BATTERY_STATUS = "ff78ea41f00301"
-CMD_SPEED_STANDARD = "ff78ea41f202"
-CMD_SPEED_COMFORT = "ff78ea41f201"
-CMD_SPEED_SLOW = "ff78ea41f200"
-CMD_LIMITS_INIT_2 = "ff78ea41210301"
-CMD_LIMITS_STEP_UP = "ff78ea41220301"
-CMD_LIMITS_STEP_DOWN = "ff78ea41230301"
-CMD_LIMITS_MOVE_UP = "ff78ea41cf0301"
-CMD_LIMITS_MOVE_DOWN = "ff78ea411f0301"
-CMD_LIMITS_SET = "ff78ea41410301"
-CMD_TIMER_REQUEST = "ff78ea4104"
-CMD_TIMESTAMP_BASE = "ff78ea410200"
-CMD_TIMER_DELETE_BASE = "ff78ea410301"
-CMD_TIMER_RESET = "ff04040404"
-CMD_BLIND_REACTIVATE = "ff02020202787878787878"
-
 OPT_RESTART_POSITION = "blind_restart_position"
 DEFAULT_RESTART_POSITION = False
 
 OPT_RESTART_ATTEMPTS = "blind_restart_attempts"
-DEFAULT_RESTART_ATTEMPTS = 4
 
 OPT_BLIND_SPEED = "blind_speed"
 DEFAULT_BLIND_SPEED = "Standard"
@@ -47,6 +64,22 @@ BLIND_SPEED_LIST = ["Standard", "Comfort", "Slow"]
 OPT_FAVORITE_POSITION = "blind_favorite_position"
 DEFAULT_FAVORITE_POSITION = 50
 
+# Quiet period (seconds) before a set-position request is sent; 0 disables debouncing.
+# Off by default: a quiet period delays every position call, not just slider drags.
+OPT_MOVE_DEBOUNCE = "blind_move_debounce"
+DEFAULT_MOVE_DEBOUNCE = 0
+
+# Hold open/close/set-position calls until the blind stops (False: return once the move is sent)
+OPT_WAIT_FOR_MOVE = "blind_wait_for_move"
+DEFAULT_WAIT_FOR_MOVE = True
+
+# Moves to within this many percent of a confidently known position are skipped
+OPT_MOVE_TOLERANCE = "blind_move_tolerance"
+
+# Write every GATT write and notification to <config>/tuiss2ha/captures/<mac>.btsnoop
+OPT_CAPTURE_TRAFFIC = "blind_capture_traffic"
+DEFAULT_CAPTURE_TRAFFIC = False
+
 #Exceptions
 OPT_BATTERY_CHECK_DAYS = "blind_battery_check_days"
 DEFAULT_BATTERY_CHECK_DAYS = 0
@@ -61,15 +94,3 @@ class InvalidHost(Exception):
 
 class InvalidName(Exception):
     """Error to indicate there is an invalid device name."""
-
-
-class DeviceNotFound(Exception):
-    """Error to indicate the device is not found."""
-
-
-class ConnectionTimeout(Exception):
-    """Error to indicate a connection timeout."""
-
-
-class NoConnectableBluetoothAdapter(Exception):
-    """Error to indicate no Bluetooth adapter can connect (e.g. Shelly is passive-only)."""
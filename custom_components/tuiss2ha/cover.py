@@ -6,6 +6,7 @@ import asyncio
 import logging
 import voluptuous as vol
 import datetime
+from collections import Counter
 
 
 from typing import Any
@@ -19,7 +20,7 @@ from homeassistant.components.cover import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_CLOSED, STATE_OPEN, STATE_OPENING, STATE_CLOSING
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.helpers import entity_platform, config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -35,17 +36,36 @@ from .const import (
     DOMAIN,
     OPT_RESTART_ATTEMPTS,
     OPT_RESTART_POSITION,
+    TIMEOUT_SECONDS,
     BLIND_SPEED_LIST,
     OPT_BLIND_SPEED,
     SPEED_CONTROL_SUPPORTED_MODELS,
     OPT_FAVORITE_POSITION,
     DEFAULT_FAVORITE_POSITION,
+    OPT_MOVE_DEBOUNCE,
+    DEFAULT_MOVE_DEBOUNCE,
+    OPT_MOVE_TOLERANCE,
+    DEFAULT_MOVE_TOLERANCE,
+    OPT_WAIT_FOR_MOVE,
+    DEFAULT_WAIT_FOR_MOVE,
     OPT_BATTERY_CHECK_DAYS,
     DEFAULT_BATTERY_CHECK_DAYS,
     ConnectionTimeout,
     DeviceNotFound,
 )
 from .hub import TuissBlind
+from .index import async_get_index
+from .lib.tuiss.clock import loop_time
+from .lib.tuiss.fleet import (
+    DEFAULT_FLEET_CONCURRENCY,
+    DEFAULT_SLOTS_PER_PROXY,
+    StartBarrier,
+    async_fan_out,
+    plan_longest_first,
+)
+from .lib.tuiss.metrics import METRICS
+from .lib.tuiss.schedule import normalize_time
+from .snapshots import async_get_snapshots
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,25 +75,96 @@ ATTR_MAC_ADDRESS = "mac_address"
 
 GET_BLIND_POSITION_SCHEMA = cv.make_entity_service_schema({})
 SET_BLIND_POSITION_SCHEMA = cv.make_entity_service_schema(
-    {vol.Required("position"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100))}
+    {
+        vol.Required("position"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional("wait"): bool,
+    }
+)
+WAIT_FOR_COMPLETION_SCHEMA = cv.make_entity_service_schema(
+    {vol.Optional("timeout", default=TIMEOUT_SECONDS): vol.All(vol.Coerce(float), vol.Range(min=0, max=600))}
 )
 SET_BLIND_SPEED_SCHEMA = cv.make_entity_service_schema(
     {vol.Required("speed"): vol.In(BLIND_SPEED_LIST)}
 )
+FLEET_LIMIT_FIELDS = {
+    vol.Optional("concurrency", default=DEFAULT_FLEET_CONCURRENCY): vol.All(vol.Coerce(int), vol.Range(min=1, max=32)),
+    vol.Optional("slots_per_proxy", default=DEFAULT_SLOTS_PER_PROXY): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+}
 SIMULTANEOUS_BLIND_POSITIONING_SCHEMA = vol.Schema(
     {
         vol.Required("entity_ids"): cv.entity_ids,
         vol.Optional("favourite"): bool,
         vol.Optional("position"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional("synchronized_start", default=True): bool,
+        **FLEET_LIMIT_FIELDS,
     }
 )
-ADD_BLIND_TIMER_SCHEMA = cv.make_entity_service_schema(
+TIMER_FIELDS = {
+    vol.Required("position"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+    vol.Required("days"): vol.All(cv.ensure_list, [vol.In(["mon", "tue", "wed", "thu", "fri", "sat", "sun"])]),
+    vol.Required("time"): cv.time,
+}
+ADD_BLIND_TIMER_SCHEMA = cv.make_entity_service_schema(TIMER_FIELDS)
+SYNC_BLIND_TIMERS_SCHEMA = cv.make_entity_service_schema(
     {
-        vol.Required("position"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
-        vol.Required("days"): vol.All(cv.ensure_list, [vol.In(["mon", "tue", "wed", "thu", "fri", "sat", "sun"])]),
-        vol.Required("time"): cv.time,
+        vol.Optional("timers"): vol.All(cv.ensure_list, [vol.Schema(TIMER_FIELDS)]),
+    }
+)
+COMPILE_BLIND_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_ids"): cv.entity_ids,
+        vol.Required("schedule"): vol.All(cv.ensure_list, [vol.Schema(TIMER_FIELDS)]),
+        vol.Optional("mode", default="replace"): vol.In(["replace", "merge"]),
+        **FLEET_LIMIT_FIELDS,
+    }
+)
+FLEET_OPERATIONS = [
+    "open",
+    "close",
+    "set_position",
+    "get_position",
+    "get_battery",
+    "set_speed",
+    "add_timer",
+    "delete_timer",
+    "sync_timers",
+    "apply_preset",
+]
+RUN_FLEET_OPERATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_ids"): cv.entity_ids,
+        vol.Required("operation"): vol.In(FLEET_OPERATIONS),
+        vol.Optional("position"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional("speed"): vol.In(BLIND_SPEED_LIST),
+        vol.Optional("days"): vol.All(cv.ensure_list, [vol.In(["mon", "tue", "wed", "thu", "fri", "sat", "sun"])]),
+        vol.Optional("time"): cv.time,
+        vol.Optional("preset"): cv.string,
+        **FLEET_LIMIT_FIELDS,
+    }
+)
+GET_METRICS_SCHEMA = vol.Schema({vol.Optional("entity_ids"): cv.entity_ids})
+SNAPSHOT_POSITIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_ids"): cv.entity_ids,
+        vol.Required("name"): vol.All(cv.string, vol.Strip, vol.Length(min=1, max=64)),
+        vol.Optional("store", default=False): cv.boolean,
+    }
+)
+RESTORE_POSITIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): vol.All(cv.string, vol.Strip, vol.Length(min=1, max=64)),
+        vol.Optional("entity_ids"): cv.entity_ids,
+        **FLEET_LIMIT_FIELDS,
     }
 )
+# Extra fields each fleet operation needs.
+FLEET_OPERATION_FIELDS = {
+    "set_position": ["position"],
+    "set_speed": ["speed"],
+    "add_timer": ["days", "time", "position"],
+    "delete_timer": ["time"],
+    "apply_preset": ["preset"],
+}
 
 
 async def async_setup_entry(
@@ -86,30 +177,42 @@ async def async_setup_entry(
     blinds = [Tuiss(blind, config_entry) for blind in hub.blinds]
     async_add_entities(blinds)
 
-    # Store entities in hass.data[DOMAIN] for easy retrieval by entity_id
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-    if "entities" not in hass.data[DOMAIN]:
-        hass.data[DOMAIN]["entities"] = {}
-    for blind_entity in blinds:
-        hass.data[DOMAIN]["entities"][blind_entity.entity_id] = blind_entity
+    # Index the covers so the domain services can reach them by entity_id
+    async_get_index(hass).async_add_entities(blinds)
 
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
-        "get_blind_position", GET_BLIND_POSITION_SCHEMA, async_action_get_blind_position
+        "get_blind_position",
+        GET_BLIND_POSITION_SCHEMA,
+        async_action_get_blind_position,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     platform.async_register_entity_service(
         "set_blind_position",
         SET_BLIND_POSITION_SCHEMA,
         async_action_set_blind_position,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     
+    platform.async_register_entity_service(
+        "wait_for_completion",
+        WAIT_FOR_COMPLETION_SCHEMA,
+        async_action_wait_for_completion,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
     platform.async_register_entity_service(
         "add_blind_timer",
         ADD_BLIND_TIMER_SCHEMA,
         async_action_add_timer,
     )
+
+    platform.async_register_entity_service(
+        "sync_blind_timers",
+        SYNC_BLIND_TIMERS_SCHEMA,
+        async_action_sync_timers,
+    )
     
     # Register the set_speed service only for supported models
     for blind_entity in blinds:
@@ -119,7 +222,11 @@ async def async_setup_entry(
                 "set_blind_speed", SET_BLIND_SPEED_SCHEMA, async_action_set_blind_speed
             )
 
-    
+    # The domain services below serve every entry; register them with the
+    # first entry only rather than re-registering them for each of N entries.
+    if hass.services.has_service(DOMAIN, "force_unlock"):
+        return
+
     async def handle_force_unlock(call):
         """Handle the force unlock service call."""
         entity_ids = call.data.get("entity_id")
@@ -132,7 +239,7 @@ async def async_setup_entry(
             entity_ids = [entity_ids]
 
         for entity_id in entity_ids:
-            entity = hass.data[DOMAIN]["entities"].get(entity_id)
+            entity = async_get_index(hass).entity(entity_id)
             if not entity:
                 _LOGGER.error("Entity %s not found for force unlock", entity_id)
                 continue
@@ -147,7 +254,7 @@ async def async_setup_entry(
 
 
     # Register the new parallel blind position service as a domain service
-    async def async_action_simultaneous_blind_positioning(service_call: ServiceCall) -> None:
+    async def async_action_simultaneous_blind_positioning(service_call: ServiceCall) -> dict | None:
         """Set the position of multiple blinds simultaneously."""
         hass = service_call.hass
         entity_ids = service_call.data["entity_ids"]
@@ -157,76 +264,436 @@ async def async_setup_entry(
         # Validate inputs
         if not favourite and position is None:
             _LOGGER.error("Position is required when 'favourite' is False.")
-            return
-
-        target_entities = []
-        for entity_id in entity_ids:
-            entity = hass.data[DOMAIN]["entities"].get(entity_id)
-            if entity:
-                target_entities.append(entity)
-            else:
-                _LOGGER.warning(
-                    "Entity %s not found for parallel blind position setting.", entity_id
-                )
+            return None
 
-        if not target_entities:
+        targets, missing = _resolve_entities(hass, entity_ids)
+        if not targets:
             _LOGGER.error("No valid entities found for parallel blind position setting.")
-            return
-
-        # Try to connect to all blinds in parallel, but continue on individual failures
-        connect_tasks = [asyncio.create_task(entity._blind.attempt_connection()) for entity in target_entities]
-        connect_results = await asyncio.gather(*connect_tasks, return_exceptions=True)
-
-        connected_entities: list[Tuiss] = []
-        for entity, res in zip(target_entities, connect_results):
-            if isinstance(res, Exception):
-                _LOGGER.warning("Failed to connect to %s: %s", entity.entity_id, res)
-            else:
-                connected_entities.append(entity)
-
-        if not connected_entities:
-            _LOGGER.error("No blinds connected for simultaneous positioning.")
-            return
+            return None
 
-        # Build and dispatch set-position tasks
-        set_position_tasks = []
-        if favourite:
-            for entity in connected_entities:
-                fav_pos = entity.config_entry.options.get(
+        def _target_position(entity: Tuiss) -> float:
+            if favourite:
+                return entity.config_entry.options.get(
                     OPT_FAVORITE_POSITION, DEFAULT_FAVORITE_POSITION
                 )
-                set_position_tasks.append(
-                    entity.async_set_cover_position(**{ATTR_POSITION: fav_pos, "skip_battery_check": True})
-                )
-        else:
-            for entity in connected_entities:
-                set_position_tasks.append(
-                    entity.async_set_cover_position(**{ATTR_POSITION: position, "skip_battery_check": True})
-                )
+            return position
+
+        # A synchronized start needs every blind connected at once; when a proxy
+        # has more blinds than connection slots, queue the moves longest first.
+        slots_per_proxy = service_call.data.get("slots_per_proxy", DEFAULT_SLOTS_PER_PROXY)
+        per_proxy = Counter(
+            proxy for entity in targets.values()
+            if (proxy := entity._blind.proxy_source) is not None
+        )
+        if service_call.data.get("synchronized_start", True) and all(
+            count <= slots_per_proxy for count in per_proxy.values()
+        ):
+            return await _async_synchronized_positioning(list(targets.values()), _target_position)
+
+        async def _move(entity: Tuiss) -> None:
+            await entity._async_move_to_position(
+                **{ATTR_POSITION: _target_position(entity), "skip_battery_check": True, "wait": True}
+            )
 
-        results = await asyncio.gather(*set_position_tasks, return_exceptions=True)
-        for entity, res in zip(connected_entities, results):
-            if isinstance(res, Exception):
-                _LOGGER.warning("Failed to set position for %s: %s", entity.entity_id, res)
+        outcome = await _async_fan_out_entities(
+            targets, missing, service_call.data, _move, move_target=_target_position
+        )
+        _LOGGER.info(
+            "Planned move of %s blinds: predicted makespan %ss, actual %ss",
+            len(targets), outcome["predicted_makespan"], outcome["wall_time"],
+        )
+        return {
+            "synchronized": False,
+            "start_skew_ms": None,
+            "started": [label for label, result in outcome["results"].items() if result["success"]],
+            "failed": {
+                label: result["error"] for label, result in outcome["results"].items() if not result["success"]
+            },
+            "predicted_makespan": outcome["predicted_makespan"],
+            "makespan": outcome["wall_time"],
+        }
 
     hass.services.async_register(
         DOMAIN,
         "simultaneous_blind_positioning",
         async_action_simultaneous_blind_positioning,
         schema=SIMULTANEOUS_BLIND_POSITIONING_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_action_compile_blind_schedule(service_call: ServiceCall) -> None:
+        """Push a recurring schedule into the firmware timers of several blinds."""
+        hass = service_call.hass
+        schedule = [
+            {"days": entry["days"], "time": str(entry["time"]), "position": entry["position"]}
+            for entry in service_call.data["schedule"]
+        ]
+        merge = service_call.data.get("mode", "replace") == "merge"
+
+        async def _compile(entity: Tuiss) -> dict:
+            blind = entity._blind
+            desired = [*blind.timers.values(), *schedule] if merge else schedule
+            result = await blind.async_sync_timers(desired)
+            _LOGGER.info(
+                "%s: Schedule compiled into %s firmware timers (%s deleted, %s added)",
+                blind.name, result["slots_used"], len(result["deleted"]), len(result["added"]),
+            )
+            return result
+
+        targets, missing = _resolve_entities(hass, service_call.data["entity_ids"])
+        outcome = await _async_fan_out_entities(targets, missing, service_call.data, _compile)
+        failed = [
+            entity_id for entity_id, result in outcome["results"].items() if not result["success"]
+        ]
+        if failed:
+            raise HomeAssistantError(
+                f"compile_blind_schedule: failed for {', '.join(failed)}"
+            )
+
+    hass.services.async_register(
+        DOMAIN,
+        "compile_blind_schedule",
+        async_action_compile_blind_schedule,
+        schema=COMPILE_BLIND_SCHEDULE_SCHEMA,
+    )
+
+    async def async_action_run_fleet_operation(service_call: ServiceCall) -> dict:
+        """Run one per-blind operation against many blinds and report per blind."""
+        hass = service_call.hass
+        data = service_call.data
+        operation = data["operation"]
+        missing = [field for field in FLEET_OPERATION_FIELDS.get(operation, []) if field not in data]
+        if missing:
+            raise HomeAssistantError(
+                f"run_fleet_operation: {operation} requires {', '.join(missing)}"
+            )
+
+        async def _operate(entity: Tuiss) -> Any:
+            return await _async_run_fleet_operation(entity, operation, data)
+
+        targets, missing = _resolve_entities(hass, data["entity_ids"])
+        outcome = await _async_fan_out_entities(
+            targets, missing, data, _operate, move_target=_fleet_move_target(operation, data)
+        )
+        _LOGGER.info(
+            "Fleet %s: %s succeeded, %s failed in %ss",
+            operation, outcome["succeeded"], outcome["failed"], outcome["wall_time"],
+        )
+        return outcome
+
+    hass.services.async_register(
+        DOMAIN,
+        "run_fleet_operation",
+        async_action_run_fleet_operation,
+        schema=RUN_FLEET_OPERATION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_action_get_metrics(service_call: ServiceCall) -> dict:
+        """Return the connection metrics, per blind and per proxy."""
+        entity_ids = service_call.data.get("entity_ids")
+        if not entity_ids:
+            return METRICS.snapshot()
+        targets, missing = _resolve_entities(service_call.hass, entity_ids)
+        return {
+            "blinds": {entity_id: entity._blind.metrics for entity_id, entity in targets.items()},
+            "missing": list(missing),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_metrics",
+        async_action_get_metrics,
+        schema=GET_METRICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def async_action_snapshot_positions(service_call: ServiceCall) -> dict:
+        """Save the current position of several blinds under a name."""
+        data = service_call.data
+        return await _async_snapshot_positions(
+            service_call.hass, data["entity_ids"], data["name"], store=data.get("store", False)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        "snapshot_positions",
+        async_action_snapshot_positions,
+        schema=SNAPSHOT_POSITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
+    async def async_action_restore_positions(service_call: ServiceCall) -> dict:
+        """Move the blinds of a snapshot back to their saved positions."""
+        return await _async_restore_positions(service_call.hass, service_call.data)
+
+    hass.services.async_register(
+        DOMAIN,
+        "restore_positions",
+        async_action_restore_positions,
+        schema=RESTORE_POSITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def _async_snapshot_positions(
+    hass: HomeAssistant, entity_ids: list[str], name: str, store: bool = False
+) -> dict:
+    """Snapshot the known positions of ``entity_ids``; blinds without one are reported."""
+    targets, missing = _resolve_entities(hass, entity_ids)
+    positions = {}
+    unknown = list(missing)
+    for entity_id, entity in targets.items():
+        position = entity._blind.current_position
+        # A cover with no known state starts at a placeholder 0 with no source
+        if position is None or entity._blind.position_confidence <= 0:
+            unknown.append(entity_id)
+        else:
+            positions[entity_id] = float(position)
+    if not positions:
+        raise HomeAssistantError(f"snapshot_positions: no known position for {', '.join(entity_ids)}")
+    await async_get_snapshots(hass).async_save_snapshot(name, positions, store=store)
+    _LOGGER.info("Snapshot %s saved with %s blinds (stored: %s)", name, len(positions), store)
+    return {"name": name, "positions": positions, "unknown": unknown}
+
+
+async def _async_restore_positions(hass: HomeAssistant, data) -> dict:
+    """Restore a snapshot as one planned fleet move.
+
+    A scene issues an independent set_cover_position per blind, so blinds
+    sharing a proxy fight for its connection slots. Here blinds already
+    within their move tolerance are skipped without connecting, and the
+    rest are moved longest first under the fleet concurrency limits.
+    """
+    snapshots = async_get_snapshots(hass)
+    await snapshots.async_load()
+    name = data["name"]
+    saved = snapshots.get(name)
+    if saved is None:
+        raise HomeAssistantError(f"restore_positions: no snapshot named {name}")
+    entity_ids = data.get("entity_ids") or list(saved)
+    unsaved = {
+        entity_id: {"success": False, "error": "not in snapshot", "proxy": None}
+        for entity_id in entity_ids
+        if entity_id not in saved
+    }
+    targets, missing = _resolve_entities(hass, [entity_id for entity_id in entity_ids if entity_id in saved])
+    missing.update(unsaved)
+
+    skipped = []
+    for entity_id, entity in list(targets.items()):
+        if entity._blind.is_at_position(saved[entity_id]):
+            entity._blind._connections_saved += 1
+            skipped.append(entity_id)
+            del targets[entity_id]
+
+    async def _move(entity: Tuiss) -> None:
+        await entity._async_move_to_position(
+            **{ATTR_POSITION: saved[entity.entity_id], "skip_battery_check": True, "wait": True}
+        )
+
+    outcome = await _async_fan_out_entities(
+        targets, missing, data, _move, move_target=lambda entity: saved[entity.entity_id]
+    )
+    _LOGGER.info(
+        "Restored snapshot %s: %s moved, %s already in place, %s failed in %ss",
+        name, outcome["succeeded"], len(skipped), outcome["failed"], outcome["wall_time"],
+    )
+    return {**outcome, "name": name, "skipped": skipped}
+
+
+async def _async_synchronized_positioning(target_entities: list[Tuiss], target_position) -> dict:
+    """Move blinds in two phases so they all start within a few milliseconds.
 
-async def async_action_get_blind_position(entity, service_call):
+    Phase one connects and arms every blind in parallel; the move commands
+    are held at a ``StartBarrier`` until the last blind is armed (or failed)
+    and then written together. Returns the measured start skew.
+    """
+    barrier = StartBarrier(entity._blind.blind_id for entity in target_entities)
+    predicted = max(
+        entity._blind.estimate_move_seconds(target_position(entity)) for entity in target_entities
+    )
+    started_at = loop_time()
+
+    async def _move(entity: Tuiss) -> None:
+        try:
+            await entity._async_move_to_position(
+                **{
+                    ATTR_POSITION: target_position(entity),
+                    "skip_battery_check": True,
+                    "start_barrier": barrier,
+                }
+            )
+        finally:
+            barrier.leave(entity._blind.blind_id)
+
+    results = await asyncio.gather(
+        *(_move(entity) for entity in target_entities), return_exceptions=True
+    )
+    failed = {}
+    for entity, res in zip(target_entities, results):
+        if isinstance(res, Exception):
+            _LOGGER.warning("Failed to set position for %s: %s", entity.entity_id, res)
+            failed[entity.entity_id] = str(res)
+
+    started = [
+        entity.entity_id for entity in target_entities if entity._blind.blind_id in barrier.sent_at
+    ]
+    _LOGGER.info(
+        "Synchronized start of %s blinds, start skew %s ms", len(started), barrier.skew_ms
+    )
+    return {
+        "synchronized": True,
+        "start_skew_ms": barrier.skew_ms,
+        "started": started,
+        "failed": failed,
+        "predicted_makespan": predicted,
+        "makespan": round(loop_time() - started_at, 3),
+    }
+
+
+def _resolve_entities(hass: HomeAssistant, entity_ids: list[str]) -> tuple[dict[str, Tuiss], dict]:
+    """Split entity ids into known cover entities and "not found" results."""
+    index = async_get_index(hass)
+    targets = {}
+    missing = {}
+    for entity_id in entity_ids:
+        entity = index.entity(entity_id)
+        if entity:
+            targets[entity_id] = entity
+        else:
+            _LOGGER.warning("Entity %s not found for fleet operation.", entity_id)
+            missing[entity_id] = {"success": False, "error": "entity not found", "proxy": None}
+    return targets, missing
+
+
+async def _async_fan_out_entities(
+    targets: dict[str, Tuiss],
+    missing: dict[str, dict],
+    data,
+    operation,
+    move_target=None,
+) -> dict:
+    """Fan ``operation`` out over cover entities.
+
+    For moves, ``move_target`` returns each entity's target position; the
+    blinds are then started longest move first and the response carries
+    the predicted makespan and each blind's predicted duration.
+    """
+    concurrency = data.get("concurrency", DEFAULT_FLEET_CONCURRENCY)
+    slots_per_proxy = data.get("slots_per_proxy", DEFAULT_SLOTS_PER_PROXY)
+    proxies = {label: entity._blind.proxy_source for label, entity in targets.items()}
+    predicted = None
+    if move_target is not None:
+        durations = {
+            label: entity._blind.estimate_move_seconds(move_target(entity))
+            for label, entity in targets.items()
+        }
+        order, predicted = plan_longest_first(
+            durations, proxies, concurrency=concurrency, slots_per_proxy=slots_per_proxy
+        )
+        targets = {label: targets[label] for label in order}
+
+    outcome = await async_fan_out(
+        targets,
+        operation,
+        concurrency=concurrency,
+        slots_per_proxy=slots_per_proxy,
+        proxy_of=lambda entity: proxies[entity.entity_id],
+    )
+    if move_target is not None:
+        for label, result in outcome["results"].items():
+            result["predicted_duration"] = durations[label]
+        outcome["predicted_makespan"] = predicted
+    outcome["results"].update(missing)
+    outcome["failed"] += len(missing)
+    return outcome
+
+
+def _fleet_move_target(operation: str, data):
+    """Return the target-position function for fleet moves, or None for other operations."""
+    match operation:
+        case "open":
+            return lambda entity: 100
+        case "close":
+            return lambda entity: 0
+        case "set_position":
+            return lambda entity: data["position"]
+    return None
+
+
+async def _async_run_fleet_operation(entity: Tuiss, operation: str, data) -> Any:
+    """Run a single fleet operation on one cover entity and return its result."""
+    blind = entity._blind
+    match operation:
+        case "open":
+            await entity.async_open_cover(wait=True)
+        case "close":
+            await entity.async_close_cover(wait=True)
+        case "set_position":
+            await entity._async_move_to_position(**{ATTR_POSITION: data["position"], "wait": True})
+        case "get_position":
+            await blind.get_blind_position()
+            entity.schedule_update_ha_state()
+            return {"position": blind.current_position, **blind.op_stats}
+        case "get_battery":
+            await blind.get_battery_status()
+            return {"battery_low": blind._battery_status, **blind.op_stats}
+        case "set_speed":
+            await _async_apply_blind_speed(entity, data["speed"])
+            return {"speed": data["speed"]}
+        case "add_timer":
+            return {"timer_id": await blind.async_add_timer(data["days"], str(data["time"]), data["position"])}
+        case "delete_timer":
+            time_key = normalize_time(data["time"])
+            remaining = []
+            for timer in blind.timers.values():
+                if normalize_time(timer["time"]) != time_key:
+                    remaining.append(timer)
+                elif "days" in data:
+                    # Only drop the requested days; the timer goes when none are left
+                    days = [day for day in timer["days"] if day not in data["days"]]
+                    if days:
+                        remaining.append({**timer, "days": days})
+            return await blind.async_sync_timers(remaining, read_back=False)
+        case "sync_timers":
+            return await blind.async_sync_timers()
+        case "apply_preset":
+            await blind.async_apply_preset(data["preset"])
+    return {"position": blind.current_position}
+
+
+async def async_action_get_blind_position(entity, service_call) -> dict:
     """Get the blind position when called by service."""
     await entity._blind.get_blind_position()
     entity.schedule_update_ha_state()
+    return {"position": entity._blind.current_position, **entity._blind.op_stats}
 
 
-async def async_action_set_blind_position(entity, service_call):
+async def async_action_set_blind_position(entity, service_call) -> dict:
     """Set the blind position with decimal precision."""
     position = service_call.data["position"]
-    await entity.async_set_cover_position(**{ATTR_POSITION: position})
+    kwargs = {ATTR_POSITION: position}
+    if "wait" in service_call.data:
+        kwargs["wait"] = service_call.data["wait"]
+    if not await entity._async_debounce(position):
+        return {"debounced": True, "position": entity._blind.current_position}
+    await entity._async_move_to_position(**kwargs)
+    return {
+        "position": entity._blind.current_position,
+        "moving": entity._blind._moving != 0,
+        **entity._blind.op_stats,
+    }
+
+
+async def async_action_wait_for_completion(entity, service_call) -> dict:
+    """Wait for a move running in the background and report where the blind ended up."""
+    completed = await entity._blind.async_wait_for_move(service_call.data.get("timeout"))
+    return {
+        "completed": completed,
+        "position": entity._blind.current_position,
+        "moving": entity._blind._moving != 0,
+    }
 
 
 async def async_action_add_timer(entity, service_call):
@@ -237,9 +704,31 @@ async def async_action_add_timer(entity, service_call):
     
     await entity._blind.async_add_timer(days, time, position)
 
+async def async_action_sync_timers(entity, service_call):
+    """Reconcile the blind's firmware timers with the requested set."""
+    timers = service_call.data.get("timers")
+    if timers is not None:
+        timers = [
+            {"days": t["days"], "time": str(t["time"]), "position": t["position"]}
+            for t in timers
+        ]
+    result = await entity._blind.async_sync_timers(timers)
+    _LOGGER.info(
+        "%s: Timer sync deleted %s, added %s. Slots used: %s of %s",
+        entity._blind.name,
+        result["deleted"],
+        result["added"],
+        result["slots_used"],
+        result["slots_max"],
+    )
+
 async def async_action_set_blind_speed(entity, service_call):
     """Set the blind speed."""
-    speed = service_call.data["speed"]
+    await _async_apply_blind_speed(entity, service_call.data["speed"])
+
+
+async def _async_apply_blind_speed(entity, speed: str) -> None:
+    """Send the speed to the blind and persist it in the entry options."""
     entity._blind._blind_speed = speed
     await entity._blind.set_speed()
 
@@ -271,6 +760,13 @@ class Tuiss(CoverEntity, RestoreEntity):
         self._blind._battery_check_days = config.options.get(
             OPT_BATTERY_CHECK_DAYS, DEFAULT_BATTERY_CHECK_DAYS
         )
+        self._blind._move_tolerance = config.options.get(
+            OPT_MOVE_TOLERANCE, DEFAULT_MOVE_TOLERANCE
+        )
+        # Slider debouncing: bumped by every position request so only the last
+        # one inside the quiet period is sent; counts the requests it absorbed.
+        self._move_generation = 0
+        self._debounced_moves = 0
 
     @property
     def state(self):
@@ -320,6 +816,9 @@ class Tuiss(CoverEntity, RestoreEntity):
             ATTR_TRAVERSAL_SPEED: self._blind._attr_traversal_speed,
             ATTR_MAC_ADDRESS: self._attr_mac_address,
             "timers": list(self._blind.timers.values()),
+            "debounced_moves": self._debounced_moves,
+            "position_confidence": self._blind.position_confidence,
+            "connections_saved": self._blind._connections_saved,
         }
 
     @property
@@ -366,6 +865,7 @@ class Tuiss(CoverEntity, RestoreEntity):
             self._blind._current_cover_position = float(
                 last_state.attributes.get(ATTR_CURRENT_POSITION)
             )
+            self._blind.mark_position("restored")
         if last_state and last_state.attributes.get(ATTR_TRAVERSAL_SPEED) is not None:
             self._blind._attr_traversal_speed = last_state.attributes.get(ATTR_TRAVERSAL_SPEED)
         
@@ -377,10 +877,21 @@ class Tuiss(CoverEntity, RestoreEntity):
         self._blind.remove_callback(self.update_state)
 
 
+    def _wait_for_move(self, kwargs: dict) -> bool:
+        """Return whether a move should hold the call until the blind stops."""
+        if "wait" in kwargs:
+            return kwargs["wait"]
+        if kwargs.get("start_barrier") is not None:
+            return True
+        return self.config_entry.options.get(OPT_WAIT_FOR_MOVE, DEFAULT_WAIT_FOR_MOVE)
+
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
+        self._move_generation += 1  # supersedes a pending slider position
         try:
-            await self._blind.async_move_cover(movement_direction=1, target_position=0)
+            await self._blind.async_move_cover(
+                movement_direction=1, target_position=0, wait=self._wait_for_move(kwargs)
+            )
         except (ConnectionTimeout, DeviceNotFound) as e:
             _LOGGER.debug("%s failed to open with error %s.", self._attr_name, e)
             # Use translation placeholder so the frontend can localise the message
@@ -395,8 +906,11 @@ class Tuiss(CoverEntity, RestoreEntity):
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
+        self._move_generation += 1  # supersedes a pending slider position
         try:
-            await self._blind.async_move_cover(movement_direction=-1, target_position=100)
+            await self._blind.async_move_cover(
+                movement_direction=-1, target_position=100, wait=self._wait_for_move(kwargs)
+            )
         except (ConnectionTimeout, DeviceNotFound) as e:
             _LOGGER.debug("%s failed to close with error %s.", self._attr_name, e)
             # Use translation placeholder so the frontend can localise the message
@@ -411,7 +925,35 @@ class Tuiss(CoverEntity, RestoreEntity):
 
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
-        """Set the cover position."""
+        """Set the cover position.
+
+        Dragging a dashboard slider sends a request for every step. Requests
+        are held for the configured quiet period and only the last one is
+        sent. Group moves call ``_async_move_to_position`` directly.
+        """
+        if await self._async_debounce(kwargs[ATTR_POSITION]):
+            await self._async_move_to_position(**kwargs)
+
+    async def _async_debounce(self, position: float) -> bool:
+        """Wait out the quiet period; return False if a newer request superseded this one."""
+        self._move_generation += 1
+        generation = self._move_generation
+        quiet_period = float(
+            self.config_entry.options.get(OPT_MOVE_DEBOUNCE, DEFAULT_MOVE_DEBOUNCE) or 0
+        )
+        if quiet_period > 0:
+            await asyncio.sleep(quiet_period)
+            if generation != self._move_generation:
+                self._debounced_moves += 1
+                _LOGGER.debug(
+                    "%s: Position %s superseded within %ss, not sent (%s absorbed)",
+                    self.name, position, quiet_period, self._debounced_moves,
+                )
+                return False
+        return True
+
+    async def _async_move_to_position(self, **kwargs: Any) -> None:
+        """Send a set-position request to the blind."""
         if self._blind._current_cover_position is None:
             self._blind._current_cover_position = 0
 
@@ -427,6 +969,8 @@ class Tuiss(CoverEntity, RestoreEntity):
                 movement_direction=movement_direction,
                 target_position= 100 - kwargs[ATTR_POSITION],
                 skip_battery_check=skip_battery_check,
+                start_barrier=kwargs.get("start_barrier"),
+                wait=self._wait_for_move(kwargs),
             )
         except (ConnectionTimeout, DeviceNotFound) as e:
             _LOGGER.debug("%s failed to set position with error %s.", self._attr_name, e)
@@ -444,6 +988,7 @@ class Tuiss(CoverEntity, RestoreEntity):
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
+        self._move_generation += 1  # drop a pending slider position
         _LOGGER.debug("%s: Entering async_stop_cover. is_stopping: %s", self.name, self._blind._is_stopping)
         self._blind._is_stopping = True
         try:
@@ -0,0 +1,70 @@
+"""Diagnostics support for Tuiss2HA."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_BLIND_HOST, DOMAIN
+from .hub import TuissBlind
+
+TO_REDACT = {CONF_ADDRESS, CONF_BLIND_HOST, "blind_id", "mac_address", "unique_id"}
+REDACTED = "**REDACTED**"
+# MAC addresses also turn up inside error messages and proxy names
+MAC_PATTERN = re.compile(r"(?:[0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}")
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hub = hass.data[DOMAIN][entry.entry_id]
+    data = {
+        "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+        "blinds": [_blind_diagnostics(blind) for blind in hub.blinds],
+    }
+    return _redact_macs(async_redact_data(data, TO_REDACT))
+
+
+def _blind_diagnostics(blind: TuissBlind) -> dict[str, Any]:
+    """Return the state, timings and recent BLE frames of a blind."""
+    return {
+        "blind_id": blind.blind_id,
+        "model": blind.model,
+        "rssi": blind.rssi,
+        "proxy": blind.proxy_source,
+        "connected": bool(blind._client and blind._client.is_connected),
+        "locked": blind._locked,
+        "moving": blind._moving,
+        "position": blind.current_position,
+        "position_source": blind._position_source,
+        "position_confidence": blind.position_confidence,
+        "traversal_speed": blind._attr_traversal_speed,
+        "blind_speed": blind._blind_speed,
+        "restart_attempts": blind._restart_attempts,
+        "last_connection_error": blind._last_connection_error,
+        "last_battery_check": blind._last_battery_check.isoformat()
+        if blind._last_battery_check
+        else None,
+        "timer_slots": blind.timer_slot_usage,
+        "presets": len(blind.presets),
+        "last_operation": blind.op_stats,
+        "metrics": blind.metrics,
+        "frames": blind.frame_log,
+    }
+
+
+def _redact_macs(value: Any) -> Any:
+    """Replace MAC addresses in every string, including dict keys."""
+    if isinstance(value, str):
+        return MAC_PATTERN.sub(REDACTED, value)
+    if isinstance(value, dict):
+        return {_redact_macs(key): _redact_macs(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_redact_macs(item) for item in value]
+    return value
@@ -0,0 +1,149 @@
+"""Integration-wide lookup of blinds and entities for the services.
+
+Services are called with entity_ids, but act on blinds (presets, timers)
+or cover entities (moves, unlocking). ``TuissIndex`` answers both in one
+dictionary lookup each, instead of scanning the entity registry and every
+hub per call. It holds three maps:
+
+- blind_id -> blind, filled as config entries are set up and unloaded;
+- unique_id -> entity, for the entities services act on directly;
+- entity_id -> unique_id, seeded from the entity registry when an entry
+  is set up and kept current from its update events, so renamed and
+  removed entities resolve (or not) without a restart.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .hub import Hub, TuissBlind
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_INDEX = "index"
+TIMER_MARKER = "_timer_"
+
+
+def split_timer_unique_id(unique_id: str) -> tuple[str, str] | None:
+    """Return (blind_id, timer_id) for a timer sensor's unique_id, or None.
+
+    Timer ids are the numeric firmware slots, so ids such as the timer
+    slots sensor's are not taken for timers.
+    """
+    blind_id, marker, timer_id = unique_id.rpartition(TIMER_MARKER)
+    if not marker or not timer_id.isdigit():
+        return None
+    return blind_id, timer_id
+
+
+class TuissIndex:
+    """Map blind_ids, entity_ids and unique_ids to blinds and entities."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create an empty index for ``hass``."""
+        self._hass = hass
+        self.blinds: dict[str, TuissBlind] = {}
+        self.entities: dict[str, Any] = {}
+        self.unique_ids: dict[str, str] = {}
+        self._unsub_registry: Callable[[], None] | None = None
+
+    @callback
+    def async_add_hub(self, config_entry_id: str, hub: Hub) -> None:
+        """Index a hub's blinds and the registry entries of its config entry."""
+        for blind in hub.blinds:
+            self.blinds[blind.blind_id] = blind
+        registry = er.async_get(self._hass)
+        for entry in er.async_entries_for_config_entry(registry, config_entry_id):
+            self.unique_ids[entry.entity_id] = entry.unique_id
+
+    @callback
+    def async_remove_hub(self, hub: Hub) -> None:
+        """Forget a hub's blinds and their entities."""
+        for blind in hub.blinds:
+            if self.blinds.get(blind.blind_id) is blind:
+                del self.blinds[blind.blind_id]
+            for unique_id, entity in list(self.entities.items()):
+                if getattr(entity, "_blind", None) is blind:
+                    del self.entities[unique_id]
+
+    @callback
+    def async_add_entities(self, entities) -> None:
+        """Index entities by unique_id so services can reach them."""
+        for entity in entities:
+            self.entities[entity.unique_id] = entity
+
+    def unique_id(self, entity_id: str) -> str | None:
+        """Return the unique_id of one of this integration's entities."""
+        return self.unique_ids.get(entity_id)
+
+    def entity(self, entity_id: str) -> Any | None:
+        """Return the indexed entity an entity_id refers to, or None."""
+        unique_id = self.unique_ids.get(entity_id)
+        return self.entities.get(unique_id) if unique_id is not None else None
+
+    def blind(self, entity_id: str, suffixes: tuple[str, ...]) -> TuissBlind | None:
+        """Return the blind behind an entity whose unique_id ends in one of ``suffixes``."""
+        unique_id = self.unique_ids.get(entity_id) or ""
+        for suffix in suffixes:
+            if unique_id.endswith(suffix):
+                return self.blinds.get(unique_id[: -len(suffix)])
+        return None
+
+    def timer(self, entity_id: str) -> tuple[TuissBlind | None, str] | None:
+        """Return (blind, timer_id) for a timer sensor, or None if it is not one."""
+        timer = split_timer_unique_id(self.unique_ids.get(entity_id) or "")
+        if timer is None:
+            return None
+        blind_id, timer_id = timer
+        return self.blinds.get(blind_id), timer_id
+
+    @callback
+    def async_registry_updated(self, event: Event) -> None:
+        """Keep entity_id -> unique_id current as the entity registry changes."""
+        action = event.data["action"]
+        entity_id = event.data["entity_id"]
+        if action == "remove":
+            self.unique_ids.pop(entity_id, None)
+            return
+        if action == "update":
+            old_entity_id = event.data.get("old_entity_id")
+            if old_entity_id is not None:
+                self.unique_ids.pop(old_entity_id, None)
+        entry = er.async_get(self._hass).async_get(entity_id)
+        if entry is None or entry.platform != DOMAIN:
+            return
+        _LOGGER.debug("Indexing %s as %s", entity_id, entry.unique_id)
+        self.unique_ids[entity_id] = entry.unique_id
+
+
+@callback
+def async_get_index(hass: HomeAssistant) -> TuissIndex:
+    """Return the integration's index, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index = domain_data.get(DATA_INDEX)
+    if index is None:
+        index = domain_data[DATA_INDEX] = TuissIndex(hass)
+        index._unsub_registry = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, index.async_registry_updated
+        )
+    return index
+
+
+@callback
+def async_unload_index(hass: HomeAssistant) -> None:
+    """Drop the index and its registry listener once no blinds are left."""
+    domain_data = hass.data.get(DOMAIN, {})
+    index = domain_data.get(DATA_INDEX)
+    if index is None or index.blinds:
+        return
+    if index._unsub_registry is not None:
+        index._unsub_registry()
+    del domain_data[DATA_INDEX]
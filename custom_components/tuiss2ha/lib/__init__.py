@@ -0,0 +1 @@
+"""Libraries bundled with the integration that do not depend on Home Assistant."""
@@ -0,0 +1,23 @@
+"""Headless core of the Tuiss2HA integration.
+
+Protocol, BLE session and movement model for Tuiss blinds, built on
+asyncio and bleak only. Nothing in this package imports Home Assistant
+or anything outside it, so it can be used, tested and profiled on its
+own by putting ``custom_components/tuiss2ha/lib`` on ``sys.path`` and
+importing ``tuiss``. The integration adapts it to Home Assistant in
+``hub.py``.
+"""
+
+from .blind import Blind, MemoryStore
+from .const import BlindError, ConnectionTimeout, DeviceNotFound, NoConnectableBluetoothAdapter
+from .metrics import METRICS
+
+__all__ = [
+    "METRICS",
+    "Blind",
+    "BlindError",
+    "ConnectionTimeout",
+    "DeviceNotFound",
+    "MemoryStore",
+    "NoConnectableBluetoothAdapter",
+]
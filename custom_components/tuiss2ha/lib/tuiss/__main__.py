@@ -0,0 +1,5 @@
+"""Run the Tuiss command line: ``python -m tuiss``."""
+
+from .cli import main
+
+raise SystemExit(main())
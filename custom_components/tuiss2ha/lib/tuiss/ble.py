@@ -0,0 +1,21 @@
+"""The bleak and bleak_retry_connector names the blind uses.
+
+Importing bleak loads its whole backend stack, which costs more than the
+rest of the package put together. ``blind`` only imports this module
+when it first needs it (connecting, or handling a BLE error), so the
+protocol and the entity layers on top load without bleak.
+"""
+
+from bleak.exc import BleakError
+from bleak_retry_connector import (
+    BLEAK_RETRY_EXCEPTIONS,
+    BleakClientWithServiceCache,
+    establish_connection,
+)
+
+__all__ = [
+    "BLEAK_RETRY_EXCEPTIONS",
+    "BleakClientWithServiceCache",
+    "BleakError",
+    "establish_connection",
+]
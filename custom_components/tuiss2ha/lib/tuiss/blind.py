@@ -0,0 +1,1532 @@
+"""Session and movement model of a Tuiss blind, independent of Home Assistant."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import importlib
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from .capture import BtsnoopWriter
+from .clock import Clock, loop_time
+from .const import (
+    BLIND_NOTIFY_CHARACTERISTIC,
+    TRAVERSAL_UPDATE_THRESHOLD,
+    DEFAULT_TRAVERSAL_SPEED,
+    MOVE_CONNECTION_OVERHEAD,
+    UUID,
+    CONNECTION_MESSAGE,
+    INITIALIZATION_MESSAGE,
+    DEFAULT_RESTART_ATTEMPTS,
+    BlindError,
+    DeviceNotFound,
+    ConnectionTimeout,
+    NoConnectableBluetoothAdapter,
+    TIMEOUT_SECONDS,
+    CMD_HEARTBEAT,
+    CMD_STOP,
+    CMD_BATTERY_STATUS,
+    CMD_SPEED_STANDARD,
+    CMD_SPEED_COMFORT,
+    CMD_SPEED_SLOW,
+    CMD_LIMITS_INIT_2,
+    CMD_LIMITS_STEP_UP,
+    CMD_LIMITS_STEP_DOWN,
+    CMD_LIMITS_MOVE_UP,
+    CMD_LIMITS_MOVE_DOWN,
+    CMD_LIMITS_SET,
+    CMD_TIMER_REQUEST,
+    CMD_TIMER_RESET,
+    CMD_BLIND_REACTIVATE,
+    MAX_TIMERS,
+    FRAME_LOG_SIZE,
+    OPCODE_STATUS,
+    DEFAULT_MOVE_TOLERANCE,
+    MIN_SKIP_CONFIDENCE,
+    POSITION_CONFIDENCE_HALF_LIFE,
+    POSITION_SOURCE_CONFIDENCE,
+    SKIP_TRUSTED_SOURCES,
+)
+from .fleet import StartBarrier
+from .metrics import METRICS, BlindLogger
+from .protocol import (
+    decode_battery,
+    decode_position,
+    decode_progress,
+    decode_timer_slot,
+    position_command,
+    timer_command,
+    timer_delete_command,
+    timestamp_command,
+)
+from .schedule import decode_timer_record, diff_timers, pack_timers, timer_key
+
+if TYPE_CHECKING:
+    from bleak.backends.characteristic import BleakGATTCharacteristic
+    from bleak.backends.device import BLEDevice
+    from bleak_retry_connector import BleakClientWithServiceCache
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _ble() -> ModuleType:
+    """Return the bleak layer (``ble.py``), importing bleak on first use."""
+    return importlib.import_module(".ble", __package__)
+
+
+class MemoryStore:
+    """Keep stored data in memory; the default store of a headless blind."""
+
+    def __init__(self) -> None:
+        self._data: Any = None
+
+    async def async_load(self) -> Any:
+        """Return the stored data, or None if nothing was saved."""
+        return self._data
+
+    async def async_save(self, data: Any) -> None:
+        """Replace the stored data."""
+        self._data = data
+
+
+class Blind:
+    """A Tuiss blind: BLE session, commands and movement model.
+
+    Runs on any asyncio loop with only bleak. Everything that depends on
+    the host application goes through the small hook methods grouped under
+    ADAPTER HOOKS (finding the device, storage, tasks, change signals and
+    errors); an integration subclasses ``Blind`` and overrides them.
+    """
+
+    # Directory captures are written to; see capture_path
+    capture_dir = "captures"
+
+    def __init__(self, host: str, name: str, ble_device: BLEDevice | None = None) -> None:
+        """Init tuiss blind."""
+        self._id = host  # also the host address
+        self.host = host
+        self.name = name
+        # Source of every duration this blind measures; see clock.py
+        self.clock: Clock = loop_time
+        self._log = BlindLogger(_LOGGER, name, clock=lambda: self.clock())
+        self._ble_device = ble_device if ble_device is not None else self._find_device()
+        self.model = self._ble_device.name if self._ble_device else None
+        self._rssi: int | None = None
+        self._client: BleakClientWithServiceCache | None = None
+        self._callbacks = set()
+        self._battery_status = False
+        self._moving = 0
+        self._is_stopping = False
+        self._stopped_event = asyncio.Event()
+        self._current_cover_position: float | None = None
+        # Where the current position came from and when (clock() seconds)
+        self._position_source: str | None = None
+        self._position_updated_at: float | None = None
+        self._move_tolerance: float = DEFAULT_MOVE_TOLERANCE
+        self._connections_saved = 0
+        self._desired_position: int | None = None
+        self._desired_orientation = False
+        self._restart_attempts: int | None = None
+        self._position_on_restart: bool | None = None
+        self._blind_speed: str | None = None
+        self._locked = False
+        self._attr_traversal_speed: float | None = None
+        self._last_connection_error: str | None = None  # For logging when connection fails
+        # Battery check configuration
+        self._battery_check_days: int = 0
+        self._last_battery_check: datetime.datetime | None = None
+        self.timers = {}
+        # Where the slot usage figure came from: HA's own copy until a
+        # firmware read-back has been done.
+        self._timer_slot_source = "home_assistant"
+        self._timer_slots_read: datetime.datetime | None = None
+        self._store = self._create_store("schedules")
+        self._limits_heartbeat_task: asyncio.Task | None = None
+        self._move_task: asyncio.Task | None = None
+        # Timings of the last connection-based operation, returned by services
+        self._op_stats: dict[str, Any] = {}
+        # clock() times the current connection was made and the move lock taken
+        self._connected_at: float | None = None
+        self._locked_at: float | None = None
+        # Ring buffer of (wall time, clock() time, kind, payload) for diagnostics;
+        # frames are only formatted when the diagnostics are downloaded
+        self._frames: deque[tuple[float, float, str, Any]] = deque(maxlen=FRAME_LOG_SIZE)
+        # Opt-in btsnoop capture of the same frames
+        self._capture: BtsnoopWriter | None = None
+
+    @property
+    def blind_id(self) -> str:
+        """Return ID for blind."""
+        return self._id
+
+    @property
+    def rssi(self) -> int | None:
+        """Return the rssi for the blind."""
+        return self._rssi
+
+    @property
+    def current_position(self) -> float | None:
+        """Return the last observed cover position (0-100), or None if unknown."""
+        return self._current_cover_position
+
+    @property
+    def position_confidence(self) -> float:
+        """Return how far the current position can be trusted, from 0 to 1."""
+        if self._current_cover_position is None or self._position_updated_at is None:
+            return 0.0
+        age_hours = (self.clock() - self._position_updated_at) / 3600
+        base = POSITION_SOURCE_CONFIDENCE.get(self._position_source, 0.0)
+        return round(base * 0.5 ** (age_hours / POSITION_CONFIDENCE_HALF_LIFE), 3)
+
+    def mark_position(self, source: str) -> None:
+        """Record where the current position came from."""
+        self._position_source = source
+        self._position_updated_at = self.clock()
+
+    def is_at_position(self, position: float) -> bool:
+        """Return True if the blind is confidently within tolerance of ``position`` (0-100).
+
+        Always False with a tolerance of 0, which disables skipping.
+        """
+        if self._move_tolerance <= 0 or self._moving != 0 or self._current_cover_position is None:
+            return False
+        if self._position_source not in SKIP_TRUSTED_SOURCES:
+            return False
+        if self.position_confidence < MIN_SKIP_CONFIDENCE:
+            return False
+        # The epsilon only absorbs float rounding; there is no slack beyond the tolerance
+        return abs(self._current_cover_position - position) <= self._move_tolerance + 1e-6
+
+    @property
+    def op_stats(self) -> dict[str, Any]:
+        """Return timings of the last operation: connection time, command RTT, retries and proxy."""
+        return {**self._op_stats, "proxy": self.proxy_source}
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the counters and latency histograms recorded for this blind."""
+        return METRICS.snapshot(self.blind_id)
+
+    def _count(self, name: str, value: float = 1) -> None:
+        """Add to a counter for this blind and its proxy."""
+        METRICS.increment(self.blind_id, self.proxy_source, name, value)
+
+    def _observe(self, name: str, seconds: float) -> None:
+        """Record a duration for this blind and its proxy."""
+        METRICS.observe(self.blind_id, self.proxy_source, name, seconds)
+
+    def _log_frame(self, kind: str, payload: Any) -> None:
+        """Append a TX/RX frame or a connection event to the ring buffer."""
+        now = time.time()
+        self._frames.append((now, self.clock(), kind, payload))
+        if self._capture is not None and kind != "event":
+            self._capture.record(kind, payload, now)
+
+    @property
+    def capture_path(self) -> str:
+        """Return the btsnoop file this blind's traffic is captured to."""
+        return os.path.join(self.capture_dir, f"{self.host.replace(':', '').lower()}.btsnoop")
+
+    async def async_set_capture(self, enabled: bool) -> None:
+        """Start or stop capturing this blind's BLE traffic to a btsnoop file."""
+        if enabled and self._capture is None:
+            _LOGGER.debug("%s: Capturing BLE traffic to %s", self.name, self.capture_path)
+            self._capture = BtsnoopWriter(self.capture_path)
+        elif not enabled and self._capture is not None:
+            capture, self._capture = self._capture, None
+            await self._run_in_executor(capture.flush)
+
+    @property
+    def frame_log(self) -> list[dict[str, Any]]:
+        """Return the recent frames and connection events, oldest first.
+
+        Received frames carry the latency since the last frame sent.
+        """
+        entries = []
+        last_tx = None
+        for wall, mono, kind, payload in self._frames:
+            entry: dict[str, Any] = {
+                "time": datetime.datetime.fromtimestamp(wall, datetime.timezone.utc).isoformat(),
+                "direction": kind,
+            }
+            if kind in ("tx", "rx"):
+                entry["opcode"] = f"{payload[4]:02x}" if len(payload) > 4 else None
+                entry["data"] = payload.hex()
+                if kind == "tx":
+                    last_tx = mono
+                elif last_tx is not None:
+                    entry["latency_ms"] = round((mono - last_tx) * 1000, 1)
+            else:
+                entry["event"] = payload
+            entries.append(entry)
+        return entries
+
+    def _begin_op(self) -> None:
+        """Reset the operation timings before a new connection-based operation."""
+        self._op_stats = {"connection_time": 0.0, "command_rtt": None, "retries": 0}
+
+    def estimate_move_seconds(self, position: float) -> float:
+        """Estimate how long a move to ``position`` (0-100) holds a connection.
+
+        Uses the learned traversal speed and the last known position; an
+        unknown position is treated as a full-length move.
+        """
+        speed = self._attr_traversal_speed or DEFAULT_TRAVERSAL_SPEED
+        if self._current_cover_position is None:
+            distance = 100.0
+        else:
+            distance = abs(position - self._current_cover_position)
+        return round(MOVE_CONNECTION_OVERHEAD + distance / speed, 2)
+
+    def set_rssi(self, rssi: int) -> None:
+        """Update the RSSI for the blind."""
+        if self._rssi == rssi:
+            return
+        self._rssi = rssi
+        self.publish_updates()
+
+    def publish_updates(self) -> None:
+        """Schedule call all registered callbacks."""
+        loop = asyncio.get_running_loop()
+        for callback in self._callbacks:
+            loop.call_soon(callback)
+
+    def register_callback(self, callback) -> None:
+        """Register callback, called when blind changes state."""
+        self._callbacks.add(callback)
+
+    def remove_callback(self, callback) -> None:
+        """Remove previously registered callback."""
+        self._callbacks.discard(callback)
+        
+
+    ##################################################################################################
+    ## ADAPTER HOOKS #################################################################################
+    ##################################################################################################
+
+    @property
+    def proxy_source(self) -> str | None:
+        """Return the adapter or proxy that last heard the blind, if known."""
+        return None
+
+    def _find_device(self) -> BLEDevice | None:
+        """Look the blind up again when it was not found at start-up."""
+        return None
+
+    async def _connect_client(self, device: BLEDevice) -> BleakClientWithServiceCache:
+        """Open a GATT connection to ``device``."""
+        ble = _ble()
+        return await ble.establish_connection(
+            client_class=ble.BleakClientWithServiceCache,
+            device=device,
+            name=self.host,
+            use_services_cache=True,
+            max_attempts=self._restart_attempts,
+            ble_device_callback=lambda: device,
+        )
+
+    def _create_store(self, kind: str) -> Any:
+        """Return the store ``kind`` data (e.g. "schedules") is kept in."""
+        return MemoryStore()
+
+    def _create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Run ``coro`` in the background."""
+        return asyncio.get_running_loop().create_task(coro)
+
+    def _run_in_executor(self, func: Callable[[], Any]) -> asyncio.Future:
+        """Run blocking ``func`` off the event loop."""
+        return asyncio.get_running_loop().run_in_executor(None, func)
+
+    def _now(self) -> datetime.datetime:
+        """Return the current time, timezone aware."""
+        return datetime.datetime.now().astimezone()
+
+    def _timers_changed(self) -> None:
+        """Called after the timers have been loaded or saved."""
+
+    def _timer_added(self, timer_id: str) -> None:
+        """Called when a timer slot has been written."""
+
+    def _timer_removed(self, timer_id: str) -> None:
+        """Called when a timer slot has been erased."""
+
+    def _error(self, message: str, key: str | None = None, **placeholders: str) -> Exception:
+        """Return the exception to raise for a failed operation."""
+        return BlindError(message, key, **placeholders)
+
+    ##################################################################################################
+    ## CONNECTION METHODS ############################################################################
+    ##################################################################################################
+
+    # Attempt Connections
+    async def attempt_connection(self):
+        """Attempt to connect to the blind."""
+
+        #Set restart attempts if not set in options
+        rediscover_attempts = 0
+        _LOGGER.debug("%s: Number of attempts: %s", self.name, self._restart_attempts)
+        _LOGGER.debug("%s: Startup position check: %s",self.name, self._position_on_restart)
+        if self._restart_attempts is None:
+            self._restart_attempts = DEFAULT_RESTART_ATTEMPTS
+        connect_started = self.clock()
+
+        # check if the device not loaded at boot and retry a connection
+        while self._ble_device is None and rediscover_attempts < self._restart_attempts:
+            _LOGGER.debug("Unable to find device %s, attempting rediscovery", self.name)
+            self._ble_device = self._find_device()
+            rediscover_attempts += 1
+            if self._ble_device is None and rediscover_attempts < self._restart_attempts:
+                await asyncio.sleep(2)
+        if self._ble_device is None:
+            _LOGGER.error(
+                "Cannot find the device %s. Check your bluetooth adapters and proxies",
+                self.name,
+            )
+            raise DeviceNotFound(
+                f"{self.name}: Cannot find the device. Check your bluetooth adapters and proxies"
+            )
+
+        retry_count = 1
+        while retry_count <= self._restart_attempts:
+            _LOGGER.debug(
+                "%s %s: Attempting Connection to blind. Retry count: %d of %d",
+                self.name,
+                self._ble_device,
+                retry_count,
+                self._restart_attempts
+            )
+            await self.connect()
+
+            # If the client is connected, return early
+            if self._client and self._client.is_connected:
+                self._op_stats["connection_time"] = round(self.clock() - connect_started, 3)
+                self._op_stats["retries"] = retry_count - 1
+                return
+
+            retry_count += 1
+            if retry_count <= self._restart_attempts:
+                self._count("retries")
+                await asyncio.sleep(2)
+
+        # If we reach here, we have exceeded max retries - log the actual error at ERROR so it's visible
+        last_err = self._last_connection_error or "unknown (no error captured)"
+        _LOGGER.error(
+            "%s: Connection failed after %d attempts. Last error: %s",
+            self.name,
+            self._restart_attempts,
+            last_err,
+        )
+        # Give a clear error when user has only passive Bluetooth (e.g. Shelly)
+        if last_err and (
+            "passive-only" in last_err.lower()
+            or "no connectable bluetooth" in last_err.lower()
+        ):
+            raise NoConnectableBluetoothAdapter(
+                "No connectable Bluetooth adapter. Shelly and similar devices are passive-only. "
+                "You need an ESPHome Bluetooth proxy or a USB Bluetooth adapter to control Tuiss blinds."
+            )
+        raise ConnectionTimeout(f"{self.name}: Connection failed too many times [{self._restart_attempts}]")
+
+    # Connect
+    async def connect(self):
+        """Connect to the blind."""
+        assert self._ble_device is not None
+        device = self._ble_device
+        self._count("connect_attempts")
+        self._log_frame("event", "connect_attempt")
+        started = self.clock()
+        try:
+            self._client = await self._connect_client(device)
+            connected = self.clock()
+            self._observe("connect_latency", connected - started)
+            self._log_frame("event", "connected")
+            # send the maintain connection message
+            self._log_frame("tx", bytes.fromhex(CONNECTION_MESSAGE))
+            await self._client.write_gatt_char(UUID, bytes.fromhex(CONNECTION_MESSAGE))
+
+            # send the connection timestamp message
+            await self.send_timestamp()
+            self._connected_at = self.clock()
+            self._observe("handshake_time", self._connected_at - connected)
+    
+            _LOGGER.debug(
+                "%s: Connected. Current Position: %s. Current Moving: %s",
+                self.name,
+                self._current_cover_position,
+                self._moving,
+            )
+        except (_ble().BleakError, asyncio.TimeoutError) as e:
+            self._count("connect_failures")
+            self._log_frame("event", f"connect_error: {e}")
+            self._last_connection_error = f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: {e}"
+            _LOGGER.debug("Failed to connect to blind: %s", e)
+        except Exception as e:
+            self._count("connect_failures")
+            self._log_frame("event", f"connect_error: {type(e).__name__}: {e}")
+            self._last_connection_error = f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}: {type(e).__name__}: {e}"
+            _LOGGER.debug("%s: Unexpected error during connect: %s", self.name, e)
+
+    # Disconnect
+    async def disconnect(self):
+        """Disconnect from the blind."""
+
+        if self._limits_heartbeat_task:
+            self._limits_heartbeat_task.cancel()
+            self._limits_heartbeat_task = None
+
+        client = self._client
+        if not client:
+            _LOGGER.debug("%s: Already disconnected", self.name)
+            self._stopped_event.set()
+            return
+        _LOGGER.debug("%s: Disconnecting", self.name)
+        self._log_frame("event", "disconnect")
+        if self._connected_at is not None:
+            self._count("airtime_connected", self.clock() - self._connected_at)
+            self._connected_at = None
+        try:
+            try:
+                await client.stop_notify(BLIND_NOTIFY_CHARACTERISTIC)
+            except Exception as notify_ex:
+                # Characteristic might not exist or notifications not started
+                _LOGGER.debug("%s: Could not stop notifications: %s", self.name, notify_ex)
+            await client.disconnect()
+        except _ble().BLEAK_RETRY_EXCEPTIONS as ex:
+            _LOGGER.warning(
+                "%s: Error disconnecting: %s",
+                self.name,
+                ex,
+            )
+        else:
+            _LOGGER.debug("%s: Disconnect completed successfully", self.name)
+            _LOGGER.debug(
+                "%s: Disconnect. Current Position: %s. Current Moving: %s",
+                self.name,
+                self._current_cover_position,
+                self._moving,
+            )
+        finally:
+            self._stopped_event.set()
+            if self._capture is not None:
+                # Frames are buffered in memory; write them out off the event loop
+                try:
+                    await self._run_in_executor(self._capture.flush)
+                except OSError as ex:
+                    _LOGGER.warning("%s: Could not write the BLE capture: %s", self.name, ex)
+
+    async def wait_for_stop(self):
+        """Wait for the blind to stop moving."""
+        self._stopped_event.clear()
+        await self._stopped_event.wait()
+        
+    async def ensure_connected(self) -> None:
+        """Ensure the blind is connected before sending a command."""
+        if not self._client or not self._client.is_connected:
+            await self.attempt_connection()
+
+    ##################################################################################################
+    ## SET METHODS ###################################################################################
+    ##################################################################################################
+    async def set_position(self, userPercent, start_barrier: StartBarrier | None = None) -> None:
+        """Set the position of the blind converting from HA to Tuiss first.
+
+        With a ``start_barrier`` the blind is connected and armed, then the
+        move command is held until every blind in the group is armed too.
+        """
+
+        await self.ensure_connected()
+
+        assert self._client is not None
+        self._desired_position = 100 - userPercent
+        _LOGGER.debug(
+            "%s: Attempting to set position to: %s", self.name, self._desired_position
+        )
+        command = bytes.fromhex(self.hex_convert(userPercent))
+        try:
+            await self._client.start_notify(
+                BLIND_NOTIFY_CHARACTERISTIC, self.set_position_callback
+            )
+        except _ble().BleakError:
+            await self._client.stop_notify(BLIND_NOTIFY_CHARACTERISTIC)
+            await self._client.start_notify(
+                BLIND_NOTIFY_CHARACTERISTIC, self.set_position_callback
+            )
+        if start_barrier is not None:
+            await start_barrier.async_wait(self.blind_id)
+        sent_at = self.clock()
+        await self.send_command(UUID, command)  # send the command
+        self._op_stats["command_rtt"] = round(self.clock() - sent_at, 3)
+        self._observe("command_rtt", self.clock() - sent_at)
+        if start_barrier is not None:
+            start_barrier.mark_sent(self.blind_id)
+
+    async def stop(self) -> None:
+        """Stop the blind at current position."""
+        _LOGGER.debug("%s: Attempting to stop the blind.", self.name)
+        command = bytes.fromhex(CMD_STOP)
+
+        # skip if the blind is not moving
+        if self._moving == 0:
+            return
+
+        # try to connect to blind if not connected, shouldnt really be necessary if the blind is already moving
+        await self.ensure_connected()
+
+        # send the stop command
+        if self._client and self._client.is_connected:
+            await self.send_command(UUID, command)
+        if self._client and self._client.is_connected:
+            await self.get_blind_position()
+
+
+
+    async def set_speed(self) -> None:
+        """Set the speed for supported blind types"""
+        _LOGGER.debug("%s: Attempting to set the blind speed", self.name)
+        match self._blind_speed:
+            case "Standard":
+                command = bytes.fromhex(CMD_SPEED_STANDARD)
+            case "Comfort":
+                command = bytes.fromhex(CMD_SPEED_COMFORT)
+            case "Slow":
+                command = bytes.fromhex(CMD_SPEED_SLOW)
+            case _:
+                # Defensive: caller should validate, but never let an unset
+                # or unrecognised speed value raise UnboundLocalError below.
+                _LOGGER.warning(
+                    "%s: Cannot set speed — unrecognised value %r",
+                    self.name,
+                    self._blind_speed,
+                )
+                return
+
+
+        await self.ensure_connected()
+        
+        # send the command
+        try:
+            if self._client and self._client.is_connected:
+                await self.send_command(UUID, command)
+        except (_ble().BleakError, RuntimeError) as e:
+            _LOGGER.debug("%s: Unable to set the speed: %s", self.name, e)
+            await self.disconnect()
+            raise RuntimeError(
+                "Unable to set the speed. Check has enough battery and within bluetooth range or that blind supports speed changes"
+            ) from e
+        finally:
+            # Always disconnect after set_speed operation
+            await self.disconnect()
+        
+
+    ##################################################################################################
+    ## GET METHODS ###################################################################################
+    ##################################################################################################
+
+    async def get_from_blind(self, command, callback) -> None:
+        """Get the battery state from the blind as good or bad."""
+
+        # connect to the blind first
+        self._begin_op()
+        await self.ensure_connected()
+
+        assert self._client is not None
+        notify_started = False
+        try:
+            await self._client.start_notify(BLIND_NOTIFY_CHARACTERISTIC, callback)
+            notify_started = True
+        except _ble().BleakError as e:
+            _LOGGER.debug("%s: Failed to start notify: %s. Attempting to stop and restart.", self.name, e)
+            try:
+                # when need to overwrite the existing notification
+                await self._client.stop_notify(BLIND_NOTIFY_CHARACTERISTIC)
+                await self._client.start_notify(BLIND_NOTIFY_CHARACTERISTIC, callback)
+                notify_started = True
+            except _ble().BleakError as retry_error:
+                _LOGGER.warning("%s: Could not establish notifications: %s", self.name, retry_error)
+                # Characteristic may not exist or device disconnected; ensure cleanup
+                await self.disconnect()
+                return
+
+        # Only send command if we successfully started notifications and are still connected
+        if notify_started and self._client and self._client.is_connected:
+            try:
+                sent_at = self.clock()
+                await self.send_command(UUID, command)
+            except Exception as e:
+                _LOGGER.error("%s: Error sending command during get_from_blind: %s", self.name, e)
+                await self.disconnect()
+                return
+
+            # Wait for the response/callback to complete with timeout to prevent hanging
+            if self._client:
+                try:
+                    await asyncio.wait_for(self.wait_for_stop(), timeout=10.0)
+                    self._op_stats["command_rtt"] = round(self.clock() - sent_at, 3)
+                    self._observe("command_rtt", self.clock() - sent_at)
+                except asyncio.TimeoutError:
+                    self._count("timeouts")
+                    self._log_frame("event", "timeout")
+                    _LOGGER.warning("%s: Timeout waiting for response in get_from_blind", self.name)
+                finally:
+                    await self.disconnect()
+        else:
+            # If we couldn't start notify, ensure we disconnect
+            if not notify_started:
+                await self.disconnect()
+                    
+
+    async def get_battery_status(self) -> None:
+        """Get the battery state from the blind as good or bad."""
+        command = bytes.fromhex(CMD_BATTERY_STATUS)
+        await self.get_from_blind(command, self.battery_callback)
+
+
+    async def get_blind_position(self) -> None:
+        """Get the current position of the blind."""
+        command = bytes.fromhex(INITIALIZATION_MESSAGE)
+        await self.get_from_blind(command, self.position_callback)
+
+    ##################################################################################################
+    ## LIMIT CONFIGURATION METHODS ##################################################################
+    ##################################################################################################
+
+    def limits_heartbeat_start(self, move_command: str) -> None:
+        """Start the heartbeat task for limits."""
+        self.limits_heartbeat_stop()
+        self._limits_heartbeat_task = self._create_task(
+            self.limits_heartbeat_loop(move_command)
+        )
+
+
+    def limits_heartbeat_stop(self) -> None:
+        """Stop the heartbeat task for limits."""
+        if self._limits_heartbeat_task:
+            self._limits_heartbeat_task.cancel()
+            self._limits_heartbeat_task = None
+
+
+    async def limits_heartbeat_loop(self, move_command_str: str) -> None:
+        """Send heartbeat every 4 seconds while moving."""
+        heartbeat_command = bytes.fromhex(CMD_HEARTBEAT)
+        move_command = bytes.fromhex(move_command_str)
+        while True:
+            try:
+                await asyncio.sleep(2)
+                if self._client and self._client.is_connected:
+                    await self.send_command(UUID, heartbeat_command)
+                    await self.send_command(UUID, move_command)
+                else:
+                    break
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                _LOGGER.debug("%s: Moving heartbeat failed: %s", self.name, e)
+                break
+
+
+    async def limits_initialise(self) -> None:
+        """Initialise the limit configuration by connecting to the blind."""
+        self.limits_heartbeat_stop()
+        # Connect to the blind first
+        _LOGGER.debug("Starting Limits Config. Attempting Connection")
+        await self.ensure_connected()
+            
+        # Set the initialisation commands
+        _LOGGER.debug("Sending initialisation commands")
+        await self.send_command(UUID, bytes.fromhex(INITIALIZATION_MESSAGE))
+        await self.send_command(UUID, bytes.fromhex(CMD_LIMITS_INIT_2))
+    
+
+    async def limits_step_up(self) -> None:
+        """Move the blind up incrementally for manual positioning."""
+        self.limits_heartbeat_stop()
+        # Connect to the blind first
+        if not self._client or not self._client.is_connected:
+            _LOGGER.debug("Connection lost, limits set up failed")
+        
+        _LOGGER.debug("Stepping up")
+        await self.send_command(UUID, bytes.fromhex(CMD_LIMITS_STEP_UP))
+        
+
+    async def limits_step_down(self) -> None:
+        """Move the blind down incrementally for manual positioning."""
+        self.limits_heartbeat_stop()
+        # Connect to the blind first
+        if not self._client or not self._client.is_connected:
+            _LOGGER.debug("Connection lost, limits set up failed")
+        
+        _LOGGER.debug("Stepping down")
+        await self.send_command(UUID, bytes.fromhex(CMD_LIMITS_STEP_DOWN))
+
+
+    async def limits_move_up(self) -> None:
+        """Move the blind up continuously for manual positioning (stubbed for now)."""
+        # Connect to the blind first
+        if not self._client or not self._client.is_connected:
+            _LOGGER.debug("Connection lost, limits set up failed")
+        
+        _LOGGER.debug("Moving up")
+        move_command = CMD_LIMITS_MOVE_UP
+        await self.send_command(UUID, bytes.fromhex(move_command))
+        self.limits_heartbeat_start(move_command)
+
+
+    async def limits_move_down(self) -> None:
+        """Move the blind down continuously for manual positioning (stubbed for now)."""
+        # Connect to the blind first
+        if not self._client or not self._client.is_connected:
+            _LOGGER.debug("Connection lost, limits set up failed")  
+        
+        _LOGGER.debug("Moving down")
+        move_command = CMD_LIMITS_MOVE_DOWN
+        await self.send_command(UUID, bytes.fromhex(move_command))
+        self.limits_heartbeat_start(move_command)
+        
+        
+    async def limits_stop(self) -> None:
+        """Stop the blind movement."""
+        self.limits_heartbeat_stop()
+        # Connect to the blind first
+        if not self._client or not self._client.is_connected:
+            _LOGGER.debug("Connection lost, limits set up failed")  
+        
+        _LOGGER.debug("Stopping movement")
+        await self.send_command(UUID, bytes.fromhex(CMD_STOP))
+
+
+    async def limits_set(self) -> None:
+        """Sets the limit."""
+        self.limits_heartbeat_stop()
+        # Connect to the blind first
+        if not self._client or not self._client.is_connected:
+            _LOGGER.debug("Connection lost, limits set up failed")
+
+        _LOGGER.debug("Setting the limit")
+        await self.send_command(UUID, bytes.fromhex(CMD_STOP))
+        await self.send_command(UUID, bytes.fromhex(CMD_LIMITS_SET))
+
+    ##################################################################################################
+    ## TIMER METHODS #################################################################################
+    ##################################################################################################
+
+    async def async_load_timers(self) -> None:
+        """Load stored schedules."""
+        stored = await self._store.async_load()
+        if stored:
+            self.timers = stored
+        else:
+            self.timers = {}
+        self._timers_changed()
+
+    async def async_save_timer(self) -> None:
+        """Save schedules to storage."""
+        await self._store.async_save(self.timers)
+        # Every timer change is saved, so this is the one place to report it
+        self._timers_changed()
+
+    async def async_add_timer(self, days: list[str], time_str: str, position: float) -> str:
+        """Add a new schedule.
+
+        A schedule sharing its time and position with an existing timer is
+        merged into that timer's day bitmask instead of taking a new slot.
+        """
+        packed = pack_timers([*self.timers.values(), {"days": days, "time": time_str, "position": position}])
+        if len(packed) <= len(self.timers):
+            return await self._async_merge_timer(packed, time_str, position)
+        if len(self.timers) >= MAX_TIMERS:
+            raise self._error(
+                f"{self.name}: all {MAX_TIMERS} timer slots are in use",
+                "max_timers_reached",
+                max_timers=str(MAX_TIMERS),
+            )
+
+        await self.ensure_connected()   
+
+        await self.send_command(UUID, bytes.fromhex(CONNECTION_MESSAGE))   
+        await self.send_timestamp()   
+        timer_id = await self._async_request_timer_slot()
+        timer_command = self.create_timer_command(timer_id, days, time_str, position)
+        
+        await self.send_command(UUID, bytes.fromhex(timer_command))
+        await self.send_command(UUID, bytes.fromhex(CMD_BATTERY_STATUS))
+        await self.disconnect()
+        
+        self.timers[timer_id] = {
+            "timer_id": timer_id,
+            "ha_index": self._next_ha_index(self.timers),
+            "days": days,
+            "time": time_str,
+            "position": position
+        }
+        
+        await self.async_save_timer()
+        self.publish_updates()
+        self._timer_added(timer_id)
+        return timer_id
+    
+
+    async def async_delete_timer(self, timer_id: str) -> None:
+        """Remove an existing schedule."""
+        await self.ensure_connected()     
+        
+        await self.send_command(UUID, bytes.fromhex(CONNECTION_MESSAGE))
+        await self.send_timestamp()      
+        await self.send_command(UUID, bytes.fromhex(INITIALIZATION_MESSAGE))
+        await self._async_erase_timer(timer_id)
+        await self.send_command(UUID, bytes.fromhex(CMD_BATTERY_STATUS))
+        await self.disconnect()
+        
+        if timer_id in self.timers:
+            del self.timers[timer_id]
+            await self.async_save_timer()
+            self._timer_removed(timer_id)
+            self.publish_updates()
+
+
+    async def async_read_timers(self) -> dict[str, dict]:
+        """Read the timer slots held by the blind firmware.
+
+        Returns the decoded slots keyed by timer id. Experimental: the
+        record layout is unconfirmed on real blinds, and a table that
+        cannot be decoded raises rather than reading as empty.
+        """
+        await self.ensure_connected()
+        try:
+            await self.send_command(UUID, bytes.fromhex(CONNECTION_MESSAGE))
+            await self.send_timestamp()
+            records = await self._async_read_timer_records()
+        finally:
+            await self.disconnect()
+        self.publish_updates()
+        return records
+
+
+    async def async_sync_timers(
+        self, desired: list[dict] | None = None, read_back: bool = False
+    ) -> dict[str, Any]:
+        """Reconcile the blind's timer slots with ``desired`` in one session.
+
+        HA's stored copy is diffed against ``desired``. With ``read_back``
+        the firmware table is read and diffed instead, so timers changed by
+        the Tuiss app or lost in a reset are repaired. The read-back is
+        experimental until its record format is confirmed on real blinds,
+        and raises when the table cannot be decoded. Only
+        the slots that differ are deleted or written. ``desired`` defaults
+        to HA's stored timers, which re-asserts HA's copy on the blind.
+
+        ``desired`` is packed first, so schedules that differ only in their
+        days share a slot, and an over-capacity set is refused before the
+        blind is contacted.
+        """
+        if desired is None:
+            desired = list(self.timers.values())
+        desired = pack_timers(desired)
+        if len(desired) > MAX_TIMERS:
+            raise self._error(
+                f"{self.name}: all {MAX_TIMERS} timer slots are in use",
+                "max_timers_reached",
+                max_timers=str(MAX_TIMERS),
+            )
+
+        await self.ensure_connected()
+        current = self.timers
+        source = "home_assistant"
+        deleted: list[str] = []
+        added: dict[str, dict] = {}
+        try:
+            await self.send_command(UUID, bytes.fromhex(CONNECTION_MESSAGE))
+            await self.send_timestamp()
+            if read_back:
+                current, source = await self._async_read_timer_records(), "firmware"
+            else:
+                await self.send_command(UUID, bytes.fromhex(INITIALIZATION_MESSAGE))
+
+            to_delete, to_add = diff_timers(current, desired)
+            _LOGGER.debug(
+                "%s: Timer sync against %s copy: %d to delete, %d to add",
+                self.name, source, len(to_delete), len(to_add),
+            )
+            for timer_id in to_delete:
+                await self._async_erase_timer(timer_id)
+                deleted.append(timer_id)
+            for timer in to_add:
+                timer_id = await self._async_request_timer_slot()
+                await self.send_command(
+                    UUID,
+                    bytes.fromhex(
+                        self.create_timer_command(
+                            timer_id, timer["days"], timer["time"], timer["position"]
+                        )
+                    ),
+                )
+                added[timer_id] = timer
+            await self.send_command(UUID, bytes.fromhex(CMD_BATTERY_STATUS))
+        finally:
+            await self.disconnect()
+            # Record whatever was applied, even if the session failed part way.
+            await self._async_apply_timer_changes(current, deleted, added, source)
+
+        return {
+            "deleted": deleted,
+            "added": list(added),
+            "unchanged": len(current) - len(deleted),
+            **self.timer_slot_usage,
+        }
+
+
+    async def _async_merge_timer(self, packed: list[dict], time_str: str, position: float) -> str:
+        """Fold a new schedule into the existing timer with the same time and position."""
+        key = timer_key(next(
+            timer for timer in packed
+            if timer_key(timer)[1:] == timer_key({"time": time_str, "position": position})[1:]
+        ))
+        for timer_id, timer in self.timers.items():
+            if timer_key(timer) == key:
+                _LOGGER.debug("%s: Timer already covered by slot %s", self.name, timer_id)
+                return timer_id
+        await self.async_sync_timers(packed, read_back=False)
+        return next(
+            timer_id for timer_id, timer in self.timers.items() if timer_key(timer) == key
+        )
+
+
+    @property
+    def timer_slot_usage(self) -> dict[str, Any]:
+        """Return how many of the firmware timer slots are in use."""
+        used = len(self.timers)
+        return {
+            "slots_used": used,
+            "slots_free": max(MAX_TIMERS - used, 0),
+            "slots_max": MAX_TIMERS,
+            "source": self._timer_slot_source,
+            "last_read": self._timer_slots_read.isoformat() if self._timer_slots_read else None,
+        }
+
+
+    async def _async_start_notify(self, callback) -> None:
+        """Start notifications, replacing any handler left on the characteristic."""
+        try:
+            await self._client.start_notify(BLIND_NOTIFY_CHARACTERISTIC, callback)
+        except _ble().BleakError:
+            await self._client.stop_notify(BLIND_NOTIFY_CHARACTERISTIC)
+            await self._client.start_notify(BLIND_NOTIFY_CHARACTERISTIC, callback)
+
+
+    async def _async_request_timer_slot(self) -> str:
+        """Ask the blind for the next free timer slot on the open connection."""
+        new_timer_id = None
+        timer_id_event = asyncio.Event()
+
+        async def timer_id_callback(sender, data):
+            nonlocal new_timer_id
+            slot = decode_timer_slot(self.split_data(data))
+            if slot is not None:
+                new_timer_id = slot
+                timer_id_event.set()
+
+        await self._async_start_notify(timer_id_callback)
+        await self.send_command(UUID, bytes.fromhex(CMD_TIMER_REQUEST))
+        
+        try:
+            await asyncio.wait_for(timer_id_event.wait(), timeout=10.0)
+        except asyncio.TimeoutError:
+            self._count("timeouts")
+            self._log_frame("event", "timeout")
+            await self._client.stop_notify(BLIND_NOTIFY_CHARACTERISTIC)
+            await self.disconnect()
+            raise self._error("Timeout waiting for timer ID from blind.")
+
+        await self._client.stop_notify(BLIND_NOTIFY_CHARACTERISTIC)
+
+        _LOGGER.debug("Received timer ID from blind: %s", new_timer_id)
+
+        if not new_timer_id:
+            await self.disconnect()
+            _LOGGER.debug("Failed to obtain timer ID from the blind.")
+            raise self._error("Failed to obtain timer ID from the blind.")
+            
+        if int(new_timer_id) > MAX_TIMERS:
+            await self.disconnect()
+            _LOGGER.debug("Maximum number of timers reached.")
+            raise self._error(
+                f"{self.name}: all {MAX_TIMERS} timer slots are in use",
+                "max_timers_reached",
+                max_timers=str(MAX_TIMERS),
+            )
+        return new_timer_id
+
+
+    async def _async_read_timer_records(self) -> dict[str, dict]:
+        """Collect the timer records the blind reports on the open connection.
+
+        The record layout is only known from the simulator, so a read that
+        decodes no records while the free slot shows slots in use (or gets
+        no answer at all) raises instead of passing for an empty table.
+        """
+        records: dict[str, dict] = {}
+        answered = asyncio.Event()
+        free_slot: str | None = None
+
+        async def read_callback(sender, data):
+            nonlocal free_slot
+            decimals = self.split_data(data)
+            record = decode_timer_record(decimals)
+            if record:
+                records[record["timer_id"]] = record
+            elif (slot := decode_timer_slot(decimals)) is not None:
+                # The free-slot answer is always the last frame of the read.
+                free_slot = slot
+                answered.set()
+
+        await self._async_start_notify(read_callback)
+        await self.send_command(UUID, bytes.fromhex(INITIALIZATION_MESSAGE))
+        await self.send_command(UUID, bytes.fromhex(CMD_TIMER_REQUEST))
+        try:
+            await asyncio.wait_for(answered.wait(), timeout=10.0)
+        except asyncio.TimeoutError:
+            self._count("timeouts")
+            self._log_frame("event", "timeout")
+            _LOGGER.debug("%s: Timeout waiting for the timer table", self.name)
+        await self._client.stop_notify(BLIND_NOTIFY_CHARACTERISTIC)
+
+        if not records and (free_slot is None or int(free_slot) > 1):
+            raise self._error(
+                f"{self.name}: the timer table could not be read (free slot {free_slot})",
+                "timer_read_failed",
+                name=self.name,
+            )
+        self._timer_slot_source = "firmware"
+        self._timer_slots_read = self._now()
+        _LOGGER.debug("%s: Firmware reports %d timer slots in use", self.name, len(records))
+        return records
+
+
+    async def _async_erase_timer(self, timer_id: str) -> None:
+        """Delete a timer slot on the open connection."""
+        await self.send_command(UUID, bytes.fromhex(timer_delete_command(timer_id)))
+
+
+    async def _async_apply_timer_changes(
+        self,
+        current: dict[str, dict],
+        deleted: list[str],
+        added: dict[str, dict],
+        source: str,
+    ) -> None:
+        """Make ``self.timers`` mirror the blind after a sync and notify entities."""
+        previous = dict(self.timers)
+        new_timers: dict[str, dict] = {}
+        for timer_id, timer in current.items():
+            if timer_id in deleted:
+                continue
+            old = previous.get(timer_id)
+            if old is not None and timer_key(old) == timer_key(timer):
+                new_timers[timer_id] = old
+            else:
+                new_timers[timer_id] = {"timer_id": timer_id, **timer}
+        for timer_id, timer in added.items():
+            new_timers[timer_id] = {"timer_id": timer_id, **timer}
+        for timer in new_timers.values():
+            if "ha_index" not in timer:
+                timer["ha_index"] = self._next_ha_index(new_timers)
+
+        removed = [tid for tid in previous if new_timers.get(tid) is not previous[tid]]
+        created = [tid for tid in new_timers if previous.get(tid) is not new_timers[tid]]
+        if source == "home_assistant" and not removed and not created:
+            return
+
+        self.timers = new_timers
+        await self.async_save_timer()
+        for timer_id in removed:
+            self._timer_removed(timer_id)
+        for timer_id in created:
+            self._timer_added(timer_id)
+        self.publish_updates()
+
+
+    def _next_ha_index(self, timers: dict[str, dict]) -> int:
+        """Return the lowest display index not used by ``timers``."""
+        existing_ha_indices = {t.get("ha_index") for t in timers.values() if "ha_index" in t}
+        available_indices = set(range(1, MAX_TIMERS + 1)) - existing_ha_indices
+        return min(available_indices) if available_indices else len(timers) + 1
+
+
+    async def delete_all_timers(self) -> None:
+        """Delete all timers from the blind."""
+        _LOGGER.debug("%s: Attempting to delete all timers.", self.name)
+        # Connect to the blind first
+        await self.ensure_connected()
+
+        await self.send_command(UUID, bytes.fromhex(CONNECTION_MESSAGE))
+        await self.send_timestamp()
+        await self.send_command(UUID, bytes.fromhex(INITIALIZATION_MESSAGE))
+        await self.send_command(UUID, bytes.fromhex(CMD_TIMER_RESET)) # reset command
+
+        await self.disconnect()
+
+        # Reconnect to the blind to ensure it's back online after reset
+        await self.attempt_connection()
+        await self.send_command(UUID, bytes.fromhex(CMD_BLIND_REACTIVATE)) # reactivate blind
+        await self.disconnect()
+         
+        #remove any timer entities
+        if self.timers:
+            timer_ids = list(self.timers.keys())
+            for timer_id in timer_ids:
+                self._timer_removed(timer_id)
+                
+            self.timers.clear()
+            await self.async_save_timer()
+            self.publish_updates()
+
+
+
+
+    def create_timer_command(self, index: str, days: list[str], time: str, position: float) -> str:
+        """Return the command that writes a timer to slot ``index``."""
+        return timer_command(index, days, time, position)
+
+
+    ##################################################################################################
+    ## CALLBACK METHODS ##############################################################################
+    ##################################################################################################
+
+    async def battery_callback(self, sender: BleakGATTCharacteristic, data: bytearray):
+        """Wait for response from the blind and updates entity status."""
+        decimals = self.split_data(data)
+
+        if decimals[4] == OPCODE_STATUS:
+            self._battery_status = decode_battery(decimals)
+            if self._battery_status:
+                _LOGGER.debug("%s: Please charge device", self.name)
+            elif self._battery_status is False:
+                _LOGGER.debug("%s: Battery is good", self.name)
+            else:
+                _LOGGER.debug("%s: Battery logic is wrong", self.name)
+            # Record time of this battery check
+            try:
+                self._last_battery_check = self._now()
+            except Exception:
+                self._last_battery_check = None
+            self._stopped_event.set()
+
+    async def position_callback(self, sender: BleakGATTCharacteristic, data: bytearray):
+        """Wait for response from the blind and updates entity status."""
+        _LOGGER.debug("%s: Attempting to get position", self.name)
+
+        decimals = self.split_data(data)
+
+        blindPos = decode_position(decimals)
+        _LOGGER.debug("%s: Blind position is %s", self.name, blindPos)
+        self._current_cover_position = blindPos
+        self.mark_position("blind")
+        self._moving = 0
+        self._stopped_event.set()
+
+    async def set_position_callback(
+        self, sender: BleakGATTCharacteristic, data: bytearray
+    ):
+        """Handle response from the blind during movement. Keeps connection alive until target is reached."""
+        decimals = self.split_data(data)
+        blindPos = decode_progress(decimals)
+        if blindPos is not None:
+            self._current_cover_position = blindPos
+            self.mark_position("blind")
+            self.publish_updates()
+            
+            if self._desired_position is not None and abs(blindPos - self._desired_position) <= 2:
+                _LOGGER.debug("%s: Reached desired position. Stopping wait.", self.name)
+                self._stopped_event.set()
+
+    ##################################################################################################
+    ## DATA METHODS ############################################################################
+    ##################################################################################################
+
+    # Send the data
+    async def send_command(self, UUID, command):
+        """Send the command to the blind."""
+        if self._client and self._client.is_connected:
+            try:
+                self._log.debug("tx", data=command)
+                self._log_frame("tx", bytes(command))
+                await self._client.write_gatt_char(UUID, command)
+            except _ble().BleakError as e:
+                _LOGGER.error("%s: Send Command error: %s", self.name, e)
+                self._log_frame("event", f"send_error: {e}")
+                raise RuntimeError(e) from e
+
+    async def send_timestamp(self) -> None:
+        """Send the current timestamp command to the blind."""
+        await self.send_command(UUID, bytes.fromhex(timestamp_command(datetime.datetime.now())))
+
+    # Creates the % open/closed hex command
+    def hex_convert(self, user_percent: float) -> str:
+        """Convert the Home Assistant position percentage (0-100) to the Tuiss hex command."""
+        return position_command(user_percent)
+
+    def split_data(self, data: bytearray) -> list[int]:
+        """Convert the byte response into a list of decimals."""
+        decimals = list(data)
+        self._log_frame("rx", bytes(data))
+        self._count("notifications")
+        self._log.debug("rx", data=data)
+        return decimals
+
+    
+    async def async_move_cover(
+        self,
+        movement_direction,
+        target_position,
+        skip_battery_check=False,
+        start_barrier: StartBarrier | None = None,
+        wait: bool = True,
+    ):
+        """Move the cover.
+
+        With ``wait`` False this returns as soon as the position frame has
+        been written and the rest of the move is tracked in the background.
+        """
+        _LOGGER.debug("%s: Entering async_move_cover. Locked: %s", self.name, self._locked)
+        if not self._locked:
+            self._begin_op()
+            if self.is_at_position(100 - target_position):
+                # Already there: skip the connection entirely
+                self._connections_saved += 1
+                self._op_stats["skipped"] = True
+                _LOGGER.debug(
+                    "%s: Already at %s (confidence %s), move skipped. Connections saved: %s",
+                    self.name,
+                    self._current_cover_position,
+                    self.position_confidence,
+                    self._connections_saved,
+                )
+                self.publish_updates()
+                return
+        if not self._locked:
+            # Reuse a session that is already open (e.g. pre-connected by a group move)
+            await self.ensure_connected()
+            if self._client and self._client.is_connected:
+                self._locked = True
+                self._locked_at = self.clock()
+                _LOGGER.debug("%s: Lock acquired.", self.name)
+                self._is_stopping = False
+                start_position = self._current_cover_position
+                corrected_target_position = 100 - target_position
+                self._moving = movement_direction
+
+                # Update the state and trigger the moving
+                self.publish_updates()
+                
+                _LOGGER.debug(
+                            "%s: Battery check age (%s days). Last check: %s.",
+                            self.name,
+                            self._battery_check_days,
+                            self._last_battery_check,
+                        )
+                
+                # Perform a battery check before moving if configured
+                try:
+                    if not skip_battery_check and self._battery_check_days and (
+                        self._last_battery_check is None
+                        or (
+                            (self._now() - self._last_battery_check).total_seconds()
+                            / 86400
+                        )
+                        > float(self._battery_check_days)
+                    ):
+                        _LOGGER.debug(
+                            "%s: Battery check age exceeded (%s days). Checking battery.",
+                            self.name,
+                            self._battery_check_days,
+                        )
+                        # It's OK if this fails — we still proceed with the movement
+                        try:
+                            await self.get_battery_status()
+                        except Exception as e:
+                            _LOGGER.debug("%s: Battery check failed: %s", self.name, e)
+                except Exception:
+                    # Defensive: don't let battery-check logic break movement
+                    _LOGGER.debug("%s: Error while evaluating battery check timing", self.name)
+                
+                try:
+                    # Timeout on set_position to prevent hanging indefinitely
+                    await asyncio.wait_for(
+                        self.set_position(target_position, start_barrier=start_barrier),
+                        timeout=30.0,
+                    )
+                except asyncio.TimeoutError:
+                    _LOGGER.error("%s: set_position() timed out after 30s. Unsticking blind.", self.name)
+                    self._count("timeouts")
+                    self._log_frame("event", "timeout")
+                    self._moving = 0
+                    self._release_lock()
+                    self.publish_updates()
+                    await self.disconnect()
+                    return
+                except Exception as e:
+                    _LOGGER.error("%s: Failed to send move command: %s. Unsticking blind.", self.name, e)
+                    # Command failed; unstick the blind immediately
+                    self._moving = 0
+                    self._release_lock()
+                    self.publish_updates()
+                    await self.disconnect()
+                    return
+                
+                track = self._async_track_move(
+                    movement_direction, start_position, corrected_target_position
+                )
+                if wait:
+                    await track
+                else:
+                    # Return once the position frame is written; the stop is
+                    # tracked in the background and can be awaited with
+                    # async_wait_for_move().
+                    self._move_task = self._create_task(track)
+
+        elif self._locked:
+            self._count("lock_rejections")
+            _LOGGER.debug(
+                "%s is locked, please wait for currrent command to complete and then try again.",
+                self.name,
+            )
+            # Use translation placeholder so the frontend can localise the message
+            raise self._error(
+                f"{self.name} is locked, wait for the current command to complete",
+                "device_locked",
+                name=self.name,
+            )
+
+    async def _async_track_move(
+        self, movement_direction, start_position, corrected_target_position
+    ) -> None:
+        """Follow a move until the blind stops, then disconnect and unlock."""
+        end_time = None
+        start_time = self.clock()
+
+        async def aync_update_position_in_realtime():
+            """Task to update the position while the blind is moving."""
+            while self._client and self._client.is_connected and not self._is_stopping:
+                if self._attr_traversal_speed is not None:
+                    elapsed = self.clock() - start_time
+                    traversal_difference = (
+                        elapsed * self._attr_traversal_speed * movement_direction
+                    )
+                    self._current_cover_position = round(
+                        sorted([0, start_position + traversal_difference, 100])[1], 2
+                    )
+                    self._log.debug(
+                        "moving",
+                        throttle=True,
+                        start=start_position,
+                        position=self._current_cover_position,
+                        target=corrected_target_position,
+                        elapsed=elapsed,
+                    )
+                    self.publish_updates()
+                    
+                await asyncio.sleep(1)
+
+        update_task = self._create_task(aync_update_position_in_realtime())
+
+        try:
+            # Calculate timeout based on traversal speed or use default
+            if (self._attr_traversal_speed is not None and 
+                self._attr_traversal_speed >= 1 and 
+                self._attr_traversal_speed < 6):
+                timeout_duration = ((abs(corrected_target_position - start_position) * 1.2) / self._attr_traversal_speed) + 10
+            else:
+                timeout_duration = TIMEOUT_SECONDS or 120
+            
+            _LOGGER.debug(
+                "%s: Waiting for stop event with timeout: %s seconds. Traversal speed: %s",
+                self.name,
+                timeout_duration,
+                self._attr_traversal_speed,
+            )
+            await asyncio.wait_for(self.wait_for_stop(), timeout=timeout_duration)
+        except asyncio.TimeoutError:
+            _LOGGER.warning("%s: Timeout waiting for blind to stop", self.name)
+            self._count("timeouts")
+            self._log_frame("event", "timeout")
+            update_task.cancel()
+            # await self.get_blind_position()
+            await self.disconnect()
+            self.set_final_state(corrected_target_position, source="estimate")
+            _LOGGER.debug("%s: Lock released following timeout", self.name)
+            self._release_lock()
+            return  # stops blind updating traversal speed if it timesout
+        finally:
+            update_task.cancel()
+            # Ensure disconnect is called in all cases
+            await self.disconnect()
+            # unlock the entity to allow more changes
+            self._release_lock()
+            _LOGGER.debug("%s: Lock released in async_move_cover.", self.name)
+
+        # set the traversal speed average and update final states only if the blind has not been stopped, as that updates itself
+        _LOGGER.debug(
+            "%s: Finished moving. StartPos: %s. CurrentPos: %s. TargetPos: %s. is_stopping: %s",
+            self.name,
+            start_position,
+            self._current_cover_position,
+            corrected_target_position,
+            self._is_stopping,
+        )
+        if not self._is_stopping:
+            end_time = self.clock()
+            self.update_traversal_speed(
+                corrected_target_position, start_position, start_time, end_time
+            )
+
+            self.set_final_state(corrected_target_position)
+
+    def _release_lock(self) -> None:
+        """Unlock the blind, recording how long the move held the lock."""
+        if self._locked_at is not None:
+            self._observe("lock_held", self.clock() - self._locked_at)
+            self._locked_at = None
+        self._locked = False
+
+    async def async_wait_for_move(self, timeout: float | None = None) -> bool:
+        """Wait for a move tracked in the background; False if it is still running after ``timeout``."""
+        task = self._move_task
+        if task is None or task.done():
+            return True
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def update_traversal_speed(self, target_position, start_position, start_time, end_time):
+        """Update the traversal speed from a move's clock() start and end times."""
+        if start_position is None:
+            # Position unknown when the move started (e.g. first move after setup)
+            return
+        time_taken = end_time - start_time
+        traversal_distance = abs(target_position - start_position)
+        # Only update traversal speed if the blind has moved a significant distance to avoid skewing from small movements or noise
+        if traversal_distance > TRAVERSAL_UPDATE_THRESHOLD and time_taken > 0:
+            self._attr_traversal_speed = traversal_distance / time_taken
+            _LOGGER.debug(
+                "%s: Time Taken: %s. Start Pos: %s. End Pos: %s. Distance Travelled: %s. Traversal Speed: %s",
+                self.name,
+                time_taken,
+                start_position,
+                target_position,
+                traversal_distance,
+                self._attr_traversal_speed,
+            )
+        
+    def set_final_state(self, position, source: str = "move"):
+        """Set the final state of the blind after a move."""
+        self._current_cover_position = position
+        self.mark_position(source)
+        self._moving = 0
+        self.publish_updates()
@@ -0,0 +1,210 @@
+"""btsnoop capture and offline replay of Tuiss BLE traffic.
+
+Frames are written as HCI ACL packets carrying ATT Write Command (sent)
+and Handle Value Notification (received) PDUs, so a capture opens in
+Wireshark or any other btsnoop reader. Bleak addresses characteristics
+by UUID, so fixed placeholder ATT handles are used for the Tuiss write
+and notify characteristics.
+
+Recording only appends to an in-memory list; ``flush`` does the file I/O
+(and rotation) and is meant to run in an executor. No Home Assistant
+imports, so captures can be read and replayed outside Home Assistant.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+from .clock import loop_time
+
+BTSNOOP_MAGIC = b"btsnoop\0"
+BTSNOOP_VERSION = 1
+BTSNOOP_DATALINK_H4 = 1002
+# Microseconds between 0000-01-01 (the btsnoop epoch) and the Unix epoch
+BTSNOOP_EPOCH_OFFSET_US = 0x00DCDDB30F2F8000
+BTSNOOP_HEADER_SIZE = 16
+H4_ACL = 0x02
+ACL_HANDLE = 0x0040
+ACL_FIRST_FLUSHABLE = 0x2000
+ATT_CID = 0x0004
+ATT_WRITE_COMMAND = 0x52
+ATT_HANDLE_VALUE_NOTIFICATION = 0x1B
+# Placeholder ATT handles for the write and notify characteristics
+WRITE_HANDLE = 0x0010
+NOTIFY_HANDLE = 0x0012
+
+DEFAULT_CAPTURE_MAX_BYTES = 1_000_000
+DEFAULT_CAPTURE_BACKUPS = 3
+
+# Hub decoder for a notification, by the opcode of the command it answers
+REPLAY_DECODERS = {
+    0xBF: "set_position_callback",
+    0xD1: "position_callback",
+    0xF0: "battery_callback",
+}
+
+
+class CapturedFrame(NamedTuple):
+    """One GATT write ("tx") or notification ("rx")."""
+
+    timestamp: float  # Unix time, seconds
+    direction: str
+    data: bytes
+
+
+def encode_record(direction: str, data: bytes, timestamp: float) -> bytes:
+    """Return the btsnoop record for one GATT write or notification."""
+    if direction == "tx":
+        att = struct.pack("<BH", ATT_WRITE_COMMAND, WRITE_HANDLE) + data
+    else:
+        att = struct.pack("<BH", ATT_HANDLE_VALUE_NOTIFICATION, NOTIFY_HANDLE) + data
+    l2cap = struct.pack("<HH", len(att), ATT_CID) + att
+    packet = struct.pack("<BHH", H4_ACL, ACL_HANDLE | ACL_FIRST_FLUSHABLE, len(l2cap)) + l2cap
+    flags = 0 if direction == "tx" else 1
+    timestamp_us = int(timestamp * 1_000_000) + BTSNOOP_EPOCH_OFFSET_US
+    return struct.pack(">IIIIq", len(packet), len(packet), flags, 0, timestamp_us) + packet
+
+
+def read_btsnoop(path: str) -> list[CapturedFrame]:
+    """Read the GATT writes and notifications from a btsnoop file."""
+    with open(path, "rb") as file:
+        content = file.read()
+    if content[:8] != BTSNOOP_MAGIC:
+        raise ValueError(f"{path} is not a btsnoop file")
+    frames = []
+    offset = BTSNOOP_HEADER_SIZE
+    while offset + 24 <= len(content):
+        _, included, flags, _, timestamp_us = struct.unpack_from(">IIIIq", content, offset)
+        packet = content[offset + 24 : offset + 24 + included]
+        offset += 24 + included
+        # H4 type, ACL header (4), L2CAP header (4), ATT opcode and handle (3)
+        if len(packet) < 12 or packet[0] != H4_ACL:
+            continue
+        if packet[9] not in (ATT_WRITE_COMMAND, ATT_HANDLE_VALUE_NOTIFICATION):
+            continue
+        frames.append(
+            CapturedFrame(
+                (timestamp_us - BTSNOOP_EPOCH_OFFSET_US) / 1_000_000,
+                "rx" if flags & 1 else "tx",
+                packet[12:],
+            )
+        )
+    return frames
+
+
+class BtsnoopWriter:
+    """Buffer frames in memory and append them to a rotating btsnoop file.
+
+    When the file would grow past ``max_bytes`` it is renamed to
+    ``<path>.1`` (older files shift up to ``<path>.<backups>``) and a
+    new file is started.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_CAPTURE_MAX_BYTES,
+        backups: int = DEFAULT_CAPTURE_BACKUPS,
+    ) -> None:
+        self.path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._pending: list[bytes] = []
+        # Guards only the buffer swap, so record() never waits on file I/O
+        self._pending_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+    def record(self, direction: str, data: bytes, timestamp: float | None = None) -> None:
+        """Queue a frame; cheap enough for the notification path."""
+        record = encode_record(direction, data, time.time() if timestamp is None else timestamp)
+        with self._pending_lock:
+            self._pending.append(record)
+
+    def flush(self) -> None:
+        """Write queued frames to disk, rotating as needed. Blocking."""
+        with self._pending_lock:
+            records, self._pending = self._pending, []
+        if not records:
+            return
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            file = open(self.path, "ab")
+            try:
+                if size == 0:
+                    size = _write_header(file)
+                for record in records:
+                    if size > BTSNOOP_HEADER_SIZE and size + len(record) > self._max_bytes:
+                        file.close()
+                        self._rotate()
+                        file = open(self.path, "ab")
+                        size = _write_header(file)
+                    file.write(record)
+                    size += len(record)
+            finally:
+                file.close()
+
+    def _rotate(self) -> None:
+        for index in range(self._backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self._backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+def _write_header(file) -> int:
+    file.write(struct.pack(">8sII", BTSNOOP_MAGIC, BTSNOOP_VERSION, BTSNOOP_DATALINK_H4))
+    return BTSNOOP_HEADER_SIZE
+
+
+async def async_replay(
+    blind: Any,
+    frames: list[CapturedFrame],
+    speed: float = 10.0,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+) -> dict[str, Any]:
+    """Feed captured notifications back through a blind's decoders.
+
+    Each notification goes to the decoder for the command it answers
+    (see ``REPLAY_DECODERS``); notifications that answer anything else
+    only go through ``split_data``. Gaps between frames are divided by
+    ``speed``; 0 replays as fast as possible. Returns frame counts, the
+    captured and replayed duration and the time spent decoding.
+    """
+    counts: dict[str, int] = {}
+    decode_time = 0.0
+    last_opcode = None
+    started = loop_time()
+    previous = frames[0].timestamp if frames else 0.0
+    for frame in frames:
+        if speed > 0 and frame.timestamp > previous:
+            await sleep((frame.timestamp - previous) / speed)
+        previous = frame.timestamp
+        if frame.direction == "tx":
+            last_opcode = frame.data[4] if len(frame.data) > 4 else None
+            continue
+        decoder_name = REPLAY_DECODERS.get(last_opcode, "split_data")
+        decode_started = time.perf_counter()
+        if decoder_name == "split_data":
+            blind.split_data(bytearray(frame.data))
+        else:
+            await getattr(blind, decoder_name)(None, bytearray(frame.data))
+        decode_time += time.perf_counter() - decode_started
+        counts[decoder_name] = counts.get(decoder_name, 0) + 1
+    return {
+        "frames": len(frames),
+        "notifications": sum(counts.values()),
+        "decoders": counts,
+        "capture_span": round(frames[-1].timestamp - frames[0].timestamp, 3) if frames else 0.0,
+        "wall_time": round(loop_time() - started, 3),
+        "decode_time": round(decode_time, 6),
+    }
@@ -0,0 +1,273 @@
+"""Command line control of Tuiss blinds, without Home Assistant.
+
+Run from ``custom_components/tuiss2ha/lib`` (or with it on ``PYTHONPATH``)::
+
+    python -m tuiss scan
+    python -m tuiss set 40 AA:BB:CC:DD:EE:FF
+    python -m tuiss --csv floor2.csv --concurrency 4 close
+    python -m tuiss --simulate 60 --proxies 10 set 30
+
+Blinds are given as MAC addresses on the command line and/or in a CSV
+file (MAC in the first column, optional name in the second; a header row
+and lines starting with ``#`` are skipped). Every blind is driven through
+``fleet.async_fan_out``, so ``--concurrency`` and ``--slots-per-proxy``
+bound the connections held at once. The result of each blind, the
+counts and the wall time are printed as JSON; the exit status is 1 if
+any blind failed.
+
+``--simulate N`` replaces the blinds with N ``SimulatedBlind``
+peripherals spread over ``--proxies`` simulated proxies. It runs on
+virtual time, so it reports how long the batch would take on real
+blinds in a fraction of a second; add ``--realtime`` to run it on the
+real clock instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import re
+import sys
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from .blind import Blind
+from .clock import run_virtual
+from .const import DEFAULT_RESTART_ATTEMPTS, MODEL_NAMES, DeviceNotFound
+from .fleet import DEFAULT_FLEET_CONCURRENCY, DEFAULT_SLOTS_PER_PROXY, async_fan_out
+from .simulator import SimulatedBlind
+
+MAC_PATTERN = re.compile(r"^(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}$")
+DAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+DEFAULT_SCAN_TIMEOUT = 10.0
+
+
+class SimulatedTarget(Blind):
+    """A blind whose connections go to a ``SimulatedBlind`` behind a simulated proxy."""
+
+    def __init__(self, peripheral: SimulatedBlind, proxy: str | None) -> None:
+        self.peripheral = peripheral
+        self._proxy = proxy
+        super().__init__(peripheral.address, f"simulated {peripheral.address[-5:]}", ble_device=peripheral)
+
+    @property
+    def proxy_source(self) -> str | None:
+        """Return the simulated proxy this blind is reached through."""
+        return self._proxy
+
+    async def _connect_client(self, device):
+        """Connect to the simulated peripheral."""
+        return await self.peripheral.establish()
+
+
+def read_targets(path: str) -> list[tuple[str, str]]:
+    """Return (MAC, name) pairs from a CSV file."""
+    targets = []
+    with open(path, newline="", encoding="utf-8") as file:
+        for row in csv.reader(file):
+            if not row or not row[0].strip() or row[0].lstrip().startswith("#"):
+                continue
+            address = row[0].strip().upper()
+            if not MAC_PATTERN.match(address):
+                if not targets:
+                    continue  # header row
+                raise ValueError(f"{path}: {row[0]!r} is not a MAC address")
+            name = row[1].strip() if len(row) > 1 and row[1].strip() else address
+            targets.append((address, name))
+    return targets
+
+
+def _parse_days(value: str) -> list[str]:
+    days = [day.strip().lower()[:3] for day in value.split(",") if day.strip()]
+    unknown = [day for day in days if day not in DAYS]
+    if unknown or not days:
+        raise argparse.ArgumentTypeError(f"days must be a comma separated list of {', '.join(DAYS)}")
+    return days
+
+
+def _parse_position(value: str) -> float:
+    position = float(value)
+    if not 0 <= position <= 100:
+        raise argparse.ArgumentTypeError("position must be between 0 and 100")
+    return position
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for ``python -m tuiss``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tuiss", description="Control Tuiss blinds over Bluetooth."
+    )
+    parser.add_argument("--csv", metavar="FILE", help="read blind MAC addresses (and names) from a CSV file")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_FLEET_CONCURRENCY, help="blinds driven at once")
+    parser.add_argument(
+        "--slots-per-proxy", type=int, default=DEFAULT_SLOTS_PER_PROXY, help="connections held at once per proxy"
+    )
+    parser.add_argument("--attempts", type=int, default=DEFAULT_RESTART_ATTEMPTS, help="connection attempts per blind")
+    parser.add_argument(
+        "--scan-timeout", type=float, default=DEFAULT_SCAN_TIMEOUT, help="seconds to scan for the blinds"
+    )
+    parser.add_argument("--simulate", type=int, metavar="N", help="drive N simulated blinds instead of real ones")
+    parser.add_argument("--proxies", type=int, default=0, help="simulated proxies the simulated blinds are spread over")
+    parser.add_argument("--realtime", action="store_true", help="run a simulation on the real clock")
+    parser.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("scan", help="list the Tuiss blinds in range")
+    for name, help_text in (
+        ("open", "open the blinds"),
+        ("close", "close the blinds"),
+        ("position", "read the blinds' positions"),
+        ("battery", "read the blinds' battery state"),
+        ("timers", "read the timers stored on the blinds"),
+        ("clear-timers", "delete every timer on the blinds"),
+    ):
+        commands.add_parser(name, help=help_text).add_argument("macs", nargs="*", metavar="MAC")
+    set_parser = commands.add_parser("set", help="move the blinds to a position")
+    set_parser.add_argument("position", type=_parse_position, help="percent open (0-100)")
+    set_parser.add_argument("macs", nargs="*", metavar="MAC")
+    timer_parser = commands.add_parser("add-timer", help="program a timer on the blinds")
+    timer_parser.add_argument("--days", type=_parse_days, required=True, help="e.g. mon,tue,wed")
+    timer_parser.add_argument("--time", required=True, help="HH:MM")
+    timer_parser.add_argument("--position", type=_parse_position, required=True, help="percent open (0-100)")
+    timer_parser.add_argument("macs", nargs="*", metavar="MAC")
+    return parser
+
+
+async def _async_move(blind: Blind, position: float) -> dict[str, Any]:
+    """Move like the cover entity does: position is percent open."""
+    current = blind.current_position if blind.current_position is not None else 0
+    await blind.async_move_cover(
+        movement_direction=1 if current <= position else -1,
+        target_position=100 - position,
+    )
+    return {"position": blind.current_position, **blind.op_stats}
+
+
+async def _async_battery(blind: Blind) -> dict[str, Any]:
+    await blind.get_battery_status()
+    battery = {True: "low", False: "ok"}.get(blind._battery_status, "unknown")
+    return {"battery": battery, **blind.op_stats}
+
+
+async def _async_position(blind: Blind) -> dict[str, Any]:
+    await blind.get_blind_position()
+    return {"position": blind.current_position, **blind.op_stats}
+
+
+async def _async_timers(blind: Blind) -> dict[str, Any]:
+    return {"timers": await blind.async_read_timers(), **blind.timer_slot_usage}
+
+
+async def _async_clear_timers(blind: Blind) -> dict[str, Any]:
+    # The reset erases every slot without reading the table first
+    await blind.delete_all_timers()
+    return blind.timer_slot_usage
+
+
+def _operation(args: argparse.Namespace) -> Callable[[Blind], Awaitable[Any]]:
+    """Return the per-blind coroutine function for a command."""
+    match args.command:
+        case "open":
+            return lambda blind: _async_move(blind, 100)
+        case "close":
+            return lambda blind: _async_move(blind, 0)
+        case "set":
+            return lambda blind: _async_move(blind, args.position)
+        case "position":
+            return _async_position
+        case "battery":
+            return _async_battery
+        case "timers":
+            return _async_timers
+        case "clear-timers":
+            return _async_clear_timers
+        case "add-timer":
+            return lambda blind: blind.async_add_timer(args.days, args.time, args.position)
+    raise ValueError(args.command)
+
+
+async def async_scan(timeout: float) -> list[dict[str, Any]]:
+    """Return the Tuiss blinds heard during a scan, strongest first."""
+    from bleak import BleakScanner
+
+    found = await BleakScanner.discover(timeout=timeout, return_adv=True)
+    blinds = [
+        {"address": device.address, "name": advertisement.local_name, "rssi": advertisement.rssi}
+        for device, advertisement in found.values()
+        if advertisement.local_name in MODEL_NAMES
+    ]
+    return sorted(blinds, key=lambda blind: blind["rssi"], reverse=True)
+
+
+async def _async_resolve(targets: list[tuple[str, str]], timeout: float) -> dict[str, Blind]:
+    """Scan once for every target and return a blind per address."""
+    from bleak import BleakScanner
+
+    found = await BleakScanner.discover(timeout=timeout)
+    devices = {device.address.upper(): device for device in found}
+    return {address: Blind(address, name, ble_device=devices.get(address)) for address, name in targets}
+
+
+def simulated_targets(count: int, proxies: int) -> dict[str, Blind]:
+    """Return ``count`` simulated blinds, spread round robin over ``proxies`` proxies."""
+    blinds = {}
+    for index in range(count):
+        address = f"5E:00:00:00:{index // 256:02X}:{index % 256:02X}"
+        proxy = f"proxy_{index % proxies}" if proxies > 0 else None
+        blinds[address] = SimulatedTarget(SimulatedBlind(address), proxy)
+    return blinds
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run a command against every target and return the fan-out outcome."""
+    if args.simulate:
+        blinds = simulated_targets(args.simulate, args.proxies)
+    else:
+        targets = [(mac.upper(), mac.upper()) for mac in args.macs]
+        if args.csv:
+            targets += read_targets(args.csv)
+        if not targets:
+            raise SystemExit("no blinds given: pass MAC addresses, --csv FILE or --simulate N")
+        blinds = await _async_resolve(targets, args.scan_timeout)
+
+    operation = _operation(args)
+
+    async def run(blind: Blind) -> Any:
+        if blind._ble_device is None:
+            raise DeviceNotFound(f"{blind.name}: not found during the scan")
+        blind._restart_attempts = args.attempts
+        return await operation(blind)
+
+    outcome = await async_fan_out(
+        blinds,
+        run,
+        concurrency=args.concurrency,
+        slots_per_proxy=args.slots_per_proxy,
+        proxy_of=lambda blind: blind.proxy_source,
+    )
+    wall_time = outcome["wall_time"]
+    outcome["throughput_per_minute"] = round(outcome["succeeded"] * 60 / wall_time, 1) if wall_time else None
+    return outcome
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point of ``python -m tuiss``."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if args.command == "scan":
+        print(json.dumps(asyncio.run(async_scan(args.scan_timeout)), indent=2))
+        return 0
+    if args.simulate and not args.realtime:
+        outcome = run_virtual(async_run(args))
+        outcome["virtual_time"] = True
+    else:
+        outcome = asyncio.run(async_run(args))
+    json.dump(outcome, sys.stdout, indent=2, default=str)
+    print()
+    return 0 if outcome["failed"] == 0 else 1
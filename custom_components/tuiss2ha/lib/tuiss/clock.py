@@ -0,0 +1,75 @@
+"""Clock used for every duration the integration measures.
+
+Move times, timeouts, latencies and position ageing are measured on the
+event loop clock. It is monotonic, so NTP corrections and DST changes do
+not stretch or reverse a measured move, and an event loop running on
+virtual time drives it in tests. Wall-clock time is only used for what
+the blind or the user sees, such as the timestamp sent to the blind.
+
+``VirtualTimeLoop`` is that loop: whenever every task is waiting on a
+timer it jumps straight to the next one, so a 120 second move timeout
+or a run of 2 second retry sleeps completes instantly, in the same order
+every run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import selectors
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+Clock = Callable[[], float]
+T = TypeVar("T")
+
+
+def loop_time() -> float:
+    """Return the running event loop's time, or time.monotonic() outside a loop."""
+    try:
+        return asyncio.get_running_loop().time()
+    except RuntimeError:
+        return time.monotonic()
+
+
+class _InstantSelector(selectors.DefaultSelector):
+    """Selector that advances the loop's virtual time instead of sleeping."""
+
+    loop: VirtualTimeLoop
+
+    def select(self, timeout: float | None = None):
+        if timeout is None:
+            # Nothing scheduled: only real I/O (e.g. an executor job) can wake us
+            return super().select(None)
+        ready = super().select(0)
+        if not ready and timeout > 0:
+            self.loop.advance(timeout)
+        return ready
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock only moves when every task waits on a timer."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        selector = _InstantSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self._virtual_time = start
+
+    def time(self) -> float:
+        """Return the virtual time in seconds."""
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """Move the virtual clock forward."""
+        self._virtual_time += seconds
+
+
+def run_virtual(main: Awaitable[T], start: float = 0.0) -> T:
+    """Run ``main`` to completion on a fresh ``VirtualTimeLoop``."""
+    loop = VirtualTimeLoop(start)
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
@@ -0,0 +1,94 @@
+"""Protocol and movement constants for Tuiss blinds."""
+
+TIMEOUT_SECONDS = 120
+TRAVERSAL_UPDATE_THRESHOLD = 5
+# Move time estimates for blinds whose traversal speed has not been learned yet (%/s)
+DEFAULT_TRAVERSAL_SPEED = 3.0
+# Connect, handshake and disconnect time added to every move estimate (seconds)
+MOVE_CONNECTION_OVERHEAD = 5.0
+# Upper bounds (seconds) of the latency histogram buckets kept per blind and proxy
+METRIC_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Repeats of a throttled hub debug event are dropped for this many seconds
+LOG_THROTTLE_SECONDS = 10.0
+# Recent BLE frames and connection events kept per blind for diagnostics
+FRAME_LOG_SIZE = 200
+BLIND_NOTIFY_CHARACTERISTIC = "00010304-0405-0607-0809-0a0b0c0d1910"
+CONNECTION_MESSAGE = "ff03030303787878787878"
+INITIALIZATION_MESSAGE = "ff78ea41d10301"
+UUID = "00010405-0405-0607-0809-0a0b0c0d1910"
+
+# BLE Protocol Commands
+CMD_HEARTBEAT = "ff010101010101"
+CMD_STOP = "ff78ea415f0301"
+CMD_BATTERY_STATUS = "ff78ea41f00301"
+CMD_SPEED_STANDARD = "ff78ea41f202"
+CMD_SPEED_COMFORT = "ff78ea41f201"
+CMD_SPEED_SLOW = "ff78ea41f200"
+CMD_LIMITS_INIT_2 = "ff78ea41210301"
+CMD_LIMITS_STEP_UP = "ff78ea41220301"
+CMD_LIMITS_STEP_DOWN = "ff78ea41230301"
+CMD_LIMITS_MOVE_UP = "ff78ea41cf0301"
+CMD_LIMITS_MOVE_DOWN = "ff78ea411f0301"
+CMD_LIMITS_SET = "ff78ea41410301"
+CMD_TIMER_REQUEST = "ff78ea4104"
+CMD_TIMESTAMP_BASE = "ff78ea410200"
+CMD_TIMER_DELETE_BASE = "ff78ea410301"
+CMD_TIMER_RESET = "ff04040404"
+CMD_BLIND_REACTIVATE = "ff02020202787878787878"
+CMD_MOVE_BASE = "ff78ea41bf03"
+CMD_TIMER_WRITE_BASE = "ff78ea410300"
+
+# Opcodes (5th byte) of the notifications the blind sends
+OPCODE_STATUS = 0xD2  # battery reply and progress while moving
+OPCODE_TIMER_SLOT = 0xD6  # next free timer slot
+
+# Firmware timer slots available on each blind
+MAX_TIMERS = 16
+
+# Advertised local names of the supported blinds
+MODEL_NAMES = ("TS3000", "TS5200", "TS5001", "TS5101", "TS5300", "TS2600", "TS2900")
+
+DEFAULT_RESTART_ATTEMPTS = 4
+# Skipping moves the blind is already at is opt-in: 0 sends every move
+DEFAULT_MOVE_TOLERANCE = 0
+
+# Confidence in a freshly recorded position, by where it came from. Confidence
+# halves every POSITION_CONFIDENCE_HALF_LIFE hours (remotes and the app can move
+# the blind without it being reported); moves are only skipped above MIN_SKIP_CONFIDENCE.
+POSITION_SOURCE_CONFIDENCE = {
+    "blind": 1.0,  # reported by the blind
+    "move": 0.9,  # move that reached its target
+    "timer": 0.7,  # firmware timer ran
+    "estimate": 0.5,  # move timed out, position assumed
+    "restored": 0.5,  # restored after a restart
+}
+POSITION_CONFIDENCE_HALF_LIFE = 12
+MIN_SKIP_CONFIDENCE = 0.6
+# Only positions the blind confirmed can skip a move; a timer may not have run
+# and estimated or restored positions may be stale.
+SKIP_TRUSTED_SOURCES = ("blind", "move")
+
+
+class BlindError(Exception):
+    """Error to indicate a blind operation failed.
+
+    ``key`` and ``placeholders`` identify the failure so an integration
+    can show a translated message instead of the English one.
+    """
+
+    def __init__(self, message: str, key: str | None = None, **placeholders: str) -> None:
+        super().__init__(message)
+        self.key = key
+        self.placeholders = placeholders
+
+
+class DeviceNotFound(Exception):
+    """Error to indicate the device is not found."""
+
+
+class ConnectionTimeout(Exception):
+    """Error to indicate a connection timeout."""
+
+
+class NoConnectableBluetoothAdapter(Exception):
+    """Error to indicate no Bluetooth adapter can connect (e.g. Shelly is passive-only)."""
@@ -0,0 +1,176 @@
+"""Fan-out of per-blind operations across many blinds.
+
+Runs one coroutine per target with a global concurrency limit and a
+per-proxy limit, so a floor of blinds behind the same Bluetooth proxy
+does not ask it for more connections than it can hold. Every target
+gets a result entry; one blind failing never cancels the others.
+
+``plan_longest_first`` orders jobs so the longest moves take a slot
+first, which keeps the total completion time of a batch close to the
+longest single job. ``StartBarrier`` lets a group of prepared blinds send their move
+commands together, so a facade starts moving as one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import logging
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Any, TypeVar
+
+from .clock import loop_time
+
+_LOGGER = logging.getLogger(__name__)
+
+# ESPHome Bluetooth proxies hold three active connections at a time.
+DEFAULT_SLOTS_PER_PROXY = 3
+DEFAULT_FLEET_CONCURRENCY = 6
+# How long prepared blinds wait for slower ones before starting anyway.
+DEFAULT_START_BARRIER_TIMEOUT = 20.0
+
+T = TypeVar("T")
+
+
+async def async_fan_out(
+    targets: dict[str, T],
+    operation: Callable[[T], Awaitable[Any]],
+    *,
+    concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+    slots_per_proxy: int = DEFAULT_SLOTS_PER_PROXY,
+    proxy_of: Callable[[T], Hashable | None] | None = None,
+) -> dict[str, Any]:
+    """Run ``operation`` for every target and collect a per-target result map.
+
+    ``targets`` maps a label (usually the entity_id) to the object passed
+    to ``operation``. ``proxy_of`` returns the proxy/adapter a target is
+    reached through; targets without a known proxy only count against the
+    global limit. The returned dict holds ``results`` (label -> outcome),
+    ``succeeded``, ``failed`` and the total ``wall_time`` in seconds.
+    """
+    global_slots = asyncio.Semaphore(max(concurrency, 1))
+    proxy_slots: dict[Hashable, asyncio.Semaphore] = {}
+    results: dict[str, dict[str, Any]] = {}
+    started = loop_time()
+
+    async def _run(label: str, target: T) -> None:
+        proxy = proxy_of(target) if proxy_of else None
+        if proxy is not None and proxy not in proxy_slots:
+            proxy_slots[proxy] = asyncio.Semaphore(max(slots_per_proxy, 1))
+        outcome: dict[str, Any] = {"proxy": str(proxy) if proxy is not None else None}
+        # Take the proxy slot first so a blind queued behind a busy proxy
+        # does not hold one of the global slots while it waits.
+        async with proxy_slots[proxy] if proxy is not None else contextlib.nullcontext():
+            async with global_slots:
+                op_started = loop_time()
+                try:
+                    outcome["result"] = await operation(target)
+                    outcome["success"] = True
+                except Exception as e:  # noqa: BLE001
+                    _LOGGER.warning("Fleet operation failed for %s: %s", label, e)
+                    outcome["success"] = False
+                    outcome["error"] = str(e) or type(e).__name__
+                outcome["duration"] = round(loop_time() - op_started, 3)
+        results[label] = outcome
+
+    await asyncio.gather(*(_run(label, target) for label, target in targets.items()))
+    succeeded = sum(1 for outcome in results.values() if outcome["success"])
+    return {
+        "results": {label: results[label] for label in targets},
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "wall_time": round(loop_time() - started, 3),
+    }
+
+
+
+def plan_longest_first(
+    durations: dict[str, float],
+    proxies: dict[str, Hashable | None],
+    *,
+    concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+    slots_per_proxy: int = DEFAULT_SLOTS_PER_PROXY,
+) -> tuple[list[str], float]:
+    """Order jobs longest-processing-time first and predict the makespan.
+
+    Each job holds one global slot and one slot of its proxy for its
+    estimated duration. Jobs are placed greedily, longest first, into the
+    earliest start where both are free, which is how ``async_fan_out``
+    hands out slots when the targets are passed in the returned order.
+    Returns the job order and the predicted makespan in seconds.
+    """
+    order = sorted(durations, key=lambda label: durations[label], reverse=True)
+    global_free = [0.0] * max(concurrency, 1)
+    proxy_free: dict[Hashable, list[float]] = {}
+    makespan = 0.0
+    for label in order:
+        proxy = proxies.get(label)
+        start = global_free[0]
+        if proxy is not None:
+            slots = proxy_free.setdefault(proxy, [0.0] * max(slots_per_proxy, 1))
+            start = max(start, slots[0])
+            heapq.heapreplace(slots, start + durations[label])
+        end = start + durations[label]
+        heapq.heapreplace(global_free, end)
+        makespan = max(makespan, end)
+    return order, round(makespan, 2)
+
+
+class StartBarrier:
+    """Hold armed blinds until the whole group is armed, then release them together.
+
+    Each blind calls ``async_wait`` once it is connected and ready to
+    write its move command, and ``mark_sent`` when the write completed.
+    The coordinator calls ``leave`` for every blind once its move has
+    finished or failed, so a blind that never reaches the barrier does
+    not hold the others back. If the group is not complete within
+    ``timeout`` seconds the blinds that are ready start anyway.
+    """
+
+    def __init__(self, parties: Iterable[str], timeout: float = DEFAULT_START_BARRIER_TIMEOUT) -> None:
+        self._waiting = set(parties)
+        self._timeout = timeout
+        self._released = asyncio.Event()
+        self.released_at: float | None = None
+        self.sent_at: dict[str, float] = {}
+        self._check()
+
+    async def async_wait(self, party: str) -> None:
+        """Mark ``party`` as ready and wait until the group is released."""
+        self._waiting.discard(party)
+        self._check()
+        try:
+            await asyncio.wait_for(self._released.wait(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            _LOGGER.warning(
+                "Start barrier timed out after %ss; still waiting for %s",
+                self._timeout, ", ".join(sorted(self._waiting)),
+            )
+            self._release()
+
+    def leave(self, party: str) -> None:
+        """Drop ``party`` from the group if it has not reached the barrier."""
+        if party in self._waiting:
+            self._waiting.discard(party)
+            self._check()
+
+    def mark_sent(self, party: str) -> None:
+        """Record when ``party`` finished writing its move command."""
+        self.sent_at[party] = loop_time()
+
+    @property
+    def skew_ms(self) -> float | None:
+        """Spread between the first and last move command, in milliseconds."""
+        if not self.sent_at:
+            return None
+        return round((max(self.sent_at.values()) - min(self.sent_at.values())) * 1000, 1)
+
+    def _check(self) -> None:
+        if not self._waiting:
+            self._release()
+
+    def _release(self) -> None:
+        if not self._released.is_set():
+            self.released_at = loop_time()
+            self._released.set()
@@ -0,0 +1,142 @@
+"""Counters, latency histograms and hot-path debug logging for blinds."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from typing import Any
+
+from .clock import Clock, loop_time
+from .const import LOG_THROTTLE_SECONDS, METRIC_BUCKETS
+
+
+class MetricsRegistry:
+    """Counters and latency histograms of BLE activity, per blind and per proxy.
+
+    Every sample is recorded against the blind and against the adapter or
+    proxy that reached it, so a struggling proxy shows up across all the
+    blinds behind it. Histograms keep count, sum, min, max, last and the
+    number of samples in each ``METRIC_BUCKETS`` bucket.
+    """
+
+    def __init__(self) -> None:
+        self._blinds: dict[str, dict[str, dict[str, Any]]] = {}
+        self._proxies: dict[str, dict[str, dict[str, Any]]] = {}
+
+    def increment(self, blind_id: str, proxy: str | None, name: str, value: float = 1) -> None:
+        """Add ``value`` to the counter ``name``."""
+        for series in self._series(blind_id, proxy):
+            counters = series["counters"]
+            counters[name] = counters.get(name, 0) + value
+
+    def observe(self, blind_id: str, proxy: str | None, name: str, seconds: float) -> None:
+        """Record a duration in the histogram ``name``."""
+        bucket = bisect.bisect_left(METRIC_BUCKETS, seconds)
+        for series in self._series(blind_id, proxy):
+            histogram = series["histograms"].get(name)
+            if histogram is None:
+                histogram = series["histograms"][name] = {
+                    "count": 0,
+                    "sum": 0.0,
+                    "min": seconds,
+                    "max": seconds,
+                    "buckets": [0] * (len(METRIC_BUCKETS) + 1),
+                }
+            histogram["count"] += 1
+            histogram["sum"] += seconds
+            histogram["min"] = min(histogram["min"], seconds)
+            histogram["max"] = max(histogram["max"], seconds)
+            histogram["last"] = seconds
+            histogram["buckets"][bucket] += 1
+
+    def snapshot(self, blind_id: str | None = None) -> dict[str, Any]:
+        """Return the metrics of one blind, or of every blind and proxy."""
+        if blind_id is not None:
+            return self._export(self._blinds.get(blind_id))
+        return {
+            "blinds": {key: self._export(series) for key, series in self._blinds.items()},
+            "proxies": {key: self._export(series) for key, series in self._proxies.items()},
+        }
+
+    def remove(self, blind_id: str) -> None:
+        """Forget a blind's series; the proxy series keep its past samples."""
+        self._blinds.pop(blind_id, None)
+
+    def _series(self, blind_id: str, proxy: str | None) -> list[dict[str, dict[str, Any]]]:
+        targets = [self._blinds.setdefault(blind_id, {"counters": {}, "histograms": {}})]
+        if proxy is not None:
+            targets.append(self._proxies.setdefault(str(proxy), {"counters": {}, "histograms": {}}))
+        return targets
+
+    @staticmethod
+    def _export(series: dict[str, dict[str, Any]] | None) -> dict[str, Any]:
+        if series is None:
+            return {"counters": {}, "histograms": {}}
+        labels = [str(bound) for bound in METRIC_BUCKETS] + ["+Inf"]
+        return {
+            "counters": {name: round(value, 3) for name, value in series["counters"].items()},
+            "histograms": {
+                name: {
+                    "count": histogram["count"],
+                    "sum": round(histogram["sum"], 3),
+                    "avg": round(histogram["sum"] / histogram["count"], 3),
+                    "min": round(histogram["min"], 3),
+                    "max": round(histogram["max"], 3),
+                    "last": round(histogram["last"], 3),
+                    "buckets": dict(zip(labels, histogram["buckets"])),
+                }
+                for name, histogram in series["histograms"].items()
+            },
+        }
+
+
+# Shared by every blind so the proxy series aggregate across config entries
+METRICS = MetricsRegistry()
+
+
+class BlindLogger:
+    """Debug logging for the hot paths of one blind.
+
+    Records are compact ``<blind>: <event> key=value ...`` lines. Nothing
+    is formatted unless debug logging is enabled: fields are passed as raw
+    values and bytes are only turned into hex when a record is emitted.
+    Throttled events are emitted at most once per ``LOG_THROTTLE_SECONDS``;
+    the next record reports how many were dropped.
+    """
+
+    def __init__(self, logger: logging.Logger, name: str, clock: Clock = loop_time) -> None:
+        self._logger = logger
+        self.name = name
+        self._clock = clock
+        # event -> (clock time last emitted, records dropped since)
+        self._throttled: dict[str, tuple[float, int]] = {}
+
+    def debug(self, event: str, *, throttle: bool = False, **fields: Any) -> None:
+        """Emit a debug event record."""
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        if throttle:
+            now = self._clock()
+            last, dropped = self._throttled.get(event, (None, 0))
+            if last is not None and now - last < LOG_THROTTLE_SECONDS:
+                self._throttled[event] = (last, dropped + 1)
+                return
+            self._throttled[event] = (now, 0)
+            if dropped:
+                fields["dropped"] = dropped
+        self._logger.debug(
+            "%s: %s %s",
+            self.name,
+            event,
+            " ".join(f"{key}={_log_value(value)}" for key, value in fields.items()),
+            stacklevel=2,
+        )
+
+
+def _log_value(value: Any) -> Any:
+    """Render bytes as hex and round floats for compact log records."""
+    if isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    if isinstance(value, float):
+        return round(value, 2)
+    return value
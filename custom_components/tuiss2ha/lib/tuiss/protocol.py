@@ -0,0 +1,107 @@
+"""Frame building and decoding for the Tuiss BLE protocol.
+
+Commands are built as hex strings, the form the constants are kept in;
+notifications are decoded from the list of byte values ``split_data``
+returns. Positions on the wire are in the blind's own scale (0 = open,
+100 = closed) with 0.1% resolution.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from .const import (
+    CMD_MOVE_BASE,
+    CMD_TIMESTAMP_BASE,
+    CMD_TIMER_DELETE_BASE,
+    CMD_TIMER_WRITE_BASE,
+    OPCODE_STATUS,
+    OPCODE_TIMER_SLOT,
+)
+from .schedule import days_to_bitmask
+
+
+def position_command(user_percent: float) -> str:
+    """Return the move command for a position in percent open (0-100)."""
+    # Tuiss uses an inverted percentage (0=open, 100=closed)
+    tuiss_percent = 100 - user_percent
+
+    # Calculate the absolute position value (0-1000)
+    total_val = int(round(tuiss_percent * 10))
+
+    # Lower byte (position) then upper byte (group)
+    return f"{CMD_MOVE_BASE}{total_val % 256:02x}{total_val // 256:02x}"
+
+
+def timestamp_command(now: datetime.datetime) -> str:
+    """Return the command that sets the blind's clock to ``now``."""
+    return (
+        f"{CMD_TIMESTAMP_BASE}{now.year - 2000:02x}{now.month:02x}{now.day:02x}"
+        f"{now.hour:02x}{now.minute:02x}{now.second:02x}"
+    )
+
+
+def timer_command(index: str, days: list[str], time: str, position: float) -> str:
+    """Return the command that writes a timer to slot ``index``."""
+    day_bits = days_to_bitmask(days)
+
+    # Convert time to minutes since midnight
+    time_parts = time.split(":")
+    hours = int(time_parts[0])
+    minutes = int(time_parts[1])
+
+    # Convert position to fixed-point (e.g., multiply by 10)
+    target_position_value = int(float(position) * 10)
+    position_byte_1 = target_position_value % 256
+    position_byte_2 = target_position_value // 256
+
+    cmd_hex = CMD_TIMER_WRITE_BASE
+    cmd_hex += f"{int(index):02x}"   # Timer index converted to hex
+    cmd_hex += "b2"   # not sure
+    cmd_hex += "3f"   # not sure
+    cmd_hex += f"{day_bits:02x}" # Days bitmask
+    cmd_hex += f"{hours:02x}" # Time hours
+    cmd_hex += f"{minutes:02x}" # Time minutes
+    cmd_hex += "00"  # Padding
+    cmd_hex += f"{position_byte_1:02x}" # Position byte
+    cmd_hex += f"{position_byte_2:02x}" # Position byte
+
+    return cmd_hex
+
+
+def timer_delete_command(timer_id: str) -> str:
+    """Return the command that erases timer slot ``timer_id``."""
+    return f"{CMD_TIMER_DELETE_BASE}{int(timer_id):02x}"
+
+
+def decode_position(decimals: list[int]) -> float:
+    """Return the position from the reply to a position request."""
+    return (decimals[7] + (256 * decimals[8])) / 10
+
+
+def decode_progress(decimals: list[int]) -> int | None:
+    """Return the position from a progress notification sent while moving."""
+    if len(decimals) >= 9 and decimals[4] == OPCODE_STATUS:
+        return decimals[6]
+    return None
+
+
+def decode_battery(decimals: list[int]) -> bool | None:
+    """Return True if a battery reply asks for a charge, False if the battery is good.
+
+    A short reply means "charge me": ff010203d2 (bad) vs ff010203d202e803
+    (good). None if the reply cannot be read.
+    """
+    if len(decimals) == 7 or decimals[5] >= 10:
+        return True
+    if decimals[5] < 10:
+        return False
+    return None
+
+
+def decode_timer_slot(decimals: list[int]) -> str | None:
+    """Return the free timer slot from a slot reply, or None for other frames."""
+    # The slot reply is 7 bytes long with opcode 0xd6
+    if len(decimals) >= 7 and decimals[4] == OPCODE_TIMER_SLOT:
+        return str(decimals[6])
+    return None
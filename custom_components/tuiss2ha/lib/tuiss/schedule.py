@@ -0,0 +1,128 @@
+"""Timer schedule helpers for the Tuiss firmware timer slots.
+
+Pure functions only (no Home Assistant or BLE imports) so the timer
+model can be reasoned about, and tested, without a blind.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Firmware day bitmask, as used by the 0x03 timer write frame.
+DAY_BITS = {"sun": 1, "mon": 2, "tue": 4, "wed": 8, "thu": 16, "fri": 32, "sat": 64}
+DAY_ORDER = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# Bytes that follow the slot index in every timer record ("b2 3f").
+TIMER_RECORD_MARKER = (0xB2, 0x3F)
+
+
+def days_to_bitmask(days: list[str]) -> int:
+    """Convert a list of day names to the firmware day bitmask."""
+    return sum(DAY_BITS[day] for day in set(days) if day in DAY_BITS)
+
+
+def bitmask_to_days(bits: int) -> list[str]:
+    """Convert a firmware day bitmask back to ordered day names."""
+    return [day for day in DAY_ORDER if bits & DAY_BITS[day]]
+
+
+def normalize_time(value: Any) -> str:
+    """Return ``HH:MM`` for a time given as ``HH:MM``, ``HH:MM:SS`` or a time object."""
+    parts = str(value).split(":")
+    return f"{int(parts[0]):02d}:{int(parts[1]):02d}"
+
+
+def position_units(position: float) -> int:
+    """Return the position in firmware units (0.1% steps)."""
+    return int(float(position) * 10)
+
+
+def timer_key(timer: dict) -> tuple[int, str, int]:
+    """Identity of a timer as the firmware sees it: (days, time, position)."""
+    return (
+        days_to_bitmask(timer.get("days", [])),
+        normalize_time(timer.get("time", "00:00")),
+        position_units(timer.get("position", 0)),
+    )
+
+
+def decode_timer_record(decimals: list[int]) -> dict | None:
+    """Decode a timer record from a notification, or None if it is not one.
+
+    Records use the same layout as the timer write frame: slot index,
+    the ``b2 3f`` marker, day bitmask, hours, minutes, a padding byte and
+    the little-endian position in 0.1% steps.
+    """
+    for i in range(1, len(decimals) - 7):
+        if (decimals[i], decimals[i + 1]) != TIMER_RECORD_MARKER:
+            continue
+        index = decimals[i - 1]
+        day_bits, hours, minutes = decimals[i + 2], decimals[i + 3], decimals[i + 4]
+        position_value = decimals[i + 6] + 256 * decimals[i + 7]
+        if not (0 < day_bits < 128 and hours < 24 and minutes < 60 and position_value <= 1000):
+            continue
+        return {
+            "timer_id": str(index),
+            "days": bitmask_to_days(day_bits),
+            "time": f"{hours:02d}:{minutes:02d}",
+            "position": position_value / 10,
+        }
+    return None
+
+
+def pack_timers(schedules: list[dict]) -> list[dict]:
+    """Merge schedules into the fewest firmware timers.
+
+    A firmware timer fires on any day in its bitmask, so schedules that
+    share a time and position only need one slot: their days are OR-ed
+    together. Schedules with no days never fire and are dropped.
+    """
+    packed: dict[tuple[str, int], int] = {}
+    for schedule in schedules:
+        bits = days_to_bitmask(schedule.get("days", []))
+        if not bits:
+            continue
+        key = (normalize_time(schedule["time"]), position_units(schedule["position"]))
+        packed[key] = packed.get(key, 0) | bits
+    return [
+        {"days": bitmask_to_days(bits), "time": time, "position": units / 10}
+        for (time, units), bits in sorted(packed.items())
+    ]
+
+
+def diff_timers(
+    current: dict[str, dict], desired: list[dict]
+) -> tuple[list[str], list[dict]]:
+    """Return the minimal (slot ids to delete, timers to add) to reach ``desired``.
+
+    Timers are matched on their firmware identity, so a slot that already
+    holds an identical schedule is left alone. Duplicate slots are deleted.
+    """
+    wanted: dict[tuple[int, str, int], int] = {}
+    for timer in desired:
+        key = timer_key(timer)
+        wanted[key] = wanted.get(key, 0) + 1
+
+    to_delete: list[str] = []
+    for timer_id, timer in sorted(current.items(), key=lambda item: _slot_sort(item[0])):
+        key = timer_key(timer)
+        if wanted.get(key):
+            wanted[key] -= 1
+        else:
+            to_delete.append(timer_id)
+
+    to_add: list[dict] = []
+    for timer in desired:
+        key = timer_key(timer)
+        if wanted.get(key):
+            wanted[key] -= 1
+            to_add.append(timer)
+    return to_delete, to_add
+
+
+def _slot_sort(timer_id: str) -> tuple[int, str]:
+    """Sort slot ids numerically where possible."""
+    try:
+        return (int(timer_id), "")
+    except ValueError:
+        return (0, timer_id)
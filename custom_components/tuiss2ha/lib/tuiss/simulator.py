@@ -0,0 +1,194 @@
+"""Simulated Tuiss blind for tests, benchmarks and load testing.
+
+``SimulatedBlind`` stands in for both the BLE device and the connected
+Bleak client: ``establish`` takes the arguments of
+``bleak_retry_connector.establish_connection`` and returns the simulated
+blind itself as the client. It answers position and battery requests,
+moves at a fixed speed reporting progress once a second, keeps timer
+slots, and can be told to fail connections, ignore requests or jam part
+way through a move.
+
+It only waits with asyncio sleeps and loop timers, so it runs unchanged
+on a ``clock.VirtualTimeLoop``. Positions are kept in the scale the blind
+reports in its frames.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# Every Tuiss command starts with this prefix; the next byte is the opcode
+COMMAND_PREFIX = bytes.fromhex("ff78ea41")
+OP_MOVE = 0xBF
+OP_POSITION = 0xD1
+OP_BATTERY = 0xF0
+OP_STOP = 0x5F
+OP_TIMER_READ = 0x04
+OP_TIMER_WRITE = 0x03
+OP_TIMER_SLOT = 0xD6
+# Erases every timer slot; unlike the other commands it has no command prefix
+TIMER_RESET = bytes.fromhex("ff04040404")
+MAX_TIMERS = 16
+REPLY_PREFIX = (0xFF, 0x01, 0x02, 0x03)
+# Seconds between progress notifications while moving
+PROGRESS_INTERVAL = 1.0
+
+NotifyCallback = Callable[[Any, bytearray], Awaitable[None]]
+
+
+class SimulatedBlind:
+    """A Tuiss blind that lives in the event loop."""
+
+    def __init__(
+        self,
+        address: str = "AA:BB:CC:00:00:01",
+        *,
+        position: float = 0.0,
+        speed: float = 5.0,
+        battery_low: bool = False,
+        connect_delay: float = 0.5,
+        reply_delay: float = 0.05,
+        connect_failures: int = 0,
+        silent: bool = False,
+        jam_at: float | None = None,
+    ) -> None:
+        self.address = address
+        self.name = "TS5200"
+        self.position = position
+        self.speed = speed
+        self.battery_low = battery_low
+        self.connect_delay = connect_delay
+        self.reply_delay = reply_delay
+        # Connection attempts that fail before one succeeds
+        self.connect_failures = connect_failures
+        # Ignore every request (the blind never answers)
+        self.silent = silent
+        # The motor stalls at this position and reports nothing more
+        self.jam_at = jam_at
+        self.is_connected = False
+        self.connects = 0
+        self.writes: list[bytes] = []
+        # Timer slot -> the record bytes after the write header (index onwards)
+        self.timers: dict[int, bytes] = {}
+        self._notify: NotifyCallback | None = None
+        self._move_task: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def moving(self) -> bool:
+        """Return True while the motor is running."""
+        return self._move_task is not None and not self._move_task.done()
+
+    async def establish(self, *args: Any, **kwargs: Any) -> SimulatedBlind:
+        """Connect, after ``connect_delay``, unless a failure is still due."""
+        self.connects += 1
+        await asyncio.sleep(self.connect_delay)
+        if self.connect_failures > 0:
+            self.connect_failures -= 1
+            from bleak.exc import BleakError
+
+            raise BleakError(f"{self.address}: simulated connection failure")
+        self.is_connected = True
+        return self
+
+    async def disconnect(self) -> bool:
+        """Drop the connection; a move in progress carries on."""
+        self.is_connected = False
+        self._notify = None
+        return True
+
+    async def start_notify(self, characteristic: Any, callback: NotifyCallback) -> None:
+        """Subscribe to notifications."""
+        self._notify = callback
+
+    async def stop_notify(self, characteristic: Any) -> None:
+        """Unsubscribe from notifications."""
+        self._notify = None
+
+    async def write_gatt_char(self, characteristic: Any, data: bytes, response: bool = False) -> None:
+        """Receive a command and act on it."""
+        if not self.is_connected:
+            from bleak.exc import BleakError
+
+            raise BleakError(f"{self.address}: not connected")
+        data = bytes(data)
+        self.writes.append(data)
+        if not self.silent and data == TIMER_RESET:
+            self.timers.clear()
+            return
+        if self.silent or len(data) < 5 or data[:4] != COMMAND_PREFIX:
+            return
+        opcode = data[4]
+        if opcode == OP_POSITION:
+            self._reply(self.position_frame())
+        elif opcode == OP_BATTERY:
+            self._reply(self.battery_frame())
+        elif opcode == OP_MOVE and len(data) >= 8:
+            self._stop_motor()
+            self._move_task = asyncio.get_running_loop().create_task(
+                self._async_move((data[6] + 256 * data[7]) / 10)
+            )
+        elif opcode == OP_STOP:
+            self._stop_motor()
+        elif opcode == OP_TIMER_READ:
+            self._reply(*(self.timer_frame(slot) for slot in sorted(self.timers)), self.slot_frame())
+        elif opcode == OP_TIMER_WRITE and len(data) >= 7:
+            if data[5] == 0x00:
+                self.timers[data[6]] = data[6:]
+            elif data[5] == 0x01:
+                self.timers.pop(data[6], None)
+
+    def position_frame(self) -> bytes:
+        """Return the reply to a position request."""
+        units = round(self.position * 10)
+        return bytes([*REPLY_PREFIX, OP_POSITION, 0, 0, units % 256, units // 256])
+
+    def battery_frame(self) -> bytes:
+        """Return the reply to a battery request; a short reply means "charge me"."""
+        if self.battery_low:
+            return bytes([*REPLY_PREFIX, 0xD2, 0, 0])
+        return bytes([*REPLY_PREFIX, 0xD2, 2, 0xE8, 3])
+
+    def timer_frame(self, slot: int) -> bytes:
+        """Return the record the blind reports for a timer slot."""
+        return bytes([*REPLY_PREFIX, OP_TIMER_READ, *self.timers[slot]])
+
+    def slot_frame(self) -> bytes:
+        """Return the reply naming the next free timer slot; it ends a timer read."""
+        free = next((slot for slot in range(1, MAX_TIMERS + 1) if slot not in self.timers), MAX_TIMERS + 1)
+        return bytes([*REPLY_PREFIX, OP_TIMER_SLOT, 0, free])
+
+    def progress_frame(self) -> bytes:
+        """Return the notification sent while moving."""
+        return bytes([*REPLY_PREFIX, 0xD2, 0, round(self.position), 0, 0])
+
+    async def _async_move(self, target: float) -> None:
+        direction = 1 if target > self.position else -1
+        while self.position != target:
+            await asyncio.sleep(PROGRESS_INTERVAL)
+            step = min(self.speed * PROGRESS_INTERVAL, abs(target - self.position))
+            position = self.position + direction * step
+            if self.jam_at is not None and (position - self.jam_at) * direction >= 0:
+                self.position = self.jam_at
+                return
+            self.position = round(position, 1)
+            self._deliver(self.progress_frame())
+
+    def _stop_motor(self) -> None:
+        if self._move_task is not None:
+            self._move_task.cancel()
+            self._move_task = None
+
+    def _reply(self, *frames: bytes) -> None:
+        # One timer for the whole reply keeps its frames in order
+        asyncio.get_running_loop().call_later(self.reply_delay, self._deliver, *frames)
+
+    def _deliver(self, *frames: bytes) -> None:
+        for frame in frames:
+            if not self.is_connected or self._notify is None:
+                return
+            task = asyncio.get_running_loop().create_task(self._notify(None, bytearray(frame)))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,97 @@
+"""Position presets indexed by position for the preset select entity."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+
+# A live position within this many percent of a preset selects it
+PRESET_MATCH_TOLERANCE = 0.5
+# Float slack on the bisect window; the exact tolerance check follows
+_WINDOW_SLACK = 1e-9
+
+
+class PresetMap(dict):
+    """Preset name -> position (percent open), with a sorted index.
+
+    It is a dict, so it stores, compares and serialises like the plain dict
+    it replaces. Every mutation drops the index; the next read rebuilds it
+    once, so the reads between preset changes (every state write while a
+    blind moves) cost a bisect instead of a sort and a scan.
+    """
+
+    __slots__ = ("_names", "_by_position", "_positions")
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Create the map; takes the same arguments as ``dict``."""
+        super().__init__(*args, **kwargs)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._names: list[str] | None = None
+        self._by_position: list[tuple[float, str]] | None = None
+        self._positions: list[float] | None = None
+
+    def __setitem__(self, name: str, position: float) -> None:
+        super().__setitem__(name, position)
+        self._invalidate()
+
+    def __delitem__(self, name: str) -> None:
+        super().__delitem__(name)
+        self._invalidate()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._invalidate()
+        return result
+
+    def pop(self, *args):
+        """Remove a preset and return its position."""
+        result = super().pop(*args)
+        self._invalidate()
+        return result
+
+    def popitem(self):
+        """Remove and return the last preset added."""
+        result = super().popitem()
+        self._invalidate()
+        return result
+
+    def clear(self) -> None:
+        """Remove every preset."""
+        super().clear()
+        self._invalidate()
+
+    def update(self, *args, **kwargs) -> None:
+        """Add or overwrite presets."""
+        super().update(*args, **kwargs)
+        self._invalidate()
+
+    def setdefault(self, name: str, position: float | None = None):
+        """Return the position of ``name``, adding it if missing."""
+        result = super().setdefault(name, position)
+        self._invalidate()
+        return result
+
+    @property
+    def names(self) -> list[str]:
+        """Return the preset names sorted alphabetically (cached; do not modify)."""
+        if self._names is None:
+            self._names = sorted(self)
+        return self._names
+
+    def nearest(self, position: float, tolerance: float = PRESET_MATCH_TOLERANCE) -> str | None:
+        """Return the preset closest to ``position`` within ``tolerance``, else None.
+
+        Presets at the same distance are tie-broken alphabetically.
+        """
+        if self._positions is None:
+            self._by_position = sorted((float(value), name) for name, value in self.items())
+            self._positions = [value for value, _ in self._by_position]
+        low = bisect_left(self._positions, position - tolerance - _WINDOW_SLACK)
+        high = bisect_right(self._positions, position + tolerance + _WINDOW_SLACK)
+        best = None
+        for value, name in self._by_position[low:high]:
+            distance = abs(value - position)
+            if distance <= tolerance and (best is None or (distance, name) < best):
+                best = (distance, name)
+        return best[1] if best else None
@@ -57,7 +57,7 @@ class TuissPresetSelect(SelectEntity):
     @property
     def options(self) -> list[str]:
         """Return preset names sorted alphabetically for stable display."""
-        return sorted(self.blind.presets.keys())
+        return self.blind.presets.names
 
     @property
     def available(self) -> bool:
@@ -66,14 +66,11 @@ class TuissPresetSelect(SelectEntity):
 
     @property
     def current_option(self) -> str | None:
-        """Match the live position to a preset within 0.5% tolerance, else None."""
+        """Match the live position to the nearest preset within 0.5% tolerance, else None."""
         pos = self.blind.current_position
         if pos is None:
             return None
-        for name in sorted(self.blind.presets):
-            if abs(self.blind.presets[name] - pos) <= 0.5:
-                return name
-        return None
+        return self.blind.presets.nearest(pos)
 
     async def async_select_option(self, option: str) -> None:
         """Apply the chosen preset."""
@@ -12,7 +12,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback, ServiceCall
 import voluptuous as vol
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, EntityCategory
+from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT, EntityCategory, UnitOfTime
 from homeassistant.helpers import entity_platform, config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -24,9 +24,49 @@ from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN, SPEED_CONTROL_SUPPORTED_MODELS
 from .hub import TuissBlind, Hub
+from .index import TIMER_MARKER, async_get_index, split_timer_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connection metrics exposed as (disabled by default) diagnostic sensors:
+# (metric, name, icon, unit). Latency histograms report their average,
+# counters their running total since Home Assistant started.
+METRIC_HISTOGRAM_SENSORS = [
+    ("connect_latency", "Connect Latency", "mdi:timer-sand"),
+    ("command_rtt", "Command Round Trip", "mdi:swap-horizontal"),
+]
+METRIC_COUNTER_SENSORS = [
+    ("connect_attempts", "Connect Attempts", "mdi:bluetooth-connect", None),
+    ("timeouts", "Timeouts", "mdi:timer-alert-outline", None),
+    ("airtime_connected", "Airtime Connected", "mdi:bluetooth-transfer", UnitOfTime.SECONDS),
+]
+
+@callback
+def _async_remove_orphaned_timers(hass: HomeAssistant, config_entry: ConfigEntry, blinds) -> None:
+    """Remove timer sensors from the registry whose timer no longer exists.
+
+    Only the timer sensors of ``blinds`` are considered, so this runs for a
+    whole config entry at setup and for one blind after its timers change.
+    """
+    valid = {
+        f"{blind.blind_id}{TIMER_MARKER}{timer_id}"
+        for blind in blinds
+        for timer_id in blind.timers
+    }
+    blind_ids = {blind.blind_id for blind in blinds}
+    registry = er.async_get(hass)
+    orphans = []
+    for entry in er.async_entries_for_config_entry(registry, config_entry.entry_id):
+        if entry.domain != "sensor" or entry.unique_id in valid:
+            continue
+        timer = split_timer_unique_id(entry.unique_id)
+        if timer is not None and timer[0] in blind_ids:
+            orphans.append(entry.entity_id)
+    for entity_id in orphans:
+        _LOGGER.debug("Removing orphaned timer entity: %s", entity_id)
+        registry.async_remove(entity_id)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -37,20 +77,8 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up sensor platform for config entry: %s", config_entry.entry_id)
     
     # Clean up orphaned timer entities from the registry
-    registry = er.async_get(hass)
-    entries = er.async_entries_for_config_entry(registry, config_entry.entry_id)
-    for entry in entries:
-        if entry.domain == "sensor" and "_timer_" in entry.unique_id:
-            timer_id = entry.unique_id.split("_timer_")[-1]
-            timer_exists = False
-            for blind in hub.blinds:
-                if blind.blind_id in entry.unique_id and timer_id in blind.timers:
-                    timer_exists = True
-                    break
-            if not timer_exists:
-                _LOGGER.debug("Removing orphaned timer entity: %s", entry.entity_id)
-                registry.async_remove(entry.entity_id)
-    
+    _async_remove_orphaned_timers(hass, config_entry, hub.blinds)
+
     # 1. Add sensors for timers that already exist in storage
     for blind in hub.blinds:
         existing_sensors = []
@@ -69,6 +97,15 @@ async def async_setup_entry(
             TuissTraversalSpeedSensor(blind),
             TuissLastConnectionErrorSensor(blind),
             TuissBlindSpeedSensor(blind),
+            TuissTimerSlotsSensor(blind),
+            *(
+                TuissMetricSensor(blind, metric, name, icon, UnitOfTime.SECONDS, histogram=True)
+                for metric, name, icon in METRIC_HISTOGRAM_SENSORS
+            ),
+            *(
+                TuissMetricSensor(blind, metric, name, icon, unit)
+                for metric, name, icon, unit in METRIC_COUNTER_SENSORS
+            ),
         ]
 
         async_add_entities(new_sensors)
@@ -89,6 +126,22 @@ async def async_setup_entry(
                 _create_add_timer_listener(blind)
             )
         )
+
+        # 3. Prune the blind's orphaned timer entities whenever its timers change
+        def _create_timers_changed_listener(current_blind):
+            @callback
+            def async_timers_changed() -> None:
+                """Remove timer sensors left behind by a timer change."""
+                _async_remove_orphaned_timers(hass, config_entry, [current_blind])
+            return async_timers_changed
+
+        config_entry.async_on_unload(
+            async_dispatcher_connect(
+                hass,
+                f"{DOMAIN}_timers_changed_{blind.blind_id}",
+                _create_timers_changed_listener(blind)
+            )
+        )
         
     # Register the delete action as a standard global service
     async def async_action_delete_blind_timer(call: ServiceCall) -> None:
@@ -100,36 +153,28 @@ async def async_setup_entry(
                 translation_key="no_entity_id"
             )
             
-        registry = er.async_get(hass)
-        entry = registry.async_get(entity_id)
-        
-        if not entry:
+        index = async_get_index(hass)
+        if index.unique_id(entity_id) is None:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="entity_not_found",
                 translation_placeholders={"entity_id": entity_id}
             )
-            
-        if "_timer_" not in entry.unique_id:
+
+        timer = index.timer(entity_id)
+        if timer is None:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="not_a_timer"
             )
-            
-        timer_id = entry.unique_id.split("_timer_")[-1]
-        blind_id = entry.unique_id.split("_timer_")[0]
-        
-        for hub_instance in hass.data[DOMAIN].values():
-            if hasattr(hub_instance, "blinds"):
-                for blind in hub_instance.blinds:
-                    if blind.blind_id == blind_id:
-                        await blind.async_delete_timer(timer_id)
-                        return
-                        
-        raise HomeAssistantError(
-            translation_domain=DOMAIN,
-            translation_key="blind_not_found"
-        )
+
+        blind, timer_id = timer
+        if blind is None:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="blind_not_found"
+            )
+        await blind.async_delete_timer(timer_id)
 
     if not hass.services.has_service(DOMAIN, "delete_blind_timer"):
         hass.services.async_register(
@@ -217,8 +262,9 @@ class TuissTimerSensor(SensorEntity):
     async def _async_remove_self(self) -> None:
         """Remove this entity from the entity registry and state machine."""
         _LOGGER.debug("Starting removal of timer sensor: %s", self.entity_id)
-        if self.registry_entry:
-            registry = er.async_get(self.hass)
+        registry = er.async_get(self.hass)
+        # The orphan cleanup may have removed the registry entry already
+        if self.registry_entry and registry.async_get(self.entity_id):
             registry.async_remove(self.entity_id)
         else:
             await self.async_remove(force_remove=True)
@@ -521,6 +567,62 @@ class TuissTraversalSpeedSensor(SensorEntity):
         self.async_write_ha_state()
 
 
+class TuissTimerSlotsSensor(SensorEntity):
+    """Tuiss Timer Slots Sensor."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-cog-outline"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, blind: TuissBlind) -> None:
+        """Initialize the sensor."""
+        self.blind = blind
+        # No "_timer_" in the id, so it is never mistaken for a timer sensor
+        self._attr_unique_id = f"{self.blind.blind_id}_timerslots"
+        self._attr_name = "Timer Slots Used"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.blind.blind_id)},
+            name=self.blind.name,
+            manufacturer=self.blind.hub.manufacturer,
+            model=self.blind.model,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True if the blind is available."""
+        return True
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of firmware timer slots in use."""
+        return self.blind.timer_slot_usage["slots_used"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return free/max slots and whether the count was read from the blind."""
+        usage = self.blind.timer_slot_usage
+        return {
+            "slots_free": usage["slots_free"],
+            "slots_max": usage["slots_max"],
+            "source": usage["source"],
+            "last_read": usage["last_read"],
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        self.blind.register_callback(self._handle_update)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove callbacks."""
+        self.blind.remove_callback(self._handle_update)
+
+    @callback
+    def _handle_update(self) -> None:
+        """Handle updated data from the hub."""
+        self.async_write_ha_state()
+
+
 class TuissLastConnectionErrorSensor(SensorEntity):
     """Tuiss Last Connection Error Sensor."""
 
@@ -563,4 +665,79 @@ class TuissLastConnectionErrorSensor(SensorEntity):
     def _handle_update(self) -> None:
         """Handle updated data from the hub."""
         self._attr_native_value = self.blind._last_connection_error or "None"
-        self.async_write_ha_state()
\ No newline at end of file
+        self.async_write_ha_state()
+
+
+class TuissMetricSensor(SensorEntity):
+    """Tuiss Connection Metric Sensor."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        blind: TuissBlind,
+        metric: str,
+        name: str,
+        icon: str,
+        unit: str | None,
+        histogram: bool = False,
+    ) -> None:
+        """Initialize the sensor."""
+        self.blind = blind
+        self._metric = metric
+        self._histogram = histogram
+        self._attr_unique_id = f"{self.blind.blind_id}_metric_{metric}"
+        self._attr_name = name
+        self._attr_icon = icon
+        self._attr_native_unit_of_measurement = unit
+        if histogram:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+            self._attr_suggested_display_precision = 3
+        else:
+            # Counters start again from zero when Home Assistant restarts
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.blind.blind_id)},
+            name=self.blind.name,
+            manufacturer=self.blind.hub.manufacturer,
+            model=self.blind.model,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True if the blind is available."""
+        return True
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the average latency, or the counter total."""
+        metrics = self.blind.metrics
+        if self._histogram:
+            histogram = metrics["histograms"].get(self._metric)
+            return histogram["avg"] if histogram else None
+        return metrics["counters"].get(self._metric, 0)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the sample count, min, max and last value of a latency."""
+        if not self._histogram:
+            return None
+        histogram = self.blind.metrics["histograms"].get(self._metric)
+        if not histogram:
+            return None
+        return {key: histogram[key] for key in ("count", "min", "max", "last")}
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        self.blind.register_callback(self._handle_update)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove callbacks."""
+        self.blind.remove_callback(self._handle_update)
+
+    @callback
+    def _handle_update(self) -> None:
+        """Handle updated data from the hub."""
+        self.async_write_ha_state()
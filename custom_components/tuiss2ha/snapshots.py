@@ -0,0 +1,83 @@
+"""Named snapshots of cover positions for the snapshot and restore services.
+
+A snapshot maps entity_id -> position (percent open). It lives in memory
+until Home Assistant restarts, or in storage when taken with ``store``, so
+a saved scene survives a restart. Restoring is done by the cover platform
+as one planned fleet move rather than as a set_cover_position call per
+blind.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SNAPSHOTS = "snapshots"
+STORAGE_KEY = f"{DOMAIN}_snapshots"
+
+
+class SnapshotStore:
+    """Hold named position snapshots, persisting the ones taken with ``store``."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create an empty snapshot store; stored snapshots load on first use."""
+        self._store = Store(hass, 1, STORAGE_KEY)
+        self._loaded = False
+        self.snapshots: dict[str, dict[str, float]] = {}
+        self._stored: set[str] = set()
+
+    async def async_load(self) -> None:
+        """Load the stored snapshots once; fall back to none on corruption."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            stored = await self._store.async_load()
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("Failed to load position snapshots from storage (%s); starting empty", exc)
+            return
+        if not isinstance(stored, dict):
+            return
+        for name, positions in stored.items():
+            if not isinstance(positions, dict):
+                _LOGGER.warning("Dropping invalid stored snapshot %r", name)
+                continue
+            self.snapshots.setdefault(name, {
+                entity_id: float(position)
+                for entity_id, position in positions.items()
+                if isinstance(position, (int, float)) and 0 <= position <= 100
+            })
+            self._stored.add(name)
+
+    def get(self, name: str) -> dict[str, float] | None:
+        """Return the positions saved under ``name``, or None."""
+        return self.snapshots.get(name)
+
+    async def async_save_snapshot(self, name: str, positions: dict[str, float], store: bool = False) -> None:
+        """Save ``positions`` under ``name``, replacing a snapshot of the same name."""
+        await self.async_load()
+        self.snapshots[name] = dict(positions)
+        if store:
+            self._stored.add(name)
+        elif name in self._stored:
+            # Re-taken in memory only: drop the stale stored copy
+            self._stored.discard(name)
+        else:
+            return
+        await self._store.async_save({key: self.snapshots[key] for key in self._stored})
+
+
+@callback
+def async_get_snapshots(hass: HomeAssistant) -> SnapshotStore:
+    """Return the integration's snapshot store, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    snapshots = domain_data.get(DATA_SNAPSHOTS)
+    if snapshots is None:
+        snapshots = domain_data[DATA_SNAPSHOTS] = SnapshotStore(hass)
+    return snapshots
@@ -1,7 +1,9 @@
 # tests/conftest.py
 import sys
+import asyncio
+import itertools
 import datetime as _datetime
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import MagicMock, AsyncMock, patch
 import pytest
 
 @pytest.fixture
@@ -35,7 +37,9 @@ def pytest_sessionstart(session):
     # "metaclass conflict" error when a class inherits from multiple mocked
     # base classes (e.g., CoverEntity and RestoreEntity).
     class MockEntity:
-        pass
+        @property
+        def unique_id(self):
+            return getattr(self, "_attr_unique_id", None)
 
     # Create mock versions of the HA entity base classes.
     # All of them will inherit from our single MockEntity.
@@ -94,6 +98,21 @@ def pytest_sessionstart(session):
     sys.modules["homeassistant.components.cover"] = MagicMock(**mock_entity_classes)
     sys.modules["homeassistant.components.select"] = MagicMock(**mock_entity_classes)
 
+    # Minimal diagnostics module: redact matching keys at any depth
+    def _async_redact_data(data, to_redact):
+        if isinstance(data, dict):
+            return {
+                key: "**REDACTED**" if key in to_redact else _async_redact_data(value, to_redact)
+                for key, value in data.items()
+            }
+        if isinstance(data, list):
+            return [_async_redact_data(item, to_redact) for item in data]
+        return data
+
+    sys.modules["homeassistant.components.diagnostics"] = _types.SimpleNamespace(
+        async_redact_data=_async_redact_data,
+    )
+
     # Mock other required modules that don't contain entity base classes
     import types
 
@@ -123,6 +142,7 @@ def pytest_sessionstart(session):
         "homeassistant.helpers.entity_platform",
         "homeassistant.helpers.storage",
         "homeassistant.helpers.dispatcher",
+        "homeassistant.helpers.event",
     ]
     for module_name in other_modules:
         if module_name in sys.modules:
@@ -154,7 +174,38 @@ def pytest_sessionstart(session):
         else:
             sys.modules[module_name] = MagicMock()
 
+    # Keep @callback-decorated functions callable instead of replacing them with mocks
+    sys.modules["homeassistant.core"].callback = lambda func: func
+
 @pytest.fixture
 def mock_hass():
     """A mock Home Assistant instance for testing."""
-    return MagicMock()
\ No newline at end of file
+    return MagicMock()
+
+
+_SIMULATED_ADDRESSES = itertools.count(1)
+
+
+@pytest.fixture
+def simulated_blind(mock_hass):
+    """A TuissBlind connected through a SimulatedBlind peripheral.
+
+    Returns (blind, peripheral). Drive it with clock.run_virtual so sleeps,
+    retries and timeouts take no real time.
+    """
+    from custom_components.tuiss2ha.hub import TuissBlind
+    from custom_components.tuiss2ha.lib.tuiss.simulator import SimulatedBlind
+
+    # A fresh address per test keeps the shared metrics registry apart
+    n = next(_SIMULATED_ADDRESSES)
+    peripheral = SimulatedBlind(f"AA:BB:CC:00:{n // 256:02X}:{n % 256:02X}")
+    mock_hass.async_create_task = asyncio.ensure_future
+    with patch("custom_components.tuiss2ha.hub.bluetooth.async_ble_device_from_address", return_value=MagicMock()), \
+         patch("custom_components.tuiss2ha.hub.bluetooth.async_last_service_info", return_value=None), \
+         patch("custom_components.tuiss2ha.lib.tuiss.ble.establish_connection", side_effect=peripheral.establish):
+        hub = MagicMock()
+        hub._hass = mock_hass
+        blind = TuissBlind(peripheral.address, "Simulated", hub)
+        blind._restart_attempts = 3
+        yield blind, peripheral
+
@@ -0,0 +1,424 @@
+"""Micro-benchmarks for the hub hot paths.
+
+Run with ``pytest tests/test_benchmarks.py -s`` to see the timings.
+Wall-clock budgets are noisy on shared machines, so they are only
+enforced with ``TUISS2HA_BENCHMARK_BUDGETS=1``; the default run checks
+the counts each benchmark also records.
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.tuiss2ha.lib.tuiss import blind as blind_module
+from custom_components.tuiss2ha.lib.tuiss import metrics as metrics_module
+from custom_components.tuiss2ha.lib.tuiss.blind import Blind
+from custom_components.tuiss2ha.lib.tuiss.const import UUID
+
+NOTIFICATION = bytearray([0xFF, 1, 2, 3, 0xD2, 0, 50, 0, 0])
+COMMAND = bytes.fromhex("ff78ea41bf03f401")
+ROUNDS = 20000
+# Opt in to the wall-clock assertions
+ENFORCE_BUDGETS = os.environ.get("TUISS2HA_BENCHMARK_BUDGETS") == "1"
+# Writes and notifications whose log records the logging benchmark counts
+LOGGED_FRAMES = 200
+LIB = Path(__file__).resolve().parent.parent / "custom_components" / "tuiss2ha" / "lib"
+# Warm import of the core (protocol, session and movement model), in ms
+CORE_IMPORT_BUDGET_MS = 50
+# Presets on one blind for the preset select benchmark
+PRESET_COUNT = 500
+# Config entries set up by the startup benchmark: a small and a large install
+STARTUP_ENTRIES = (10, 80)
+
+
+def _per_call_us(func) -> float:
+    return min(timeit.repeat(func, number=ROUNDS, repeat=3)) / ROUNDS * 1e6
+
+
+@pytest.mark.parametrize("level", [logging.INFO, logging.DEBUG])
+def test_benchmark_hot_path_logging(level):
+    """Logging for writes and notifications through the blind's own hot paths.
+
+    Below debug no record is created and no frame is rendered as hex; at
+    debug each frame is exactly one record.
+    """
+    blind = Blind("AA:BB:CC:DD:EE:01", "Study", ble_device=MagicMock())
+    blind._client = MagicMock(is_connected=True, write_gatt_char=AsyncMock())
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger = logging.getLogger(blind_module.__name__)
+    saved = logger.level, logger.propagate
+    logger.setLevel(level)
+    logger.propagate = False
+    logger.addHandler(handler)
+    rendered = MagicMock(side_effect=metrics_module._log_value)
+
+    async def frames():
+        for _ in range(LOGGED_FRAMES):
+            await blind.send_command(UUID, COMMAND)
+            blind.split_data(NOTIFICATION)
+
+    try:
+        with patch.object(metrics_module, "_log_value", rendered):
+            asyncio.run(frames())
+        logged = len(records)
+        logger.removeHandler(handler)
+        per_call = _per_call_us(lambda: blind.split_data(NOTIFICATION))
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(saved[0])
+        logger.propagate = saved[1]
+    print(f"\nlogging at {logging.getLevelName(level)}: split_data {per_call:.2f}us")
+
+    expected = 2 * LOGGED_FRAMES if level == logging.DEBUG else 0
+    assert logged == expected
+    assert rendered.call_count == expected
+
+
+def test_benchmark_core_import_time():
+    """The core imports within budget and leaves bleak for the first connection."""
+    code = """
+import asyncio, json, logging, sys, time
+started = time.perf_counter()
+import tuiss, tuiss.protocol
+core = time.perf_counter() - started
+bleak_loaded = "bleak" in sys.modules
+started = time.perf_counter()
+import tuiss.ble
+ble = time.perf_counter() - started
+print(json.dumps({"core": core * 1000, "bleak_loaded": bleak_loaded, "ble": ble * 1000}))
+"""
+    # asyncio and logging are loaded first: any host has them already
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    runs = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-c", code], cwd=LIB, env=env, capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(3)
+    ]
+    # The first run may have compiled the bytecode
+    core = min(run["core"] for run in runs[1:])
+    ble = min(run["ble"] for run in runs[1:])
+    print(f"\nimport: core {core:.1f}ms, bleak on first connection {ble:.1f}ms")
+    assert not any(run["bleak_loaded"] for run in runs)
+    if ENFORCE_BUDGETS:
+        assert core < CORE_IMPORT_BUDGET_MS
+
+
+def test_benchmark_preset_select_state():
+    """Preset select state during a move: sort-and-scan vs the preset index."""
+    from custom_components.tuiss2ha.presets import PresetMap
+
+    presets = {f"Preset {index:03d}": index * 100 / PRESET_COUNT for index in range(PRESET_COUNT)}
+    preset_map = PresetMap(presets)
+    positions = [index * 0.37 % 100 for index in range(50)]
+
+    def scan():
+        # What options and current_option computed on every state write
+        for position in positions:
+            sorted(presets.keys())
+            for name in sorted(presets):
+                if abs(presets[name] - position) <= 0.5:
+                    break
+
+    def indexed():
+        for position in positions:
+            preset_map.names
+            preset_map.nearest(position)
+
+    rounds = 20
+    before = min(timeit.repeat(scan, number=rounds, repeat=3)) / rounds / len(positions) * 1e6
+    after = min(timeit.repeat(indexed, number=rounds, repeat=3)) / rounds / len(positions) * 1e6
+    print(f"\npreset select state with {PRESET_COUNT} presets: scan {before:.1f}us, indexed {after:.2f}us")
+    if ENFORCE_BUDGETS:
+        assert after * 3 < before
+
+    # The index is sorted once per preset change, not once per state write
+    sorts = MagicMock(side_effect=sorted)
+    with patch("custom_components.tuiss2ha.presets.sorted", sorts, create=True):
+        preset_map = PresetMap(presets)
+        indexed()
+        indexed()
+        assert sorts.call_count == 2
+        preset_map["Preset 999"] = 42.0
+        indexed()
+        assert sorts.call_count == 4
+
+
+class _FakeServices:
+    """Service registry that counts registrations."""
+
+    def __init__(self) -> None:
+        self.handlers = {}
+        self.registrations = 0
+
+    def has_service(self, domain, service):
+        return (domain, service) in self.handlers
+
+    def async_register(self, domain, service, handler, schema=None, supports_response=None):
+        self.registrations += 1
+        self.handlers[(domain, service)] = handler
+
+
+class _FakeConfigEntries:
+    """Config entry manager that sets the platforms up in process."""
+
+    def __init__(self, hass) -> None:
+        self.hass = hass
+        self.updates = 0
+
+    def async_update_entry(self, entry, **changes):
+        self.updates += 1
+        for key, value in changes.items():
+            setattr(entry, key, value)
+
+    async def async_forward_entry_setups(self, entry, platforms):
+        for platform in platforms:
+            module = importlib.import_module(f"custom_components.tuiss2ha.{platform}")
+            await module.async_setup_entry(self.hass, entry, self._adder(platform))
+
+    def _adder(self, platform):
+        def async_add_entities(entities, update_before_add=False):
+            # HA names an entity when it is added
+            for entity in entities:
+                entity.entity_id = f"{platform}.{len(self.hass.data)}_{id(entity)}"
+        return async_add_entities
+
+
+class _FakeDeviceRegistry:
+    """Device registry indexed by identifier, as HA's is."""
+
+    def __init__(self) -> None:
+        self.devices = {}
+        self.updates = 0
+
+    def add(self, identifier, connections):
+        device = SimpleNamespace(id=f"device_{len(self.devices)}", connections=connections)
+        self.devices[identifier] = device
+
+    def async_get_device(self, identifiers):
+        for identifier in identifiers:
+            if identifier in self.devices:
+                return self.devices[identifier]
+        return None
+
+    def async_update_device(self, device_id, new_connections):
+        self.updates += 1
+
+
+class _FakeEntityRegistry:
+    """Entity registry indexed by config entry, as HA's is."""
+
+    def __init__(self) -> None:
+        self.by_config_entry = {}
+        self.entries = {}
+
+    def add(self, config_entry_id, entity_id, unique_id):
+        entry = SimpleNamespace(entity_id=entity_id, unique_id=unique_id, domain=entity_id.split(".")[0])
+        self.entries[entity_id] = (config_entry_id, entry)
+        self.by_config_entry.setdefault(config_entry_id, {})[entity_id] = entry
+
+    def async_remove(self, entity_id):
+        config_entry_id, _ = self.entries.pop(entity_id)
+        del self.by_config_entry[config_entry_id][entity_id]
+
+    def entries_for_config_entry(self, registry, config_entry_id):
+        return list(self.by_config_entry.get(config_entry_id, {}).values())
+
+
+class _FakeStore:
+    """Store whose data is already in memory."""
+
+    data = {}
+
+    def __init__(self, hass, version, key) -> None:
+        self.key = key
+
+    async def async_load(self):
+        return self.data.get(self.key)
+
+    async def async_save(self, data):
+        self.data[self.key] = data
+
+
+class _PhaseProfiler:
+    """Accumulate wall time and retained allocations per startup phase."""
+
+    def __init__(self) -> None:
+        self.phases = {}
+
+    def _record(self, phase, started, allocated):
+        elapsed, retained = self.phases.get(phase, (0.0, 0))
+        self.phases[phase] = (
+            elapsed + time.perf_counter() - started,
+            retained + tracemalloc.get_traced_memory()[0] - allocated,
+        )
+
+    def wrap(self, phase, func):
+        if asyncio.iscoroutinefunction(func):
+            async def timed_async(*args, **kwargs):
+                started, allocated = time.perf_counter(), tracemalloc.get_traced_memory()[0]
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._record(phase, started, allocated)
+            return timed_async
+
+        def timed(*args, **kwargs):
+            started, allocated = time.perf_counter(), tracemalloc.get_traced_memory()[0]
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(phase, started, allocated)
+        return timed
+
+
+def _set_up_entries(count: int) -> dict:
+    """Set up ``count`` config entries against a fake HA and profile each phase."""
+    integration = importlib.import_module("custom_components.tuiss2ha")
+    hub_module = importlib.import_module("custom_components.tuiss2ha.hub")
+    sensor = importlib.import_module("custom_components.tuiss2ha.sensor")
+    index_module = importlib.import_module("custom_components.tuiss2ha.index")
+    from custom_components.tuiss2ha.const import DOMAIN
+
+    # Import the platforms up front so the first entry does not pay for it
+    for platform in integration.PLATFORMS:
+        importlib.import_module(f"custom_components.tuiss2ha.{platform}")
+
+    hass = MagicMock()
+    hass.data = {}
+    hass.services = _FakeServices()
+    hass.config_entries = _FakeConfigEntries(hass)
+    devices = _FakeDeviceRegistry()
+    entities = _FakeEntityRegistry()
+    entries = []
+    _FakeStore.data = {}
+    for index in range(count):
+        host = f"5A:00:00:00:{index // 256:02X}:{index % 256:02X}"
+        blind_id = host
+        entry = SimpleNamespace(
+            entry_id=f"entry_{index}",
+            data={"host": host, "name": f"Blind {index}"},
+            options={},
+            unique_id=None,
+            async_on_unload=lambda unsub: None,
+            add_update_listener=lambda listener: None,
+        )
+        entries.append(entry)
+        # A device still carrying an upper case duplicate connection, two
+        # stored timers and a timer sensor left over from a deleted one
+        devices.add((DOMAIN, blind_id), {("bluetooth", host), ("bluetooth", host.lower())})
+        key = f"tuiss2ha_{host.replace(':', '').lower()}"
+        _FakeStore.data[f"{key}_schedules"] = {
+            "1": {"days": ["mon"], "time": "07:00", "position": 20},
+            "2": {"days": ["fri"], "time": "19:30", "position": 90},
+        }
+        _FakeStore.data[f"{key}_presets"] = {"Morning": 30.0}
+        for timer_id in ("1", "2", "3"):
+            entities.add(entry.entry_id, f"sensor.blind_{index}_timer_{timer_id}", f"{blind_id}_timer_{timer_id}")
+
+    profiler = _PhaseProfiler()
+    hass.config_entries.async_forward_entry_setups = profiler.wrap(
+        "platforms", hass.config_entries.async_forward_entry_setups
+    )
+    dr = SimpleNamespace(
+        async_get=lambda hass: devices, CONNECTION_BLUETOOTH="bluetooth", format_mac=str.lower
+    )
+    er = SimpleNamespace(
+        async_get=lambda hass: entities,
+        async_entries_for_config_entry=entities.entries_for_config_entry,
+        EVENT_ENTITY_REGISTRY_UPDATED="entity_registry_updated",
+    )
+
+    async def set_up():
+        hass.async_create_task = asyncio.ensure_future
+        for entry in entries:
+            assert await integration.async_setup_entry(hass, entry)
+
+    # Debug logging would dominate the timings
+    logger = logging.getLogger("custom_components.tuiss2ha")
+    level = logger.level
+    logger.setLevel(logging.INFO)
+    with patch.object(hub_module, "Store", _FakeStore), \
+         patch.object(integration, "dr", dr), \
+         patch.object(sensor, "er", er), \
+         patch.object(index_module, "er", er), \
+         patch.object(index_module.TuissIndex, "async_add_hub",
+                      profiler.wrap("index", index_module.TuissIndex.async_add_hub)), \
+         patch.object(hub_module.TuissBlind, "async_load_timers",
+                      profiler.wrap("store loads", hub_module.TuissBlind.async_load_timers)), \
+         patch.object(hub_module.TuissBlind, "async_load_presets",
+                      profiler.wrap("store loads", hub_module.TuissBlind.async_load_presets)), \
+         patch.object(integration, "_async_clean_device_connections",
+                      profiler.wrap("device cleanup", integration._async_clean_device_connections)), \
+         patch.object(integration, "_async_migrate_entry",
+                      profiler.wrap("entry update", integration._async_migrate_entry)), \
+         patch.object(integration, "async_register_callback",
+                      profiler.wrap("bluetooth callback", MagicMock())), \
+         patch.object(sensor, "_async_remove_orphaned_timers",
+                      profiler.wrap("orphan timer scan", sensor._async_remove_orphaned_timers)):
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            asyncio.run(set_up())
+        finally:
+            total = time.perf_counter() - started
+            tracemalloc.stop()
+            logger.setLevel(level)
+
+    assert len(hass.data[DOMAIN]) - 1 == count  # every hub, plus the index
+    return {
+        "phases": profiler.phases,
+        "total": total,
+        "service_registrations": hass.services.registrations,
+        "entry_updates": hass.config_entries.updates,
+        "device_updates": devices.updates,
+        "timer_sensors_left": sum(len(by_entry) for by_entry in entities.by_config_entry.values()),
+    }
+
+
+def test_benchmark_startup_scales_linearly_with_entries():
+    """Per-entry startup cost stays flat from a small to a large install.
+
+    Each phase of ``async_setup_entry`` and the sensor platform's orphan
+    timer scan is timed, with the memory it retains, while N entries set
+    up against a fake HA whose registries are indexed like HA's own.
+    """
+    small, large = (_set_up_entries(count) for count in STARTUP_ENTRIES)
+    for count, run in zip(STARTUP_ENTRIES, (small, large)):
+        print(f"\nstartup of {count} entries: {run['total'] * 1000:.1f}ms")
+        for phase, (elapsed, retained) in run["phases"].items():
+            print(
+                f"  {phase:<20} {elapsed * 1e6 / count:8.1f}us/entry "
+                f"{retained / 1024 / count:8.2f}KiB/entry"
+            )
+
+    small_count, large_count = STARTUP_ENTRIES
+    if ENFORCE_BUDGETS:
+        for phase, (elapsed, _) in large["phases"].items():
+            per_entry_small = small["phases"][phase][0] / small_count
+            # Linear phases keep their per-entry cost; 1ms of slack absorbs noise
+            assert elapsed / large_count < per_entry_small * 3 + 0.001, phase
+        assert large["total"] / large_count < small["total"] / small_count * 3 + 0.001
+
+    # Domain services are registered once, however many entries there are
+    assert large["service_registrations"] == small["service_registrations"]
+    # One entry update, device cleanup and orphan removal per entry
+    assert large["entry_updates"] == 2 * large_count
+    assert large["device_updates"] == large_count
+    assert large["timer_sensors_left"] == 2 * large_count
@@ -0,0 +1,155 @@
+"""Test btsnoop capture and offline replay."""
+
+import struct
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.tuiss2ha.lib.tuiss.capture import (
+    BTSNOOP_MAGIC,
+    BtsnoopWriter,
+    CapturedFrame,
+    async_replay,
+    read_btsnoop,
+)
+from custom_components.tuiss2ha.hub import TuissBlind
+from custom_components.tuiss2ha.lib.tuiss.blind import Blind
+
+POSITION_REQUEST = bytes.fromhex("ff78ea41d10301")
+POSITION_REPLY = bytes([0xFF, 1, 2, 3, 0xD1, 0, 0, 0xF4, 0x01])
+BATTERY_REQUEST = bytes.fromhex("ff78ea41f00301")
+BATTERY_REPLY = bytes([0xFF, 1, 2, 3, 0xD2, 2, 0xE8, 3])
+
+
+def test_capture_round_trip(tmp_path):
+    """Frames written to a btsnoop file read back with direction, time and payload."""
+    path = tmp_path / "blind.btsnoop"
+    writer = BtsnoopWriter(str(path))
+    writer.record("tx", POSITION_REQUEST, 1_700_000_000.0)
+    writer.record("rx", POSITION_REPLY, 1_700_000_000.25)
+    writer.flush()
+    writer.record("tx", BATTERY_REQUEST, 1_700_000_001.0)
+    writer.flush()
+
+    content = path.read_bytes()
+    assert content[:8] == BTSNOOP_MAGIC
+    assert struct.unpack(">II", content[8:16]) == (1, 1002)
+    assert read_btsnoop(str(path)) == [
+        CapturedFrame(1_700_000_000.0, "tx", POSITION_REQUEST),
+        CapturedFrame(1_700_000_000.25, "rx", POSITION_REPLY),
+        CapturedFrame(1_700_000_001.0, "tx", BATTERY_REQUEST),
+    ]
+
+
+def test_capture_rotates(tmp_path):
+    """Full files move to numbered backups; the oldest beyond the limit is dropped."""
+    path = tmp_path / "blind.btsnoop"
+    writer = BtsnoopWriter(str(path), max_bytes=100, backups=2)
+    for i in range(6):
+        writer.record("tx", POSITION_REQUEST, float(i))
+        writer.flush()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "blind.btsnoop", "blind.btsnoop.1", "blind.btsnoop.2",
+    ]
+    # A 16-byte header and one 43-byte record fill a 100-byte file
+    assert [frame.timestamp for frame in read_btsnoop(str(path))] == [5.0]
+    assert [frame.timestamp for frame in read_btsnoop(f"{path}.2")] == [3.0]
+
+
+def test_capture_keeps_frames_recorded_during_a_flush(tmp_path):
+    """Frames queued while another thread flushes are written by a later flush."""
+    path = tmp_path / "blind.btsnoop"
+    writer = BtsnoopWriter(str(path))
+    stop = threading.Event()
+
+    def flush_repeatedly():
+        while not stop.is_set():
+            writer.flush()
+
+    flusher = threading.Thread(target=flush_repeatedly)
+    flusher.start()
+    try:
+        for i in range(2000):
+            writer.record("tx", POSITION_REQUEST, float(i))
+    finally:
+        stop.set()
+        flusher.join()
+    writer.flush()
+
+    assert [frame.timestamp for frame in read_btsnoop(str(path))] == [float(i) for i in range(2000)]
+
+
+def test_read_rejects_other_files(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_bytes(b"not a capture")
+    with pytest.raises(ValueError):
+        read_btsnoop(str(path))
+
+
+@pytest.mark.asyncio
+async def test_replay_drives_hub_decoders(mock_hass):
+    """Notifications are decoded by the callback for the request they answer."""
+    with patch("custom_components.tuiss2ha.hub.bluetooth.async_ble_device_from_address", return_value=MagicMock()):
+        hub = MagicMock()
+        hub._hass = mock_hass
+        blind = TuissBlind("AA:BB:CC:DD:EE:02", "Replay", hub)
+
+    frames = [
+        CapturedFrame(0.0, "tx", POSITION_REQUEST),
+        CapturedFrame(0.5, "rx", POSITION_REPLY),
+        CapturedFrame(10.0, "tx", BATTERY_REQUEST),
+        CapturedFrame(10.5, "rx", BATTERY_REPLY),
+    ]
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    summary = await async_replay(blind, frames, speed=100, sleep=fake_sleep)
+
+    assert blind.current_position == 50.0
+    assert blind._battery_status is False
+    assert summary["decoders"] == {"position_callback": 1, "battery_callback": 1}
+    assert summary["capture_span"] == 10.5
+    assert sleeps == pytest.approx([0.005, 0.095, 0.005])
+
+
+@pytest.mark.asyncio
+async def test_blind_captures_frames(mock_hass, tmp_path):
+    """With capture on, sent and received frames are queued for the btsnoop file."""
+    with patch("custom_components.tuiss2ha.hub.bluetooth.async_ble_device_from_address", return_value=MagicMock()):
+        hub = MagicMock()
+        hub._hass = mock_hass
+        blind = TuissBlind("AA:BB:CC:DD:EE:03", "Capture", hub)
+    mock_hass.config.path.return_value = str(tmp_path / "aabbccddee03.btsnoop")
+
+    await blind.async_set_capture(True)
+    blind._log_frame("tx", POSITION_REQUEST)
+    blind.split_data(bytearray(POSITION_REPLY))
+    blind._log_frame("event", "disconnect")
+    blind._capture.flush()
+
+    frames = read_btsnoop(blind.capture_path)
+    assert [(frame.direction, frame.data) for frame in frames] == [
+        ("tx", POSITION_REQUEST), ("rx", POSITION_REPLY),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_waits_for_the_capture_flush(tmp_path, caplog):
+    """Disconnect writes the capture before returning and logs a failed write."""
+    blind = Blind("AA:BB:CC:DD:EE:04", "Capture", ble_device=MagicMock())
+    blind.capture_dir = str(tmp_path)
+    await blind.async_set_capture(True)
+    blind._log_frame("tx", POSITION_REQUEST)
+    blind._client = MagicMock(stop_notify=AsyncMock(), disconnect=AsyncMock())
+
+    await blind.disconnect()
+    assert [frame.data for frame in read_btsnoop(blind.capture_path)] == [POSITION_REQUEST]
+
+    blind._capture.flush = MagicMock(side_effect=OSError("disk full"))
+    blind._client = MagicMock(stop_notify=AsyncMock(), disconnect=AsyncMock())
+    await blind.disconnect()
+    assert "Could not write the BLE capture: disk full" in caplog.text
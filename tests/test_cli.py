@@ -0,0 +1,85 @@
+"""Test the standalone command line against simulated blinds."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.tuiss2ha.lib.tuiss import Blind
+from custom_components.tuiss2ha.lib.tuiss.cli import _async_clear_timers, build_parser, main, read_targets
+from custom_components.tuiss2ha.lib.tuiss.clock import run_virtual
+from custom_components.tuiss2ha.lib.tuiss.simulator import SimulatedBlind
+
+
+def _run(capsys, *argv):
+    status = main(list(argv))
+    return status, json.loads(capsys.readouterr().out)
+
+
+def test_simulated_fan_out_respects_proxy_slots(capsys):
+    """Twelve blinds on two proxies with three slots each move in two waves."""
+    status, outcome = _run(
+        capsys, "--simulate", "12", "--proxies", "2", "--slots-per-proxy", "3", "set", "30"
+    )
+
+    assert status == 0
+    assert outcome["succeeded"] == 12
+    assert outcome["virtual_time"] is True
+    durations = [result["duration"] for result in outcome["results"].values()]
+    # Each move takes the same time, so two waves take twice as long as one
+    assert outcome["wall_time"] == pytest.approx(2 * max(durations), rel=0.01)
+    assert {result["result"]["position"] for result in outcome["results"].values()} == {30}
+    assert outcome["throughput_per_minute"] == pytest.approx(12 * 60 / outcome["wall_time"], rel=0.01)
+
+
+def test_simulated_add_timer_takes_first_free_slot(capsys):
+    """Programming a timer asks the blind for a free slot and writes to it."""
+    status, added = _run(capsys, "--simulate", "1", "add-timer", "--days", "mon,fri", "--time", "07:30", "--position", "40")
+    assert status == 0
+    assert list(added["results"].values())[0]["result"] == "1"
+
+
+def test_read_targets_skips_header_and_comments(tmp_path):
+    """The CSV may have a header, comments and an optional name column."""
+    path = tmp_path / "blinds.csv"
+    path.write_text("mac,name\n# spare\naa:bb:cc:dd:ee:01,Lounge\nAA:BB:CC:DD:EE:02\n\n", encoding="utf-8")
+
+    assert read_targets(str(path)) == [
+        ("AA:BB:CC:DD:EE:01", "Lounge"),
+        ("AA:BB:CC:DD:EE:02", "AA:BB:CC:DD:EE:02"),
+    ]
+
+    path.write_text("AA:BB:CC:DD:EE:01\nnot-a-mac\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_targets(str(path))
+
+
+def test_parser_validates_positions_and_days():
+    """Out of range positions and unknown days are rejected before any blind is contacted."""
+    parser = build_parser()
+    args = parser.parse_args(["add-timer", "--days", "Monday,sat", "--time", "07:30", "--position", "40", "AA:BB:CC:DD:EE:FF"])
+    assert args.days == ["mon", "sat"]
+    assert args.macs == ["AA:BB:CC:DD:EE:FF"]
+    with pytest.raises(SystemExit):
+        parser.parse_args(["set", "120"])
+    with pytest.raises(SystemExit):
+        parser.parse_args(["add-timer", "--days", "someday", "--time", "07:30", "--position", "40"])
+
+
+def test_clear_timers_resets_the_blind_without_reading_it():
+    """clear-timers erases every slot even when the stored copy knows none of them."""
+    peripheral = SimulatedBlind("AA:BB:CC:00:20:01")
+    peripheral.timers = {1: b"\x01", 2: b"\x02"}
+
+    async def scenario():
+        blind = Blind(peripheral.address, "Headless", ble_device=MagicMock())
+        with patch(
+            "custom_components.tuiss2ha.lib.tuiss.ble.establish_connection",
+            side_effect=peripheral.establish,
+        ):
+            return await _async_clear_timers(blind)
+
+    usage = run_virtual(scenario())
+
+    assert peripheral.timers == {}
+    assert usage["slots_used"] == 0
@@ -0,0 +1,106 @@
+"""The headless core runs on plain asyncio and bleak, without Home Assistant."""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.tuiss2ha.lib.tuiss import Blind, BlindError, MemoryStore
+from custom_components.tuiss2ha.lib.tuiss.clock import run_virtual
+from custom_components.tuiss2ha.lib.tuiss.protocol import (
+    decode_battery,
+    decode_progress,
+    position_command,
+    timer_command,
+)
+from custom_components.tuiss2ha.lib.tuiss.simulator import SimulatedBlind
+
+LIB = Path(__file__).resolve().parent.parent / "custom_components" / "tuiss2ha" / "lib"
+
+
+def test_core_imports_without_home_assistant():
+    """Importing the core on its own pulls in nothing from Home Assistant."""
+    code = (
+        "import sys; import tuiss, tuiss.simulator; "
+        "print(sorted(m for m in sys.modules if m.startswith(('homeassistant', 'custom_components'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=LIB,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_protocol_round_trips_with_simulator():
+    """Commands the core builds are the ones the simulated blind understands."""
+    assert position_command(30) == "ff78ea41bf03bc02"
+    assert timer_command("3", ["mon", "fri"], "07:30", 25.5) == "ff78ea41030003b23f22071e00ff00"
+    assert decode_battery(list(SimulatedBlind().battery_frame())) is False
+    assert decode_battery(list(SimulatedBlind(battery_low=True).battery_frame())) is True
+    assert decode_progress(list(SimulatedBlind(position=42).progress_frame())) == 42
+
+
+def test_headless_blind_moves_and_learns_speed():
+    """A bare Blind connects, moves and reads its battery against a simulated blind."""
+    peripheral = SimulatedBlind("AA:BB:CC:00:10:01", position=0, speed=5)
+
+    async def scenario():
+        blind = Blind(peripheral.address, "Headless", ble_device=MagicMock())
+        blind._current_cover_position = 0
+        blind.mark_position("blind")
+        with patch(
+            "custom_components.tuiss2ha.lib.tuiss.ble.establish_connection",
+            side_effect=peripheral.establish,
+        ):
+            await blind.async_move_cover(movement_direction=1, target_position=50)
+            await blind.get_battery_status()
+        return blind
+
+    blind = run_virtual(scenario())
+
+    assert peripheral.position == 50
+    assert blind.current_position == 50
+    assert blind._attr_traversal_speed == pytest.approx(50 / 10, rel=0.2)
+    assert blind._battery_status is False
+    assert blind._last_battery_check.tzinfo is not None
+    assert blind.proxy_source is None
+
+
+def test_headless_blind_defaults():
+    """Without an integration the blind keeps timers in memory and raises BlindError."""
+    blind = Blind("AA:BB:CC:00:10:02", "Headless")
+    assert blind._ble_device is None
+    assert isinstance(blind._store, MemoryStore)
+    assert blind.capture_path.endswith("aabbcc001002.btsnoop")
+
+    blind._locked = True
+    with pytest.raises(BlindError) as err:
+        run_virtual(blind.async_move_cover(movement_direction=1, target_position=10))
+    assert err.value.key == "device_locked"
+    assert err.value.placeholders == {"name": "Headless"}
+
+
+def test_bleak_is_only_imported_by_the_ble_module():
+    """No module imports bleak at load time except ``ble.py``, which loads on first connection."""
+    package = LIB.parent
+    offenders = []
+    for path in package.rglob("*.py"):
+        if path.name == "ble.py":
+            continue
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in tree.body:
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                modules = [node.module or ""]
+            else:
+                continue
+            if any(module.split(".")[0] in ("bleak", "bleak_retry_connector") for module in modules):
+                offenders.append(f"{path.relative_to(package)}:{node.lineno}")
+    assert offenders == []
@@ -1,11 +1,15 @@
 """Test cover state and transitions."""
-from unittest.mock import MagicMock
+import asyncio
+import importlib
+from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from homeassistant.const import STATE_CLOSED, STATE_OPEN, STATE_OPENING, STATE_CLOSING
 from homeassistant.components.cover import CoverDeviceClass
 from custom_components.tuiss2ha.cover import Tuiss
 
+cover_module = importlib.import_module("custom_components.tuiss2ha.cover")
+
 @pytest.mark.parametrize("moving,position,expected_state", [
     (0, 0, STATE_CLOSED),      # not moving, position 0
     (0, 24, STATE_CLOSED),     # not moving, position < 25
@@ -80,4 +84,60 @@ def test_cover_properties(mock_hass):
     assert cover._attr_name == "Test Blind"
     assert cover._attr_unique_id == "aa:bb:cc:dd:ee:ff_cover"
     assert "traversal_speed" in cover.extra_state_attributes
-    assert "mac_address" in cover.extra_state_attributes
\ No newline at end of file
+    assert "mac_address" in cover.extra_state_attributes
+
+def _debounce_cover(monkeypatch, quiet_period):
+    """A cover whose blind records every move it is asked to make."""
+    monkeypatch.setattr(cover_module, "ATTR_POSITION", "position")
+    blind = MagicMock()
+    blind.name = "Test Blind"
+    blind.blind_id = "aa:bb:cc:dd:ee:ff"
+    blind.host = blind.blind_id
+    blind._current_cover_position = 0
+    blind.async_move_cover = AsyncMock()
+    config = MagicMock()
+    config.options = {} if quiet_period is None else {"blind_move_debounce": quiet_period}
+    cover = Tuiss(blind, config)
+    cover.name = cover._attr_name
+    return cover, blind
+
+
+@pytest.mark.asyncio
+async def test_slider_drag_sends_only_final_position(mock_hass, monkeypatch):
+    """Positions inside the quiet period are absorbed; the last one is sent."""
+    cover, blind = _debounce_cover(monkeypatch, 0.02)
+
+    await asyncio.gather(*(
+        cover.async_set_cover_position(position=position) for position in (10, 20, 30, 40)
+    ))
+
+    blind.async_move_cover.assert_awaited_once()
+    assert blind.async_move_cover.await_args.kwargs["target_position"] == 60
+    assert cover.extra_state_attributes["debounced_moves"] == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_drops_pending_slider_position(mock_hass, monkeypatch):
+    """A stop inside the quiet period cancels the pending position."""
+    cover, blind = _debounce_cover(monkeypatch, 0.02)
+    blind.stop = AsyncMock()
+    blind._client = None
+
+    pending = asyncio.ensure_future(cover.async_set_cover_position(position=50))
+    await asyncio.sleep(0)
+    await cover.async_stop_cover()
+    await pending
+
+    blind.async_move_cover.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("quiet_period", [0, None])
+async def test_debounce_disabled_sends_immediately(mock_hass, monkeypatch, quiet_period):
+    """With a quiet period of 0, or none configured, every request is sent."""
+    cover, blind = _debounce_cover(monkeypatch, quiet_period)
+
+    await cover.async_set_cover_position(position=10)
+    await cover.async_set_cover_position(position=20)
+
+    assert blind.async_move_cover.await_count == 2
@@ -0,0 +1,63 @@
+"""Test the config entry diagnostics and the BLE frame ring buffer."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.tuiss2ha.const import DOMAIN, FRAME_LOG_SIZE
+from custom_components.tuiss2ha.diagnostics import async_get_config_entry_diagnostics
+from custom_components.tuiss2ha.hub import Hub
+
+
+@pytest.fixture
+def hub(mock_hass):
+    with patch("custom_components.tuiss2ha.hub.bluetooth.async_ble_device_from_address", MagicMock()), \
+         patch("custom_components.tuiss2ha.hub.bluetooth.async_last_service_info", return_value=None):
+        yield Hub(mock_hass, "AA:BB:CC:DD:EE:01", "Study")
+
+
+@pytest.mark.asyncio
+async def test_frame_log_records_tx_rx_with_latency(hub):
+    """Sent and received frames are logged with opcode and reply latency."""
+    blind = hub.blinds[0]
+    blind._client = MagicMock(is_connected=True, write_gatt_char=AsyncMock())
+
+    await blind.send_command("uuid", bytes.fromhex("ff78ea41d10301"))
+    blind.split_data(bytearray([0xFF, 1, 2, 3, 0xD1, 0, 0, 0xF4, 0x01]))
+
+    tx, rx = blind.frame_log
+    assert (tx["direction"], tx["opcode"], tx["data"]) == ("tx", "d1", "ff78ea41d10301")
+    assert "latency_ms" not in tx
+    assert rx["direction"] == "rx"
+    assert rx["opcode"] == "d1"
+    assert rx["latency_ms"] >= 0
+
+
+def test_frame_log_is_bounded(hub):
+    """Only the most recent frames are kept."""
+    blind = hub.blinds[0]
+    for i in range(FRAME_LOG_SIZE + 10):
+        blind.split_data(bytearray([i % 256]))
+
+    frames = blind.frame_log
+    assert len(frames) == FRAME_LOG_SIZE
+    assert frames[0]["data"] == f"{10:02x}"
+    assert frames[0]["opcode"] is None
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_redacts_macs(hub, mock_hass):
+    """MAC addresses are removed from keys, values and error messages."""
+    blind = hub.blinds[0]
+    blind._last_connection_error = "2026-01-01 10:00:00: Device AA:BB:CC:DD:EE:01 not found"
+    blind._log_frame("event", "connect_error: Device AA:BB:CC:DD:EE:01 not found")
+    entry = MagicMock(entry_id="entry1", data={"host": "AA:BB:CC:DD:EE:01", "name": "Study"}, options={})
+    mock_hass.data = {DOMAIN: {"entry1": hub}}
+
+    diagnostics = await async_get_config_entry_diagnostics(mock_hass, entry)
+
+    assert "AA:BB:CC:DD:EE:01" not in str(diagnostics)
+    assert diagnostics["entry"]["data"] == {"host": "**REDACTED**", "name": "Study"}
+    (blind_info,) = diagnostics["blinds"]
+    assert blind_info["frames"][-1]["event"] == "connect_error: Device **REDACTED** not found"
+    assert blind_info["timer_slots"]["slots_max"] == 16
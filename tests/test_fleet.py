@@ -0,0 +1,206 @@
+"""Test fanning operations out across many blinds."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.tuiss2ha.lib.tuiss.fleet import StartBarrier, async_fan_out, plan_longest_first
+from custom_components.tuiss2ha.hub import TuissBlind
+
+
+class _Tracker:
+    """Record how many operations run at once, overall and per proxy."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.active_by_proxy = {}
+        self.peak_by_proxy = {}
+
+    async def operation(self, target):
+        proxy = target["proxy"]
+        self.active += 1
+        self.active_by_proxy[proxy] = self.active_by_proxy.get(proxy, 0) + 1
+        self.peak = max(self.peak, self.active)
+        self.peak_by_proxy[proxy] = max(self.peak_by_proxy.get(proxy, 0), self.active_by_proxy[proxy])
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        self.active_by_proxy[proxy] -= 1
+        if target.get("fail"):
+            raise RuntimeError("out of range")
+        return target["name"]
+
+
+@pytest.mark.asyncio
+async def test_fan_out_respects_proxy_and_global_limits():
+    """No proxy holds more than slots_per_proxy and the total stays under concurrency."""
+    targets = {
+        f"cover.blind_{i}": {"name": f"blind_{i}", "proxy": "proxy_a" if i < 6 else "proxy_b"}
+        for i in range(10)
+    }
+    tracker = _Tracker()
+
+    outcome = await async_fan_out(
+        targets,
+        tracker.operation,
+        concurrency=5,
+        slots_per_proxy=2,
+        proxy_of=lambda target: target["proxy"],
+    )
+
+    assert outcome["succeeded"] == 10
+    assert outcome["failed"] == 0
+    assert tracker.peak <= 4
+    assert tracker.peak_by_proxy == {"proxy_a": 2, "proxy_b": 2}
+    assert list(outcome["results"]) == list(targets)
+    assert outcome["results"]["cover.blind_7"]["proxy"] == "proxy_b"
+
+
+@pytest.mark.asyncio
+async def test_fan_out_reports_partial_failure():
+    """One failing blind is reported without cancelling the others."""
+    targets = {
+        "cover.ok": {"name": "ok", "proxy": None},
+        "cover.bad": {"name": "bad", "proxy": None, "fail": True},
+    }
+
+    outcome = await async_fan_out(targets, _Tracker().operation, concurrency=2)
+
+    assert outcome["succeeded"] == 1
+    assert outcome["failed"] == 1
+    assert outcome["results"]["cover.ok"] == {
+        "proxy": None, "result": "ok", "success": True,
+        "duration": outcome["results"]["cover.ok"]["duration"],
+    }
+    assert outcome["results"]["cover.bad"]["success"] is False
+    assert outcome["results"]["cover.bad"]["error"] == "out of range"
+
+
+@pytest.mark.asyncio
+async def test_fan_out_runs_in_parallel():
+    """Wall time tracks the slowest batch, not the sum of every blind."""
+    targets = {f"cover.blind_{i}": {"name": str(i), "proxy": f"proxy_{i}"} for i in range(6)}
+
+    outcome = await async_fan_out(
+        targets, _Tracker().operation, concurrency=6, proxy_of=lambda target: target["proxy"]
+    )
+
+    assert outcome["succeeded"] == 6
+    assert outcome["wall_time"] < 0.05
+
+
+@pytest.mark.asyncio
+async def test_start_barrier_holds_writes_until_all_armed():
+    """No blind writes its move before the slowest one is armed."""
+    barrier = StartBarrier(["a", "b", "c"])
+    order = []
+
+    async def blind(party, arm_delay):
+        await asyncio.sleep(arm_delay)
+        order.append(f"armed {party}")
+        await barrier.async_wait(party)
+        order.append(f"sent {party}")
+        barrier.mark_sent(party)
+
+    await asyncio.gather(blind("a", 0), blind("b", 0.01), blind("c", 0.03))
+
+    assert order[:3] == ["armed a", "armed b", "armed c"]
+    assert set(barrier.sent_at) == {"a", "b", "c"}
+    assert barrier.skew_ms < 10
+
+
+@pytest.mark.asyncio
+async def test_start_barrier_releases_when_a_blind_drops_out():
+    """A blind that fails before arming does not hold the others back."""
+    barrier = StartBarrier(["a", "b"], timeout=5)
+
+    async def failing():
+        try:
+            raise RuntimeError("not found")
+        finally:
+            barrier.leave("b")
+
+    async def armed():
+        await barrier.async_wait("a")
+        barrier.mark_sent("a")
+
+    results = await asyncio.wait_for(
+        asyncio.gather(armed(), failing(), return_exceptions=True), timeout=1
+    )
+
+    assert isinstance(results[1], RuntimeError)
+    assert list(barrier.sent_at) == ["a"]
+    assert barrier.skew_ms == 0
+
+
+@pytest.mark.asyncio
+async def test_start_barrier_times_out():
+    """Armed blinds start anyway if a straggler never arrives."""
+    barrier = StartBarrier(["a", "b"], timeout=0.01)
+
+    await barrier.async_wait("a")
+
+    assert barrier.released_at is not None
+
+
+def test_plan_longest_first_orders_and_predicts_makespan():
+    """Longest jobs go first and the makespan follows greedy slot packing."""
+    durations = {"a": 3, "b": 7, "c": 5, "d": 6, "e": 4}
+    proxies = {label: "proxy" for label in durations}
+
+    order, makespan = plan_longest_first(durations, proxies, concurrency=6, slots_per_proxy=2)
+
+    assert order == ["b", "d", "c", "e", "a"]
+    # b|d start at 0, c follows d (6->11), e follows b (7->11), a follows either (11->14)
+    assert makespan == 14
+
+
+def test_plan_longest_first_respects_global_limit_across_proxies():
+    """Jobs on different proxies still share the global concurrency limit."""
+    durations = {"a": 10, "b": 10, "c": 10}
+    proxies = {"a": "p1", "b": "p2", "c": None}
+
+    _, makespan = plan_longest_first(durations, proxies, concurrency=2, slots_per_proxy=3)
+
+    assert makespan == 20
+
+
+def test_estimate_move_seconds(mock_hass):
+    """Move estimates use the learned speed, falling back to a full-length move."""
+    with patch("custom_components.tuiss2ha.hub.bluetooth.async_ble_device_from_address", return_value=MagicMock()):
+        hub = MagicMock()
+        hub._hass = mock_hass
+        blind = TuissBlind("AA:BB:CC:DD:EE:FF", "Test", hub)
+
+    blind._attr_traversal_speed = 4.0
+    blind._current_cover_position = 20
+    assert blind.estimate_move_seconds(100) == 5.0 + 80 / 4.0
+
+    blind._current_cover_position = None
+    assert blind.estimate_move_seconds(0) == 5.0 + 100 / 4.0
+
+
+@pytest.mark.asyncio
+async def test_fleet_delete_timer_removes_only_the_requested_days():
+    """Deleting Monday from a weekday timer keeps the timer for the other days."""
+    from custom_components.tuiss2ha.cover import _async_run_fleet_operation
+
+    blind = MagicMock()
+    blind.timers = {
+        "1": {"days": ["mon", "tue", "wed", "thu", "fri"], "time": "07:00", "position": 100.0},
+        "2": {"days": ["mon"], "time": "07:00:00", "position": 50.0},
+        "3": {"days": ["sat"], "time": "09:00", "position": 0.0},
+    }
+    blind.async_sync_timers = AsyncMock(return_value={})
+    entity = MagicMock(_blind=blind)
+
+    await _async_run_fleet_operation(entity, "delete_timer", {"time": "07:00", "days": ["mon"]})
+
+    blind.async_sync_timers.assert_awaited_once_with(
+        [
+            {"days": ["tue", "wed", "thu", "fri"], "time": "07:00", "position": 100.0},
+            {"days": ["sat"], "time": "09:00", "position": 0.0},
+        ],
+        read_back=False,
+    )
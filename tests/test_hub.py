@@ -1,9 +1,14 @@
 # tests/test_hub.py
+import asyncio
+import logging
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Now import your code
+from custom_components.tuiss2ha.const import LOG_THROTTLE_SECONDS
 from custom_components.tuiss2ha.hub import Hub, TuissBlind
+from custom_components.tuiss2ha.lib.tuiss.metrics import BlindLogger, MetricsRegistry
 
 
 @pytest.fixture
@@ -58,4 +63,173 @@ def test_tuiss_blind_initialization(tuiss_blind, mock_hub):
 )
 def test_hex_convert(tuiss_blind, user_percent, expected_hex):
     """Test the hex_convert method with various percentages."""
-    assert tuiss_blind.hex_convert(user_percent) == expected_hex
\ No newline at end of file
+    assert tuiss_blind.hex_convert(user_percent) == expected_hex
+
+@pytest.mark.asyncio
+async def test_move_skipped_when_already_at_target(tuiss_blind):
+    """A fresh, confident position at the target skips the connection."""
+    tuiss_blind.attempt_connection = AsyncMock()
+    tuiss_blind._move_tolerance = 0.1
+    tuiss_blind.set_final_state(0)
+
+    # target_position is in Tuiss scale: 100 = closed
+    await tuiss_blind.async_move_cover(movement_direction=-1, target_position=100)
+
+    tuiss_blind.attempt_connection.assert_not_awaited()
+    assert tuiss_blind._connections_saved == 1
+
+
+@pytest.mark.parametrize(
+    "source, age_hours, current, expected_skip",
+    [
+        ("blind", 0, 50.0, True),
+        ("blind", 0, 50.1, True),   # within the 0.1% hardware step
+        ("blind", 0, 50.15, False), # no slack beyond the tolerance
+        ("blind", 0, 51.0, False),  # outside the tolerance
+        ("blind", 48, 50.0, False), # too old to trust
+        ("move", 0, 50.0, True),
+        ("timer", 0, 50.0, False),  # the timer may not have run
+        ("estimate", 0, 50.0, False),
+        ("restored", 0, 50.0, False),
+        (None, 0, 50.0, False),     # never recorded
+    ],
+)
+def test_is_at_position_uses_confidence(tuiss_blind, source, age_hours, current, expected_skip):
+    """Skipping needs the position within tolerance and confirmed by the blind recently."""
+    tuiss_blind._move_tolerance = 0.1
+    tuiss_blind._current_cover_position = current
+    tuiss_blind.clock = lambda: 1000.0
+    if source:
+        tuiss_blind.mark_position(source)
+    tuiss_blind.clock = lambda: 1000.0 + age_hours * 3600
+    assert tuiss_blind.is_at_position(50) is expected_skip
+
+
+def test_is_at_position_is_off_by_default(tuiss_blind):
+    """With the default tolerance of 0 no move is ever skipped."""
+    tuiss_blind._current_cover_position = 50.0
+    tuiss_blind.mark_position("blind")
+    assert tuiss_blind.is_at_position(50) is False
+
+
+@pytest.mark.asyncio
+async def test_non_blocking_move_returns_before_stop(tuiss_blind):
+    """wait=False returns once the frame is sent and the stop is tracked in the background."""
+    tuiss_blind.hub._hass.async_create_task = asyncio.ensure_future
+    tuiss_blind._client = MagicMock(is_connected=True)
+    tuiss_blind._current_cover_position = 0
+    tuiss_blind.set_position = AsyncMock()
+    tuiss_blind.disconnect = AsyncMock()
+
+    await tuiss_blind.async_move_cover(movement_direction=1, target_position=50, wait=False)
+
+    tuiss_blind.set_position.assert_awaited_once()
+    assert tuiss_blind._locked is True
+    assert await tuiss_blind.async_wait_for_move(timeout=0.01) is False
+
+    # The blind reports it has stopped
+    tuiss_blind._stopped_event.set()
+    assert await tuiss_blind.async_wait_for_move(timeout=1) is True
+    assert tuiss_blind._locked is False
+    assert tuiss_blind._moving == 0
+    assert tuiss_blind.current_position == 50
+
+
+
+@pytest.mark.asyncio
+async def test_traversal_speed_uses_injected_clock(tuiss_blind):
+    """Move timing comes from the blind's clock, so wall-clock jumps cannot skew the speed."""
+    tuiss_blind.hub._hass.async_create_task = asyncio.ensure_future
+    tuiss_blind.disconnect = AsyncMock()
+    # The blind takes 20 clock seconds to move; the wall clock is never read
+    clock = [500.0]
+    tuiss_blind.clock = lambda: clock[0]
+
+    def blind_stops():
+        clock[0] += 20
+        tuiss_blind._stopped_event.set()
+
+    asyncio.get_running_loop().call_later(0.01, blind_stops)
+
+    with patch("custom_components.tuiss2ha.lib.tuiss.blind.datetime") as wall_clock:
+        await tuiss_blind._async_track_move(1, 0, 60)
+
+    wall_clock.datetime.now.assert_not_called()
+    assert tuiss_blind._attr_traversal_speed == 3.0
+    assert tuiss_blind.current_position == 60
+
+
+def test_traversal_speed_ignores_zero_duration(tuiss_blind):
+    """A move that took no measurable time leaves the learned speed alone."""
+    tuiss_blind._attr_traversal_speed = 4.0
+    tuiss_blind.update_traversal_speed(80, 0, 10.0, 10.0)
+    assert tuiss_blind._attr_traversal_speed == 4.0
+
+def test_metrics_registry_tracks_blinds_and_proxies():
+    """Samples count against the blind and its proxy; histograms fill their buckets."""
+    registry = MetricsRegistry()
+    registry.increment("blind_a", "proxy_1", "timeouts")
+    registry.increment("blind_b", "proxy_1", "timeouts")
+    registry.increment("blind_b", None, "retries", 2)
+    registry.observe("blind_a", "proxy_1", "connect_latency", 0.2)
+    registry.observe("blind_a", "proxy_1", "connect_latency", 3.0)
+
+    snapshot = registry.snapshot()
+    assert snapshot["proxies"]["proxy_1"]["counters"] == {"timeouts": 2}
+    assert snapshot["blinds"]["blind_b"]["counters"] == {"timeouts": 1, "retries": 2}
+    latency = registry.snapshot("blind_a")["histograms"]["connect_latency"]
+    assert latency["count"] == 2
+    assert latency["avg"] == 1.6
+    assert (latency["min"], latency["max"], latency["last"]) == (0.2, 3.0, 3.0)
+    assert latency["buckets"]["0.25"] == 1
+    assert latency["buckets"]["5.0"] == 1
+    assert registry.snapshot("unknown") == {"counters": {}, "histograms": {}}
+
+
+@pytest.mark.asyncio
+async def test_locked_move_counts_rejection_and_lock_hold(tuiss_blind):
+    """A move rejected by the lock is counted; releasing the lock records how long it was held."""
+    tuiss_blind._locked = True
+    tuiss_blind._locked_at = 0.0
+
+    with pytest.raises(Exception):
+        await tuiss_blind.async_move_cover(movement_direction=1, target_position=0)
+    tuiss_blind._release_lock()
+
+    metrics = tuiss_blind.metrics
+    assert metrics["counters"]["lock_rejections"] >= 1
+    assert metrics["histograms"]["lock_held"]["count"] >= 1
+    assert tuiss_blind._locked is False
+
+
+
+def test_blind_logger_throttles_repeated_events(caplog):
+    """A throttled event is emitted once per window and reports what it dropped."""
+    logger = logging.getLogger("tuiss2ha.test_throttle")
+    clock = [100.0]
+    blind_log = BlindLogger(logger, "Study", clock=lambda: clock[0])
+
+    with caplog.at_level(logging.DEBUG, logger="tuiss2ha.test_throttle"):
+        for _ in range(5):
+            blind_log.debug("moving", throttle=True, position=12.345)
+        clock[0] += LOG_THROTTLE_SECONDS
+        blind_log.debug("moving", throttle=True, position=20.0)
+        blind_log.debug("rx", data=b"\xff\x01")
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Study: moving position=12.35",
+        "Study: moving position=20.0 dropped=4",
+        "Study: rx data=ff01",
+    ]
+
+
+def test_blind_logger_skips_work_when_debug_is_off(caplog):
+    """With debug off nothing is formatted or recorded, even for throttled events."""
+    logger = logging.getLogger("tuiss2ha.test_quiet")
+    blind_log = BlindLogger(logger, "Study")
+
+    with caplog.at_level(logging.INFO, logger="tuiss2ha.test_quiet"):
+        blind_log.debug("moving", throttle=True, position=1.0)
+
+    assert caplog.records == []
+    assert blind_log._throttled == {}
@@ -3,6 +3,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.tuiss2ha.hub import TuissBlind
+from custom_components.tuiss2ha.lib.tuiss.clock import run_virtual
+from custom_components.tuiss2ha.lib.tuiss.metrics import METRICS
 
 
 @pytest.mark.asyncio
@@ -26,7 +28,7 @@ async def test_attempt_connection_succeeds_and_set_position(mock_hass):
         fake_client.stop_notify = AsyncMock()
 
         # Patch the establish_connection helper used in connect to return our fake client
-        with patch("custom_components.tuiss2ha.hub.establish_connection", return_value=fake_client):
+        with patch("custom_components.tuiss2ha.lib.tuiss.ble.establish_connection", return_value=fake_client):
             # Ensure attempts small for test speed
             tb._restart_attempts = 1
             await tb.attempt_connection()
@@ -37,3 +39,61 @@ async def test_attempt_connection_succeeds_and_set_position(mock_hass):
             # Patch send_command to observe calls
             tb._client.write_gatt_char.assert_called()
 
+
+
+def _through_proxy(source):
+    """Report ``source`` as the proxy the simulated blind is reached through."""
+    return patch(
+        "custom_components.tuiss2ha.hub.bluetooth.async_last_service_info",
+        return_value=MagicMock(source=source),
+    )
+
+
+def test_get_blind_position_records_op_stats(simulated_blind):
+    """A position read reports connection time, command RTT, retries and proxy."""
+    blind, peripheral = simulated_blind
+    peripheral.position = 50.0
+    with _through_proxy("proxy-lounge"):
+        run_virtual(blind.get_blind_position())
+        stats = blind.op_stats
+
+    assert blind.current_position == 50.0
+    assert stats["retries"] == 0
+    assert stats["proxy"] == "proxy-lounge"
+    assert stats["connection_time"] >= 0
+    assert stats["command_rtt"] is not None
+
+
+def test_get_blind_position_records_metrics(simulated_blind):
+    """A position read feeds the per-blind and per-proxy metrics."""
+    blind, _peripheral = simulated_blind
+    with _through_proxy("proxy-metrics"):
+        run_virtual(blind.get_blind_position())
+
+    metrics = blind.metrics
+    assert metrics["counters"]["connect_attempts"] == 1
+    assert metrics["counters"]["notifications"] == 1
+    assert metrics["counters"]["airtime_connected"] >= 0
+    assert metrics["histograms"]["command_rtt"]["count"] == 1
+    assert metrics["histograms"]["connect_latency"]["count"] == 1
+    assert metrics["histograms"]["handshake_time"]["count"] == 1
+
+    proxy = METRICS.snapshot()["proxies"]["proxy-metrics"]
+    assert proxy["counters"]["connect_attempts"] == 1
+
+
+def test_unloading_an_entry_drops_its_blind_metrics(mock_hass, simulated_blind):
+    """An unloaded blind no longer shows up in get_metrics or diagnostics."""
+    from custom_components.tuiss2ha import async_unload_entry
+    from custom_components.tuiss2ha.const import DOMAIN
+
+    blind, _peripheral = simulated_blind
+    run_virtual(blind.get_blind_position())
+    assert blind.blind_id in METRICS.snapshot()["blinds"]
+
+    entry = MagicMock(entry_id="entry")
+    mock_hass.data = {DOMAIN: {"entry": MagicMock(blinds=[blind])}}
+    mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    assert run_virtual(async_unload_entry(mock_hass, entry))
+
+    assert blind.blind_id not in METRICS.snapshot()["blinds"]
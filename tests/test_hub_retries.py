@@ -3,12 +3,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from bleak.exc import BleakError
+from custom_components.tuiss2ha.lib.tuiss.clock import run_virtual
 from custom_components.tuiss2ha.hub import TuissBlind
 from custom_components.tuiss2ha.const import ConnectionTimeout
 
 
-@pytest.mark.asyncio
-async def test_attempt_connection_retries_and_times_out(mock_hass):
+def test_attempt_connection_retries_and_times_out(mock_hass):
     """If connect never succeeds, attempt_connection should raise ConnectionTimeout."""
     fake_device = MagicMock()
     fake_device.name = "TB-01"
@@ -19,14 +19,13 @@ async def test_attempt_connection_retries_and_times_out(mock_hass):
         tb = TuissBlind("AA:BB:CC:DD:EE:FF", "Test", hub)
 
         # Patch establish_connection to always raise BleakError (simulate connection failures)
-        with patch("custom_components.tuiss2ha.hub.establish_connection", side_effect=BleakError("bleak fail")):
+        with patch("custom_components.tuiss2ha.lib.tuiss.ble.establish_connection", side_effect=BleakError("bleak fail")):
             tb._restart_attempts = 2
             with pytest.raises(ConnectionTimeout):
-                await tb.attempt_connection()
+                run_virtual(tb.attempt_connection())
 
 
-@pytest.mark.asyncio
-async def test_attempt_connection_eventual_success(mock_hass):
+def test_attempt_connection_eventual_success(mock_hass):
     """If connect fails a few times then succeeds, attempt_connection should return without error."""
     fake_device = MagicMock()
     fake_device.name = "TB-01"
@@ -48,7 +47,7 @@ async def test_attempt_connection_eventual_success(mock_hass):
         hub = MagicMock()
         hub._hass = mock_hass
         tb = TuissBlind("AA:BB:CC:DD:EE:FF", "Test", hub)
-        with patch("custom_components.tuiss2ha.hub.establish_connection", side_effect=side_effect):
+        with patch("custom_components.tuiss2ha.lib.tuiss.ble.establish_connection", side_effect=side_effect):
             tb._restart_attempts = 3
-            await tb.attempt_connection()
+            run_virtual(tb.attempt_connection())
             assert tb._client is fake_client
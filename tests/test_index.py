@@ -0,0 +1,135 @@
+"""The integration index resolves service targets without scanning."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from custom_components.tuiss2ha.const import DOMAIN
+from custom_components.tuiss2ha.hub import Hub
+from custom_components.tuiss2ha.index import async_get_index, async_unload_index, split_timer_unique_id
+from custom_components.tuiss2ha.sensor import TuissTimerSlotsSensor
+
+BLIND_ID = "AA:BB:CC:DD:EE:01"
+
+
+def _registry_entry(entity_id, unique_id, platform=DOMAIN):
+    return SimpleNamespace(entity_id=entity_id, unique_id=unique_id, platform=platform)
+
+
+def _make_index(mock_hass, entries):
+    mock_hass.data = {}
+    blind = MagicMock(blind_id=BLIND_ID)
+    hub = MagicMock(spec=Hub)
+    hub.blinds = [blind]
+    with patch(
+        "custom_components.tuiss2ha.index.er.async_entries_for_config_entry",
+        return_value=entries,
+    ):
+        index = async_get_index(mock_hass)
+        index.async_add_hub("entry", hub)
+    return index, hub, blind
+
+
+def _registry_event(registry_entries, **data):
+    """Fire a registry update at the index with ``registry_entries`` as the registry."""
+    registry = MagicMock()
+    registry.async_get.side_effect = registry_entries.get
+    return patch("custom_components.tuiss2ha.index.er.async_get", return_value=registry), SimpleNamespace(data=data)
+
+
+def test_index_is_created_once_and_listens_to_the_registry(mock_hass):
+    """Every caller shares one index, subscribed once to registry updates."""
+    mock_hass.data = {}
+    index = async_get_index(mock_hass)
+    assert async_get_index(mock_hass) is index
+    assert mock_hass.data[DOMAIN]["index"] is index
+    mock_hass.bus.async_listen.assert_called_once()
+
+
+def test_index_resolves_blinds_covers_and_timers(mock_hass):
+    """entity_id lookups reach the blind, the cover entity and the timer slot."""
+    index, _hub, blind = _make_index(
+        mock_hass,
+        [
+            _registry_entry("cover.study", f"{BLIND_ID}_cover"),
+            _registry_entry("sensor.study_timer_3", f"{BLIND_ID}_timer_3"),
+            _registry_entry("sensor.study_battery", f"{BLIND_ID}_battery"),
+            _registry_entry("sensor.study_timer_extra", f"{BLIND_ID}_timer_extra"),
+            _registry_entry("sensor.study_timer_slots", TuissTimerSlotsSensor(MagicMock(blind_id=BLIND_ID)).unique_id),
+        ],
+    )
+    cover = SimpleNamespace(unique_id=f"{BLIND_ID}_cover", _blind=blind)
+    index.async_add_entities([cover])
+
+    assert index.blind("cover.study", ("_cover",)) is blind
+    assert index.blind("sensor.study_battery", ("_cover",)) is None
+    assert index.entity("cover.study") is cover
+    assert index.entity("sensor.study_battery") is None
+    assert index.timer("sensor.study_timer_3") == (blind, "3")
+    assert index.timer("cover.study") is None
+    assert index.timer("sensor.study_timer_slots") is None
+    assert index.timer("sensor.study_timer_extra") is None
+    assert index.unique_id("cover.other") is None
+
+
+def test_index_follows_renames_creates_and_removals(mock_hass):
+    """Registry events keep entity_ids current without rebuilding the index."""
+    index, _hub, blind = _make_index(mock_hass, [_registry_entry("cover.study", f"{BLIND_ID}_cover")])
+
+    renamed = _registry_entry("cover.office", f"{BLIND_ID}_cover")
+    patcher, event = _registry_event(
+        {"cover.office": renamed}, action="update", entity_id="cover.office", old_entity_id="cover.study"
+    )
+    with patcher:
+        index.async_registry_updated(event)
+    assert index.blind("cover.study", ("_cover",)) is None
+    assert index.blind("cover.office", ("_cover",)) is blind
+
+    created = _registry_entry("select.office_preset", f"{BLIND_ID}_preset_select")
+    foreign = _registry_entry("light.office", "abc", platform="hue")
+    for entry in (created, foreign):
+        patcher, event = _registry_event({entry.entity_id: entry}, action="create", entity_id=entry.entity_id)
+        with patcher:
+            index.async_registry_updated(event)
+    assert index.blind("select.office_preset", ("_preset_select",)) is blind
+    assert index.unique_id("light.office") is None
+
+    index.async_registry_updated(SimpleNamespace(data={"action": "remove", "entity_id": "cover.office"}))
+    assert index.unique_id("cover.office") is None
+
+
+def test_removing_a_hub_forgets_its_blind_and_entities(mock_hass):
+    """Unloading an entry stops its blind resolving."""
+    index, hub, blind = _make_index(mock_hass, [_registry_entry("cover.study", f"{BLIND_ID}_cover")])
+    index.async_add_entities([SimpleNamespace(unique_id=f"{BLIND_ID}_cover", _blind=blind)])
+
+    index.async_remove_hub(hub)
+
+    assert index.blind("cover.study", ("_cover",)) is None
+    assert index.entity("cover.study") is None
+
+
+def test_timer_unique_ids_need_a_numeric_slot():
+    """Only a numeric suffix after the timer marker is a timer slot."""
+    assert split_timer_unique_id(f"{BLIND_ID}_timer_12") == (BLIND_ID, "12")
+    assert split_timer_unique_id(f"{BLIND_ID}_timer_slots") is None
+    assert split_timer_unique_id(f"{BLIND_ID}_cover") is None
+
+
+def test_unloading_the_last_hub_stops_listening_to_the_registry(mock_hass):
+    """The registry listener outlives every hub but the last."""
+    index, hub, _blind = _make_index(mock_hass, [])
+    unsub = mock_hass.bus.async_listen.return_value
+    other = MagicMock(spec=Hub)
+    other.blinds = [MagicMock(blind_id="AA:BB:CC:DD:EE:02")]
+    with patch("custom_components.tuiss2ha.index.er.async_entries_for_config_entry", return_value=[]):
+        index.async_add_hub("other", other)
+
+    index.async_remove_hub(hub)
+    async_unload_index(mock_hass)
+    unsub.assert_not_called()
+    assert mock_hass.data[DOMAIN]["index"] is index
+
+    index.async_remove_hub(other)
+    async_unload_index(mock_hass)
+    unsub.assert_called_once()
+    assert "index" not in mock_hass.data[DOMAIN]
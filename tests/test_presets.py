@@ -293,6 +293,37 @@ def test_select_unavailable_when_no_presets(mock_hass):
     assert sel.available is False
 
 
+def test_select_current_option_prefers_nearest_preset(mock_hass):
+    """Two presets inside the tolerance: the closer one is selected."""
+    sel, tb = _make_select(mock_hass)
+    tb.presets = {"Almost": 49.6, "Half": 50.2}
+    tb._current_cover_position = 50.0
+
+    assert sel.current_option == "Half"
+
+
+def test_preset_map_index_follows_every_change(mock_hass):
+    """Cached options and position matches are rebuilt after each kind of mutation."""
+    from custom_components.tuiss2ha.presets import PresetMap
+
+    tb = _make_blind(mock_hass)
+    tb.presets = {"Movie": 30}
+    assert isinstance(tb.presets, PresetMap)
+    presets = tb.presets
+    assert presets.names == ["Movie"] and presets.nearest(30) == "Movie"
+
+    presets["Morning"] = 100
+    assert presets.names == ["Morning", "Movie"] and presets.nearest(99.6) == "Morning"
+    presets.update({"Dawn": 99.8})
+    assert presets.nearest(99.6) == "Dawn"
+    presets.pop("Dawn")
+    del presets["Movie"]
+    assert presets.names == ["Morning"] and presets.nearest(30) is None
+    presets.clear()
+    assert presets.names == [] and presets.nearest(100) is None
+    assert presets == {}
+
+
 # ---------------------------------------------------------------------------
 # Schema + resolver guards
 # ---------------------------------------------------------------------------
@@ -318,60 +349,63 @@ def test_preset_name_schema_rejects_blank():
         _PRESET_NAME_SCHEMA("\t\n")
 
 
-def test_resolve_rejects_non_preset_entity(mock_hass):
-    """Resolver must refuse tuiss2ha entities that aren't cover/preset select.
-
-    Battery, signal-strength, model etc. share the integration platform but
-    are not valid preset-service targets. The resolver should return None
-    rather than falling back to a fragile rsplit that accidentally yields
-    the correct blind only because MAC addresses lack underscores.
-    """
-    from custom_components.tuiss2ha import _resolve_blind_from_entity_id, DOMAIN
+def _index_blind(mock_hass, unique_ids):
+    """Index a blind and registry entries with the given entity_id -> unique_id."""
+    from custom_components.tuiss2ha import DOMAIN
     from custom_components.tuiss2ha.hub import Hub
+    from custom_components.tuiss2ha.index import async_get_index
 
     blind = MagicMock()
     blind.blind_id = "AA:BB:CC:DD:EE:FF"
     hub = MagicMock(spec=Hub)
     hub.blinds = [blind]
     mock_hass.data = {DOMAIN: {"entry": hub}}
-
-    # Fake the entity registry — return an entry for a battery sensor.
-    fake_entry = MagicMock()
-    fake_entry.platform = DOMAIN
-    fake_entry.unique_id = "AA:BB:CC:DD:EE:FF_battery"
-
+    entries = [
+        MagicMock(entity_id=entity_id, unique_id=unique_id)
+        for entity_id, unique_id in unique_ids.items()
+    ]
     with patch(
-        "custom_components.tuiss2ha.er.async_get",
-        return_value=MagicMock(async_get=MagicMock(return_value=fake_entry)),
+        "custom_components.tuiss2ha.index.er.async_entries_for_config_entry",
+        return_value=entries,
     ):
-        result = _resolve_blind_from_entity_id(
-            mock_hass, "binary_sensor.blind_test_battery"
-        )
+        async_get_index(mock_hass).async_add_hub("entry", hub)
+    return blind
 
-    assert result is None
+
+def test_resolve_rejects_non_preset_entity(mock_hass):
+    """Resolver must refuse tuiss2ha entities that aren't cover/preset select.
+
+    Battery, signal-strength, model etc. share the integration platform but
+    are not valid preset-service targets. The resolver should return None
+    rather than falling back to a fragile rsplit that accidentally yields
+    the correct blind only because MAC addresses lack underscores.
+    """
+    from custom_components.tuiss2ha import _resolve_blind_from_entity_id
+
+    _index_blind(
+        mock_hass, {"binary_sensor.blind_test_battery": "AA:BB:CC:DD:EE:FF_battery"}
+    )
+
+    assert _resolve_blind_from_entity_id(mock_hass, "binary_sensor.blind_test_battery") is None
+    assert _resolve_blind_from_entity_id(mock_hass, "cover.unknown") is None
 
 
 def test_resolve_accepts_cover_and_preset_select(mock_hass):
     """Resolver must accept both the cover entity and the preset select entity."""
-    from custom_components.tuiss2ha import _resolve_blind_from_entity_id, DOMAIN
-    from custom_components.tuiss2ha.hub import Hub
-
-    blind = MagicMock()
-    blind.blind_id = "AA:BB:CC:DD:EE:FF"
-    hub = MagicMock(spec=Hub)
-    hub.blinds = [blind]
-    mock_hass.data = {DOMAIN: {"entry": hub}}
+    from custom_components.tuiss2ha import _resolve_blind_from_entity_id
+
+    blind = _index_blind(
+        mock_hass,
+        {
+            "cover.blind": "AA:BB:CC:DD:EE:FF_cover",
+            "select.blind_preset": "AA:BB:CC:DD:EE:FF_preset_select",
+        },
+    )
 
-    for suffix in ("_cover", "_preset_select"):
-        fake_entry = MagicMock()
-        fake_entry.platform = DOMAIN
-        fake_entry.unique_id = f"AA:BB:CC:DD:EE:FF{suffix}"
-        with patch(
-            "custom_components.tuiss2ha.er.async_get",
-            return_value=MagicMock(async_get=MagicMock(return_value=fake_entry)),
-        ):
-            result = _resolve_blind_from_entity_id(mock_hass, "ignored.id")
-        assert result is blind, f"resolver must accept {suffix}"
+    for entity_id in ("cover.blind", "select.blind_preset"):
+        assert _resolve_blind_from_entity_id(mock_hass, entity_id) is blind, (
+            f"resolver must accept {entity_id}"
+        )
 
 
 @pytest.mark.asyncio
@@ -510,3 +544,106 @@ async def test_async_save_current_clamps_out_of_range(mock_hass):
     tb._current_cover_position = -5.0
     result = await tb.async_save_current_as_preset("LowGlitch")
     assert result == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Bulk preset services
+# ---------------------------------------------------------------------------
+
+
+def test_preset_map_schema_validates_like_single_presets():
+    """Bulk preset maps use the same name and position rules as save_preset."""
+    import voluptuous as vol
+    from custom_components.tuiss2ha import _normalize_preset_map
+
+    assert _normalize_preset_map({" Morning ": "80", "Movie": 30.5}) == {"Morning": 80.0, "Movie": 30.5}
+    for bad in ({"  ": 50}, {"Morning": 101}, {"Morning": "high"}, ["Morning", 80]):
+        with pytest.raises(vol.Invalid):
+            _normalize_preset_map(bad)
+
+
+@pytest.mark.asyncio
+async def test_async_set_presets_merges_or_replaces_with_one_write(mock_hass):
+    """A bulk update writes storage and notifies listeners once."""
+    tb = _make_blind(mock_hass)
+    tb._presets_store = MagicMock()
+    tb._presets_store.async_save = AsyncMock()
+    tb.publish_updates = MagicMock()
+    tb.presets = {"Morning": 80.0, "Sleep": 0.0}
+
+    await tb.async_set_presets({"Morning": 90.0, "Movie": 30.0})
+    assert tb.presets == {"Morning": 90.0, "Sleep": 0.0, "Movie": 30.0}
+    tb._presets_store.async_save.assert_awaited_once_with(tb.presets)
+    tb.publish_updates.assert_called_once()
+
+    await tb.async_set_presets({"Movie": 25.0}, replace=True)
+    assert tb.presets == {"Movie": 25.0}
+    assert tb.presets.nearest(25.0) == "Movie"
+    assert tb._presets_store.async_save.await_count == 2
+
+
+def _bulk_handlers(mock_hass, blinds_by_entity):
+    """Register the preset services and return their handlers by name."""
+    from custom_components.tuiss2ha import _async_register_preset_services
+
+    mock_hass.services.has_service.return_value = False
+    _async_register_preset_services(mock_hass)
+    handlers = {
+        call.args[1]: call.args[2] for call in mock_hass.services.async_register.call_args_list
+    }
+    resolver = patch(
+        "custom_components.tuiss2ha._resolve_blind_from_entity_id",
+        side_effect=lambda hass, entity_id: blinds_by_entity.get(entity_id),
+    )
+    return handlers, resolver
+
+
+def _bulk_blind(blind_id, presets=None):
+    blind = MagicMock()
+    blind.blind_id = blind_id
+    blind.name = blind_id
+    blind.presets = presets or {}
+    blind.async_set_presets = AsyncMock()
+    return blind
+
+
+@pytest.mark.asyncio
+async def test_set_presets_service_updates_each_blind_once(mock_hass):
+    """A cover and its preset select resolve to one blind, which is written once."""
+    from homeassistant.exceptions import HomeAssistantError
+
+    study, lounge = _bulk_blind("study"), _bulk_blind("lounge")
+    handlers, resolver = _bulk_handlers(
+        mock_hass, {"cover.study": study, "select.study_preset": study, "cover.lounge": lounge}
+    )
+    presets = {"Morning": 100.0, "Movie": 30.0}
+    with resolver:
+        await handlers["set_presets"](MagicMock(data={
+            "entity_id": ["cover.study", "select.study_preset", "cover.lounge"],
+            "presets": presets,
+            "mode": "replace",
+        }))
+        with pytest.raises(HomeAssistantError, match="cover.unknown"):
+            await handlers["set_presets"](MagicMock(data={
+                "entity_id": ["cover.lounge", "cover.unknown"], "presets": presets, "mode": "merge",
+            }))
+
+    study.async_set_presets.assert_awaited_once_with(presets, replace=True)
+    lounge.async_set_presets.assert_awaited_once_with(presets, replace=True)
+
+
+@pytest.mark.asyncio
+async def test_copy_and_get_presets_services(mock_hass):
+    """copy_presets skips the source blind; get_presets exports each blind's map."""
+    source = _bulk_blind("study", {"Morning": 100.0})
+    target = _bulk_blind("lounge", {"Sleep": 0.0})
+    handlers, resolver = _bulk_handlers(mock_hass, {"cover.study": source, "cover.lounge": target})
+    with resolver:
+        await handlers["copy_presets"](MagicMock(data={
+            "source": "cover.study", "entity_id": ["cover.study", "cover.lounge"], "mode": "merge",
+        }))
+        exported = await handlers["get_presets"](MagicMock(data={"entity_id": ["cover.study", "cover.lounge"]}))
+
+    source.async_set_presets.assert_not_awaited()
+    target.async_set_presets.assert_awaited_once_with({"Morning": 100.0}, replace=False)
+    assert exported == {"cover.study": {"Morning": 100.0}, "cover.lounge": {"Sleep": 0.0}}
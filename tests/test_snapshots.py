@@ -0,0 +1,135 @@
+"""Snapshot and restore of fleet positions."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.tuiss2ha.cover import _async_restore_positions, _async_snapshot_positions
+from custom_components.tuiss2ha.hub import TuissBlind
+from custom_components.tuiss2ha.index import async_get_index
+from custom_components.tuiss2ha.snapshots import async_get_snapshots
+
+
+def _make_fleet(mock_hass, positions):
+    """Index one cover per ``entity_id: position`` and return the entities."""
+    mock_hass.data = {}
+    index = async_get_index(mock_hass)
+    entities = {}
+    for number, (entity_id, position) in enumerate(positions.items()):
+        blind_id = f"AA:BB:CC:DD:EE:{number:02X}"
+        with patch(
+            "custom_components.tuiss2ha.hub.bluetooth.async_ble_device_from_address",
+            return_value=MagicMock(),
+        ):
+            hub = MagicMock()
+            hub._hass = mock_hass
+            blind = TuissBlind(blind_id, entity_id, hub)
+        blind._current_cover_position = position
+        blind._move_tolerance = 0.1
+        if position is not None:
+            blind.mark_position("blind")
+        entity = SimpleNamespace(
+            entity_id=entity_id,
+            unique_id=f"{blind_id}_cover",
+            _blind=blind,
+            _async_move_to_position=AsyncMock(),
+        )
+        index.unique_ids[entity_id] = entity.unique_id
+        index.async_add_entities([entity])
+        entities[entity_id] = entity
+    return entities
+
+
+@pytest.fixture
+def snapshot_store():
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    store.async_save = AsyncMock()
+    # ATTR_POSITION comes from the stubbed cover component; give it its real value
+    with patch("custom_components.tuiss2ha.snapshots.Store", return_value=store), patch(
+        "custom_components.tuiss2ha.cover.ATTR_POSITION", "position"
+    ):
+        yield store
+
+
+@pytest.mark.asyncio
+async def test_snapshot_saves_known_positions_in_memory_or_storage(mock_hass, snapshot_store):
+    """Blinds without a known position are reported; only ``store`` snapshots are written."""
+    _make_fleet(mock_hass, {"cover.study": 40.0, "cover.lounge": None})
+
+    result = await _async_snapshot_positions(mock_hass, ["cover.study", "cover.lounge", "cover.gone"], "Evening")
+    assert result == {"name": "Evening", "positions": {"cover.study": 40.0}, "unknown": ["cover.gone", "cover.lounge"]}
+    snapshot_store.async_save.assert_not_awaited()
+
+    await _async_snapshot_positions(mock_hass, ["cover.study"], "Morning", store=True)
+    snapshot_store.async_save.assert_awaited_once_with({"Morning": {"cover.study": 40.0}})
+    assert async_get_snapshots(mock_hass).get("Evening") == {"cover.study": 40.0}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_treats_an_unread_placeholder_position_as_unknown(mock_hass, snapshot_store):
+    """The placeholder 0 a cover starts with is not saved as "closed"."""
+    entities = _make_fleet(mock_hass, {"cover.study": 40.0, "cover.lounge": 0.0})
+    entities["cover.lounge"]._blind._position_source = None
+    entities["cover.lounge"]._blind._position_updated_at = None
+
+    result = await _async_snapshot_positions(mock_hass, ["cover.study", "cover.lounge"], "Evening")
+
+    assert result["positions"] == {"cover.study": 40.0}
+    assert result["unknown"] == ["cover.lounge"]
+
+
+@pytest.mark.asyncio
+async def test_stored_snapshots_load_after_restart(mock_hass, snapshot_store):
+    """Stored snapshots are read back once; invalid entries are dropped."""
+    mock_hass.data = {}
+    snapshot_store.async_load.return_value = {"Night": {"cover.study": 0, "cover.bad": 140}, "Broken": [1]}
+
+    snapshots = async_get_snapshots(mock_hass)
+    await snapshots.async_load()
+    await snapshots.async_load()
+
+    assert snapshots.get("Night") == {"cover.study": 0.0}
+    assert snapshots.get("Broken") is None
+    snapshot_store.async_load.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_restore_skips_blinds_in_place_and_plans_the_rest(mock_hass, snapshot_store):
+    """Blinds within tolerance are not connected; the others move once each, longest first."""
+    entities = _make_fleet(mock_hass, {"cover.study": 40.0, "cover.lounge": 10.0, "cover.hall": 50.0})
+    await _async_snapshot_positions(mock_hass, list(entities), "Evening")
+    entities["cover.lounge"]._blind._current_cover_position = 90.0
+    entities["cover.hall"]._blind._current_cover_position = 60.0
+
+    result = await _async_restore_positions(mock_hass, {"name": "Evening"})
+
+    assert result["skipped"] == ["cover.study"]
+    assert list(result["results"]) == ["cover.lounge", "cover.hall"]
+    assert result["succeeded"] == 2
+    entities["cover.study"]._async_move_to_position.assert_not_awaited()
+    entities["cover.lounge"]._async_move_to_position.assert_awaited_once_with(
+        position=10.0, skip_battery_check=True, wait=True
+    )
+    assert entities["cover.study"]._blind._connections_saved == 1
+
+
+@pytest.mark.asyncio
+async def test_restore_reports_unknown_snapshots_and_targets(mock_hass, snapshot_store):
+    """A missing snapshot raises; a target outside the snapshot fails on its own."""
+    from homeassistant.exceptions import HomeAssistantError
+
+    entities = _make_fleet(mock_hass, {"cover.study": 40.0, "cover.lounge": 10.0})
+    await _async_snapshot_positions(mock_hass, ["cover.study"], "Evening")
+    entities["cover.study"]._blind._current_cover_position = 0.0
+
+    with pytest.raises(HomeAssistantError, match="Night"):
+        await _async_restore_positions(mock_hass, {"name": "Night"})
+    result = await _async_restore_positions(
+        mock_hass, {"name": "Evening", "entity_ids": ["cover.study", "cover.lounge"]}
+    )
+
+    assert result["results"]["cover.study"]["success"] is True
+    assert result["results"]["cover.lounge"] == {"success": False, "error": "not in snapshot", "proxy": None}
+    entities["cover.lounge"]._async_move_to_position.assert_not_awaited()
@@ -152,4 +152,280 @@ async def test_cover_action_add_timer():
     
     mock_entity._blind.async_add_timer.assert_awaited_once_with(
         ["mon", "tue"], "12:34:00", 75.0
-    )
\ No newline at end of file
+    )
+
+def test_diff_timers_only_touches_changed_slots():
+    """Identical slots are kept; only the differences are deleted or added."""
+    from custom_components.tuiss2ha.lib.tuiss.schedule import diff_timers
+
+    current = {
+        "10": {"days": ["mon", "tue"], "time": "07:00:00", "position": 100.0},
+        "11": {"days": ["sat"], "time": "09:00", "position": 50.0},
+    }
+    desired = [
+        {"days": ["tue", "mon"], "time": "07:00", "position": 100},
+        {"days": ["sun"], "time": "09:00", "position": 50.0},
+    ]
+
+    to_delete, to_add = diff_timers(current, desired)
+
+    assert to_delete == ["11"]
+    assert to_add == [desired[1]]
+
+
+def test_decode_timer_record_round_trips_write_frame(tuiss_blind):
+    """A record in the timer write layout decodes back to the same schedule."""
+    from custom_components.tuiss2ha.lib.tuiss.schedule import decode_timer_record
+
+    frame = bytes.fromhex(tuiss_blind.create_timer_command("12", ["mon", "fri"], "06:45", 42.5))
+
+    assert decode_timer_record(list(frame)) == {
+        "timer_id": "12",
+        "days": ["mon", "fri"],
+        "time": "06:45",
+        "position": 42.5,
+    }
+    assert decode_timer_record(list(bytes.fromhex("ff010203d6000a"))) is None
+
+
+@pytest.mark.asyncio
+async def test_async_sync_timers_applies_diff_in_one_session(mock_hass, tuiss_blind):
+    """Firmware table is read, then only the differing slots are rewritten."""
+    tuiss_blind.ensure_connected = AsyncMock()
+    tuiss_blind.send_command = AsyncMock()
+    tuiss_blind.async_save_timer = AsyncMock()
+    tuiss_blind.publish_updates = MagicMock()
+    tuiss_blind.disconnect = AsyncMock()
+    tuiss_blind._client = MagicMock()
+    tuiss_blind._client.is_connected = True
+    tuiss_blind.timers = {}
+
+    kept = tuiss_blind.create_timer_command("10", ["mon"], "07:00", 100.0)
+    stale = tuiss_blind.create_timer_command("11", ["sat"], "09:00", 0.0)
+    notifications = [
+        # read-back: two records, then the next free slot
+        [f"ff010203{kept[12:]}", f"ff010203{stale[12:]}", "ff010203d6000c"],
+        # slot request for the new timer
+        ["ff010203d6000c"],
+    ]
+
+    async def mock_start_notify(char, callback):
+        for frame in notifications.pop(0):
+            await callback(char, bytearray.fromhex(frame))
+
+    tuiss_blind._client.start_notify = AsyncMock(side_effect=mock_start_notify)
+    tuiss_blind._client.stop_notify = AsyncMock()
+
+    desired = [
+        {"days": ["mon"], "time": "07:00", "position": 100.0},
+        {"days": ["sun"], "time": "10:00", "position": 25.0},
+    ]
+    with patch("custom_components.tuiss2ha.hub.async_dispatcher_send") as mock_dispatch:
+        result = await tuiss_blind.async_sync_timers(desired, read_back=True)
+
+    assert result["deleted"] == ["11"]
+    assert result["added"] == ["12"]
+    assert result["slots_used"] == 2
+    assert result["source"] == "firmware"
+    assert set(tuiss_blind.timers) == {"10", "12"}
+    tuiss_blind.disconnect.assert_awaited()
+    sent = [call.args[1].hex() for call in tuiss_blind.send_command.await_args_list]
+    assert "ff78ea4103010b" in sent
+    assert tuiss_blind.create_timer_command("12", ["sun"], "10:00", 25.0) in sent
+    assert kept not in sent
+    mock_dispatch.assert_any_call(mock_hass, f"tuiss2ha_add_timer_{tuiss_blind.blind_id}", "12")
+    tuiss_blind.async_save_timer.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_sync_timers_refuses_a_table_without_records(mock_hass, tuiss_blind):
+    """A free slot past the first with no decoded records fails instead of reading as empty."""
+    tuiss_blind.ensure_connected = AsyncMock()
+    tuiss_blind.send_command = AsyncMock()
+    tuiss_blind.async_save_timer = AsyncMock()
+    tuiss_blind.publish_updates = MagicMock()
+    tuiss_blind.disconnect = AsyncMock()
+    tuiss_blind._client = MagicMock()
+    tuiss_blind._client.is_connected = True
+    held = {"days": ["mon"], "time": "07:00", "position": 100.0}
+    tuiss_blind.timers = {"10": dict(held)}
+
+    async def mock_start_notify(char, callback):
+        # Slots 1-11 are in use, but none of their records were understood
+        await callback(char, bytearray.fromhex("ff010203d6000c"))
+
+    tuiss_blind._client.start_notify = AsyncMock(side_effect=mock_start_notify)
+    tuiss_blind._client.stop_notify = AsyncMock()
+
+    with patch("custom_components.tuiss2ha.hub.async_dispatcher_send"), pytest.raises(Exception) as exc:
+        await tuiss_blind.async_sync_timers([held], read_back=True)
+
+    assert getattr(exc.value, "translation_key", None) == "timer_read_failed"
+    assert set(tuiss_blind.timers) == {"10"}
+    assert tuiss_blind._timer_slot_source == "home_assistant"
+    tuiss_blind.disconnect.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_async_sync_timers_rejects_over_capacity(tuiss_blind):
+    """More than 16 timers is refused before the blind is contacted."""
+    tuiss_blind.ensure_connected = AsyncMock()
+    desired = [{"days": ["mon"], "time": f"{h:02d}:00", "position": 50} for h in range(17)]
+
+    with pytest.raises(Exception) as exc:
+        await tuiss_blind.async_sync_timers(desired)
+
+    assert getattr(exc.value, "translation_key", None) == "max_timers_reached"
+    tuiss_blind.ensure_connected.assert_not_awaited()
+
+
+def test_pack_timers_merges_days_for_same_time_and_position():
+    """Schedules differing only in days share one firmware timer."""
+    from custom_components.tuiss2ha.lib.tuiss.schedule import pack_timers
+
+    packed = pack_timers([
+        {"days": ["mon", "tue"], "time": "07:00:00", "position": 100},
+        {"days": ["wed"], "time": "07:00", "position": 100.0},
+        {"days": ["sat"], "time": "07:00", "position": 80},
+        {"days": [], "time": "08:00", "position": 10},
+    ])
+
+    assert packed == [
+        {"days": ["sat"], "time": "07:00", "position": 80.0},
+        {"days": ["mon", "tue", "wed"], "time": "07:00", "position": 100.0},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_add_timer_merges_into_existing_slot(tuiss_blind):
+    """Adding days to an existing time/position rewrites that slot instead of using a new one."""
+    tuiss_blind.timers = {"10": {"timer_id": "10", "ha_index": 1, "days": ["mon"], "time": "07:00:00", "position": 100.0}}
+    tuiss_blind.async_sync_timers = AsyncMock()
+
+    async def fake_sync(desired, read_back=True):
+        tuiss_blind.timers = {"11": {"timer_id": "11", **desired[0]}}
+
+    tuiss_blind.async_sync_timers.side_effect = fake_sync
+
+    timer_id = await tuiss_blind.async_add_timer(["tue"], "07:00:00", 100.0)
+
+    assert timer_id == "11"
+    tuiss_blind.async_sync_timers.assert_awaited_once_with(
+        [{"days": ["mon", "tue"], "time": "07:00", "position": 100.0}], read_back=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_add_timer_already_covered_is_noop(tuiss_blind):
+    """A schedule already covered by a slot does not touch the blind."""
+    tuiss_blind.timers = {"10": {"timer_id": "10", "days": ["mon", "tue"], "time": "07:00", "position": 100.0}}
+    tuiss_blind.ensure_connected = AsyncMock()
+    tuiss_blind.async_sync_timers = AsyncMock()
+
+    assert await tuiss_blind.async_add_timer(["tue"], "07:00", 100.0) == "10"
+    tuiss_blind.ensure_connected.assert_not_awaited()
+    tuiss_blind.async_sync_timers.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_async_add_timer_full_is_refused_before_connecting(tuiss_blind):
+    """With every slot used and nothing to merge, no connection is made."""
+    tuiss_blind.timers = {
+        str(i): {"timer_id": str(i), "days": ["mon"], "time": f"{i:02d}:00", "position": 50.0}
+        for i in range(1, 17)
+    }
+    tuiss_blind.ensure_connected = AsyncMock()
+
+    with pytest.raises(Exception) as exc:
+        await tuiss_blind.async_add_timer(["mon"], "23:30", 50.0)
+
+    assert getattr(exc.value, "translation_key", None) == "max_timers_reached"
+    tuiss_blind.ensure_connected.assert_not_awaited()
+
+
+def test_track_timer_positions_updates_estimate_on_scheduled_day(tuiss_blind):
+    """A due firmware timer moves HA's position estimate, but only on its days."""
+    import datetime
+
+    tuiss_blind.publish_updates = MagicMock()
+    tuiss_blind._current_cover_position = 0
+    tuiss_blind.timers = {
+        "10": {"timer_id": "10", "days": ["mon"], "time": "07:30:00", "position": 80.0},
+    }
+    with patch("custom_components.tuiss2ha.hub.async_track_time_change") as mock_track:
+        tuiss_blind.track_timer_positions()
+
+    mock_track.assert_called_once()
+    assert mock_track.call_args.kwargs == {"hour": 7, "minute": 30, "second": 0}
+    fired = mock_track.call_args.args[1]
+
+    fired(datetime.datetime(2026, 10, 20, 7, 30))  # a Tuesday
+    assert tuiss_blind._current_cover_position == 0
+
+    fired(datetime.datetime(2026, 10, 19, 7, 30))  # a Monday
+    assert tuiss_blind._current_cover_position == 80.0
+    tuiss_blind.publish_updates.assert_called_once()
+
+
+def test_track_timer_positions_replaces_previous_listeners(tuiss_blind):
+    """Re-arming after a timer change cancels the old listeners."""
+    unsub = MagicMock()
+    tuiss_blind.timers = {"10": {"days": ["mon"], "time": "07:30", "position": 80.0}}
+    with patch("custom_components.tuiss2ha.hub.async_track_time_change", return_value=unsub):
+        tuiss_blind.track_timer_positions()
+        tuiss_blind.track_timer_positions()
+
+    unsub.assert_called_once()
+
+
+def test_orphaned_timer_cleanup_removes_only_stale_timer_sensors(mock_hass, tuiss_blind):
+    """Timer sensors without a stored timer go; other sensors and blinds are left alone."""
+    from custom_components.tuiss2ha.sensor import _async_remove_orphaned_timers
+
+    blind_id = tuiss_blind.blind_id
+    tuiss_blind.timers = {"11": {"days": ["mon"], "time": "08:00", "position": 50.0}}
+    entries = [
+        MagicMock(domain="sensor", entity_id="sensor.timer_11", unique_id=f"{blind_id}_timer_11"),
+        MagicMock(domain="sensor", entity_id="sensor.timer_12", unique_id=f"{blind_id}_timer_12"),
+        MagicMock(domain="sensor", entity_id="sensor.timer_13", unique_id=f"{blind_id}_timer_13"),
+        MagicMock(domain="sensor", entity_id="sensor.signal", unique_id=f"{blind_id}_signal_strength"),
+        MagicMock(domain="cover", entity_id="cover.blind", unique_id=f"{blind_id}_cover"),
+        MagicMock(domain="sensor", entity_id="sensor.other_timer", unique_id="11:22:33:44:55:66_timer_1"),
+    ]
+    registry = MagicMock()
+    with patch("custom_components.tuiss2ha.sensor.er.async_get", return_value=registry), \
+         patch("custom_components.tuiss2ha.sensor.er.async_entries_for_config_entry", return_value=entries):
+        _async_remove_orphaned_timers(mock_hass, MagicMock(entry_id="entry"), [tuiss_blind])
+
+    assert [call.args[0] for call in registry.async_remove.call_args_list] == [
+        "sensor.timer_12",
+        "sensor.timer_13",
+    ]
+
+
+def test_timer_slots_sensor_survives_a_timer_change(mock_hass, tuiss_blind):
+    """The cleanup that follows a timer change keeps the Timer Slots sensor."""
+    from custom_components.tuiss2ha.sensor import TuissTimerSlotsSensor, _async_remove_orphaned_timers
+
+    blind_id = tuiss_blind.blind_id
+    tuiss_blind.timers = {}
+    entries = [
+        MagicMock(domain="sensor", entity_id="sensor.slots", unique_id=TuissTimerSlotsSensor(tuiss_blind).unique_id),
+        MagicMock(domain="sensor", entity_id="sensor.legacy_slots", unique_id=f"{blind_id}_timer_slots"),
+        MagicMock(domain="sensor", entity_id="sensor.timer_3", unique_id=f"{blind_id}_timer_3"),
+    ]
+    registry = MagicMock()
+    with patch("custom_components.tuiss2ha.sensor.er.async_get", return_value=registry), \
+         patch("custom_components.tuiss2ha.sensor.er.async_entries_for_config_entry", return_value=entries):
+        _async_remove_orphaned_timers(mock_hass, MagicMock(entry_id="entry"), [tuiss_blind])
+
+    assert [call.args[0] for call in registry.async_remove.call_args_list] == ["sensor.timer_3"]
+
+
+def test_timer_changes_signal_the_orphan_cleanup(mock_hass, tuiss_blind):
+    """Loading or saving timers asks the sensor platform to prune that blind's timer sensors."""
+    with patch("custom_components.tuiss2ha.hub.async_dispatcher_send") as mock_dispatch, \
+         patch("custom_components.tuiss2ha.hub.async_track_time_change"):
+        tuiss_blind._timers_changed()
+
+    mock_dispatch.assert_called_once_with(mock_hass, f"tuiss2ha_timers_changed_{tuiss_blind.blind_id}")
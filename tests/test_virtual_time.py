@@ -0,0 +1,133 @@
+"""Movement, timeout and retry behaviour against a simulated blind on virtual time."""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from custom_components.tuiss2ha.lib.tuiss.clock import run_virtual
+from custom_components.tuiss2ha.const import TIMEOUT_SECONDS, ConnectionTimeout
+from custom_components.tuiss2ha.hub import TuissBlind
+from custom_components.tuiss2ha.lib.tuiss.simulator import SimulatedBlind
+
+
+def _elapsed(main):
+    """Run ``main`` on virtual time; return (result, virtual seconds, real seconds)."""
+
+    async def timed():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await main()
+        return result, loop.time() - started
+
+    real_started = time.perf_counter()
+    result, virtual = run_virtual(timed())
+    return result, virtual, time.perf_counter() - real_started
+
+
+def test_connection_retries_back_off(simulated_blind):
+    """Two failed connects cost two 2 s back-offs of virtual time and no real time."""
+    blind, peripheral = simulated_blind
+    peripheral.connect_failures = 2
+
+    _, virtual, real = _elapsed(blind.attempt_connection)
+
+    assert blind._client is peripheral
+    assert peripheral.connects == 3
+    assert blind.op_stats["retries"] == 2
+    assert virtual == pytest.approx(3 * peripheral.connect_delay + 2 * 2)
+    assert real < 1
+
+
+def test_connection_gives_up_after_restart_attempts(simulated_blind):
+    blind, peripheral = simulated_blind
+    peripheral.connect_failures = 10
+
+    with pytest.raises(ConnectionTimeout):
+        _elapsed(blind.attempt_connection)
+
+    assert peripheral.connects == 3
+    assert blind.metrics["counters"]["connect_failures"] == 3
+
+
+def test_unanswered_request_times_out(simulated_blind):
+    """A blind that never answers releases the connection after the 10 s reply timeout."""
+    blind, peripheral = simulated_blind
+    peripheral.silent = True
+
+    _, virtual, _ = _elapsed(blind.get_blind_position)
+
+    assert virtual == pytest.approx(peripheral.connect_delay + 10)
+    assert blind.current_position is None
+    assert blind.metrics["counters"]["timeouts"] == 1
+    assert peripheral.is_connected is False
+
+
+def test_move_follows_progress_and_learns_speed(simulated_blind):
+    """A move ends on the blind's progress reports and learns the traversal speed."""
+    blind, peripheral = simulated_blind
+    blind._current_cover_position = 0
+
+    async def move():
+        await blind.async_move_cover(movement_direction=1, target_position=40)
+
+    _, virtual, _ = _elapsed(move)
+
+    assert peripheral.position == 60
+    assert blind.current_position == 60
+    assert blind._locked is False
+    assert peripheral.is_connected is False
+    # 60% at 5%/s, reported once a second
+    assert blind._attr_traversal_speed == pytest.approx(5.0, rel=0.01)
+    assert virtual == pytest.approx(peripheral.connect_delay + 12, abs=0.1)
+
+
+def test_jammed_move_recovers_the_lock(simulated_blind):
+    """A stalled motor times out, the lock is released and the next move runs."""
+    blind, peripheral = simulated_blind
+    peripheral.jam_at = 30
+    blind._current_cover_position = 0
+
+    async def moves():
+        await blind.async_move_cover(movement_direction=1, target_position=40)
+        stuck = (blind._locked, blind._position_source)
+        peripheral.jam_at = None
+        await blind.async_move_cover(movement_direction=1, target_position=40)
+        return stuck
+
+    stuck, virtual, real = _elapsed(moves)
+
+    assert stuck == (False, "estimate")
+    assert blind.metrics["counters"]["timeouts"] == 1
+    assert peripheral.position == 60
+    assert blind._position_source == "move"
+    assert virtual > TIMEOUT_SECONDS
+    assert real < 1
+
+
+def test_runs_are_reproducible(mock_hass):
+    """The same scenario produces the same frames at the same virtual times."""
+    mock_hass.async_create_task = asyncio.ensure_future
+
+    async def scenario():
+        peripheral = SimulatedBlind("AA:BB:CC:00:FF:01", connect_failures=1)
+        with patch("custom_components.tuiss2ha.hub.bluetooth.async_ble_device_from_address", return_value=MagicMock()), \
+             patch("custom_components.tuiss2ha.hub.bluetooth.async_last_service_info", return_value=None), \
+             patch("custom_components.tuiss2ha.lib.tuiss.ble.establish_connection", side_effect=peripheral.establish):
+            blind = TuissBlind(peripheral.address, "Simulated", MagicMock(_hass=mock_hass))
+            blind._restart_attempts = 3
+            blind._current_cover_position = 0
+            await blind.async_move_cover(movement_direction=1, target_position=70)
+            await blind.get_battery_status()
+        # Sent frames are compared by opcode: the time sync carries the wall clock
+        return [
+            (kind, payload[4] if kind == "tx" else payload, mono)
+            for _, mono, kind, payload in blind._frames
+        ]
+
+    first = run_virtual(scenario())
+    second = run_virtual(scenario())
+
+    assert first == second
+    assert ("rx", SimulatedBlind().battery_frame()) in [(kind, payload) for kind, payload, _ in first]